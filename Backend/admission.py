@@ -0,0 +1,121 @@
+"""
+Admission control for CPU-bound request handling.
+
+At most ``max_in_flight`` tasks run at once; further requests wait in a
+bounded FIFO queue for up to ``timeout`` seconds. A request that finds the
+queue full, or that waits too long, is refused at once with ``Overloaded``
+(served as 503 with ``Retry-After``) instead of piling onto the threadpool
+or process pool, where latency would climb without bound. ``Retry-After``
+is estimated from the queue length and the recent task duration.
+
+The queue lives on the event loop, so it is per process; each uvicorn
+worker admits its own share of the traffic.
+"""
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict
+
+
+class Overloaded(Exception):
+    """Raised when a request is shed; ``retry_after`` is in whole seconds."""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionQueue:
+    def __init__(self, name: str, max_in_flight: int, max_queue: int, timeout: float):
+        self.name = name
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_queue = max(0, max_queue)
+        self.timeout = timeout
+        self.in_flight = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        # Exponentially weighted mean task duration, for Retry-After
+        self.task_seconds = 0.05
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def retry_after(self) -> int:
+        backlog = (self.queued + 1) * self.task_seconds / self.max_in_flight
+        return max(1, math.ceil(backlog))
+
+    def check(self) -> None:
+        """Refuse now, with ``Overloaded``, a request that would find the queue full.
+
+        For streaming responses, which can no longer answer 503 once their
+        first chunk is out; their work is still admitted piece by piece.
+        """
+        if self.in_flight >= self.max_in_flight and len(self._waiters) >= self.max_queue:
+            self.rejected += 1
+            raise Overloaded(f"{self.name} queue is full", self.retry_after())
+
+    async def _acquire(self) -> None:
+        if self.in_flight < self.max_in_flight and not self._waiters:
+            self.in_flight += 1
+            self.admitted += 1
+            return
+        if len(self._waiters) >= self.max_queue:
+            self.rejected += 1
+            raise Overloaded(f"{self.name} queue is full", self.retry_after())
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, self.timeout)
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            raise Overloaded(f"Waited {self.timeout:g}s for {self.name} capacity", self.retry_after())
+        except BaseException:
+            # Cancelled (client gone) just as the slot was handed over: pass it on
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            raise
+        finally:
+            if not waiter.done() or waiter.cancelled():
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+        self.admitted += 1
+
+    def _release(self) -> None:
+        # The slot goes straight to the oldest waiter, so in_flight only drops when nobody waits
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one of the ``max_in_flight`` slots for the duration of the block."""
+        await self._acquire()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.task_seconds += 0.1 * (time.perf_counter() - start - self.task_seconds)
+            self._release()
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "max_in_flight": self.max_in_flight,
+            "max_queue": self.max_queue,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "task_ms": round(self.task_seconds * 1e3, 2),
+        }
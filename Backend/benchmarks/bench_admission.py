@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: a burst of scoring requests with and without load shedding.
+
+Fires ``--burst`` concurrent /api/score-resume requests with distinct
+inputs (no result cache hits) at the app in process, once with an
+effectively unbounded queue and once with the configured admission
+limits, and reports how many were served or shed and the latency
+percentiles of each. Without shedding every request waits behind the
+whole burst; with it, the ones that would have waited longest get a fast
+503 instead.
+
+Run from the Backend directory:
+    python benchmarks/bench_admission.py [--burst 500] [--queue 64] [--timeout 1]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+
+import main  # noqa: E402
+from admission import AdmissionQueue  # noqa: E402
+
+# Long enough that scoring, not request handling, dominates each request
+RESUME = 40 * ("Experience\n- Developed Python and React services on AWS, cut latency 30%\n"
+                 "- Led a team of 5 engineers building Kubernetes tooling\nEducation\nBSc Computer Science\n")
+JOB = "Senior Python engineer with AWS, Kubernetes and team leadership experience"
+
+
+def _percentile(values: list, q: float) -> float:
+    return sorted(values)[int(len(values) * q)] * 1e3 if values else 0.0
+
+
+async def burst(client: httpx.AsyncClient, size: int, tag: str) -> dict:
+    latencies = {200: [], 503: []}
+
+    async def one(i: int) -> None:
+        start = time.perf_counter()
+        response = await client.post("/api/score-resume", json={"resume_text": f"{RESUME}{tag} {i}",
+                                                                "job_description": JOB})
+        latencies.setdefault(response.status_code, []).append(time.perf_counter() - start)
+
+    await asyncio.gather(*[one(i) for i in range(size)])
+    return latencies
+
+
+async def run(size: int, queue: int, timeout: float) -> None:
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        await burst(client, 20, "warm-up")
+        slots = main.CPU_ADMISSION.max_in_flight
+        setups = {
+            "unbounded": AdmissionQueue("cpu", slots, max_queue=size, timeout=3600),
+            f"queue {queue}, {timeout:g}s": AdmissionQueue("cpu", slots, max_queue=queue, timeout=timeout),
+        }
+        print(f"Burst of {size} requests, {slots} in flight\n")
+        print(f"{'admission':>18} {'served':>7} {'p50 ms':>8} {'p99 ms':>8} {'shed':>6} {'shed p99 ms':>12}")
+        for label, admission in setups.items():
+            main.CPU_ADMISSION = admission
+            result = await burst(client, size, label)
+            served, shed = result[200], result[503]
+            print(f"{label:>18} {len(served):>7} {_percentile(served, 0.5):>8.1f} {_percentile(served, 0.99):>8.1f} "
+                  f"{len(shed):>6} {_percentile(shed, 0.99):>12.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Burst latency with and without load shedding")
+    parser.add_argument("--burst", type=int, default=500)
+    parser.add_argument("--queue", type=int, default=64)
+    parser.add_argument("--timeout", type=float, default=1)
+    args = parser.parse_args()
+    asyncio.run(run(args.burst, args.queue, args.timeout))
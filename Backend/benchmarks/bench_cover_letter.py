@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cost of one rule-based cover letter as tones and variants are added.
+
+Renders letters for a mix of inputs with the shipped fragments and with a
+fragment file grown to 200 tones of 20 variants per slot, and reports the
+time per letter for fragment rendering alone, for the full generation
+(analysis included, documents cached as in the server), and the cost of a
+letter handed to run_cpu against a repeat letter served from RENDERED_LETTERS.
+
+Run from the Backend directory:
+    python benchmarks/bench_cover_letter.py
+"""
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+from cover_letters import LetterSet  # noqa: E402
+
+BODIES = [
+    main.CoverLetterBody(job_title="Backend Engineer", company="Acme", tone=tone,
+                         job_description=jd, resume_text=resume)
+    for tone in ("professional", "enthusiastic", "concise")
+    for jd in (None, "Lead and collaborate with a Python team", "Innovate and build cloud services on AWS")
+    for resume in (None, "Developed Python and React services on AWS with Docker")
+]
+
+
+def per_call_us(fn, budget: float = 0.5) -> float:
+    number = max(1, int(budget / max(timeit.timeit(fn, number=1), 1e-7)))
+    return min(timeit.repeat(fn, number=number, repeat=3)) / number * 1e6
+
+
+def grown_file(tones: int, variants: int) -> str:
+    with open(main.COVER_LETTERS.path, encoding="utf-8") as f:
+        data = json.load(f)
+    for t in range(tones):
+        data["tones"][f"tone{t}"] = {"extends": "professional", **{
+            slot: {f"tag{v}": f"Variant {v} of {slot} for {{{{company}}}}. " for v in range(variants)}
+            for slot in data["slots"]}}
+    fd, path = tempfile.mkstemp(suffix=".json")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    return path
+
+
+def run() -> None:
+    path = grown_file(200, 20)
+    try:
+        sets = {"shipped": main.COVER_LETTERS, "200 tones x 20 variants": LetterSet(path)}
+    finally:
+        os.unlink(path)
+
+    print(f"{'fragments':>24} {'tones':>6} {'render (µs/letter)':>19} {'generate (µs/letter)':>21}")
+    for label, letters in sets.items():
+        main.COVER_LETTERS = letters
+        context = {"job_title": "Engineer", "company": "Acme", "skills": "python, aws"}
+        tags = [frozenset(), frozenset({"job_description", "team"}), frozenset({"resume", "skills"})]
+        render = per_call_us(lambda: [letters.render(t, tag, context) for t in ("professional", "concise") for tag in tags])
+        generate = per_call_us(lambda: [main._cover_letter_text(b) for b in BODIES])
+        print(f"{label:>24} {len(letters.tones()):>6} {render / 6:>19.2f} {generate / len(BODIES):>21.2f}")
+
+    main.COVER_LETTERS = sets["shipped"]
+    loop = asyncio.new_event_loop()
+
+    def miss():
+        main.RENDERED_LETTERS.clear()
+        loop.run_until_complete(main._rules_cover_letter(BODIES[0]))
+
+    missed = per_call_us(miss)
+    hit = per_call_us(lambda: loop.run_until_complete(main._rules_cover_letter(BODIES[0])))
+    print(f"\nHanded to run_cpu (threadpool): {missed:.2f} µs/letter, "
+          f"repeat letter from RENDERED_LETTERS: {hit:.2f} µs/letter")
+    loop.close()
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-keyword substring scans vs the single-pass keyword automaton.
+
+Run from the Backend directory:
+    python benchmarks/bench_keyword_engine.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from document import DIGIT_RE  # noqa: E402
+from keyword_engine import KeywordAutomaton  # noqa: E402
+from main import ACTION_VERBS, NUMBER_WORDS, SECTION_KEYWORDS  # noqa: E402
+
+# The keyword list job descriptions were matched against before the skill taxonomy
+COMMON_KEYWORDS = [
+    'react', 'python', 'javascript', 'java', 'sql', 'aws', 'docker',
+    'kubernetes', 'agile', 'scrum', 'git', 'api', 'rest', 'html',
+    'css', 'node', 'typescript', 'angular', 'vue', 'django', 'flask',
+    'mongodb', 'postgresql', 'mysql', 'redis', 'jenkins', 'ci/cd',
+    'machine learning', 'ai', 'data science', 'analytics', 'testing',
+    'devops', 'cloud', 'microservices', 'leadership', 'management'
+]
+
+SCORING_AUTOMATON = KeywordAutomaton(
+    [kw for keywords in SECTION_KEYWORDS.values() for kw in keywords] + ACTION_VERBS + NUMBER_WORDS + COMMON_KEYWORDS
+)
+
+VOCAB = (
+    "the and of to in for with on team project system users customer product service "
+    "worked developed managed improved python react sql client design led delivered "
+    "experience education skills cloud testing api maintained kubernetes machine learning"
+).split()
+
+
+def make_text(words: int, seed: int) -> str:
+    rng = random.Random(seed)
+    return " ".join(rng.choice(VOCAB) for _ in range(words))
+
+
+def legacy_scan(text: str, job_desc: str) -> int:
+    found = sum(1 for kws in SECTION_KEYWORDS.values() if any(kw in text for kw in kws))
+    found += sum(1 for verb in ACTION_VERBS if verb in text)
+    found += any(num in text for num in NUMBER_WORDS) or any(ch.isdigit() for ch in text)
+    job_keywords = {kw for kw in COMMON_KEYWORDS if kw in job_desc}
+    found += sum(1 for kw in job_keywords if kw in text)
+    return found
+
+
+def automaton_scan(text: str, job_desc: str) -> int:
+    hits = SCORING_AUTOMATON.scan(text)
+    found = sum(1 for kws in SECTION_KEYWORDS.values() if hits.any(kws))
+    found += len(hits.found(ACTION_VERBS))
+    found += hits.any(NUMBER_WORDS) or DIGIT_RE.search(text) is not None
+    job_hits = SCORING_AUTOMATON.scan(job_desc)
+    found += sum(1 for kw in job_hits.found(COMMON_KEYWORDS) if hits.has(kw))
+    return found
+
+
+def timeit(fn, *args, repeat: int = 20) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    print(f"{'words':>7} {'legacy ms':>10} {'automaton ms':>13} {'speedup':>8}")
+    for words in (1000, 2500, 5000, 10000):
+        # Digit-free text is the legacy worst case: the isdigit() loop never exits early
+        resume = make_text(words, 1)
+        job_desc = make_text(words, 2)
+        assert legacy_scan(resume, job_desc) == automaton_scan(resume, job_desc)
+        legacy = timeit(legacy_scan, resume, job_desc)
+        automaton = timeit(automaton_scan, resume, job_desc)
+        print(f"{words:>7} {legacy * 1e3:>10.2f} {automaton * 1e3:>13.2f} {legacy / automaton:>7.2f}x")
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark: requests per second, single uvicorn process vs the serve.py launcher.
+
+Starts the server each way on a free port, then drives it from a separate
+process with keep-alive connections (a minimal asyncio HTTP/1.1 client, so
+the load generator costs little CPU next to the server) and reports
+requests per second and latency percentiles for the health check and for
+scoring a resume.
+
+    single   python -m uvicorn main:app (what start.py / main.py ran before)
+    serve.py python serve.py --workers N (preloaded, supervised workers)
+
+Both log requests unless ACCESS_LOG=0.
+
+Run from the Backend directory:
+    python benchmarks/bench_launcher.py [--workers N] [--seconds 5] [--connections 32]
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, BACKEND)
+
+from serve import ACCESS_LOG, default_workers  # noqa: E402
+
+SCORE_BODY = json.dumps({
+    "resume_text": "Experience\n- Developed Python and React services on AWS, cut latency 30%\n"
+                   "- Led a team of 5 engineers building Kubernetes tooling\nEducation\nBSc Computer Science",
+    "job_description": "Senior Python engineer with AWS, Kubernetes and team leadership experience",
+}).encode()
+
+REQUESTS = {
+    "GET /api/health": b"GET /api/health HTTP/1.1\r\nHost: bench\r\n\r\n",
+    "POST /api/score-resume": (b"POST /api/score-resume HTTP/1.1\r\nHost: bench\r\nContent-Type: application/json\r\n"
+                               b"Content-Length: " + str(len(SCORE_BODY)).encode() + b"\r\n\r\n" + SCORE_BODY),
+}
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def _connection(port: int, request: bytes, deadline: float, latencies: list) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            writer.write(request)
+            headers = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in headers.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":")[1])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+def _load(port: int, request: bytes, seconds: float, connections: int, results) -> None:
+    latencies: list = []
+    deadline = time.perf_counter() + seconds
+
+    async def main():
+        await asyncio.gather(*[_connection(port, request, deadline, latencies) for _ in range(connections)])
+
+    asyncio.run(main())
+    results.put(latencies)
+
+
+def measure(port: int, request: bytes, seconds: float, connections: int) -> dict:
+    # The load generator runs in its own process so it does not share the server's GIL
+    results = multiprocessing.Queue()
+    loader = multiprocessing.Process(target=_load, args=(port, request, seconds, connections, results))
+    loader.start()
+    latencies = sorted(results.get())
+    loader.join()
+    return {"rps": len(latencies) / seconds,
+            "p50": latencies[len(latencies) // 2] * 1e3,
+            "p99": latencies[int(len(latencies) * 0.99)] * 1e3}
+
+
+def start(command: list, port: int) -> subprocess.Popen:
+    server = subprocess.Popen(command, cwd=BACKEND, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.perf_counter() + 60
+    while True:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/api/health", timeout=1).read()
+            return server
+        except OSError:
+            if server.poll() is not None or time.perf_counter() > deadline:
+                raise RuntimeError(f"{command} did not come up")
+            time.sleep(0.05)
+
+
+def run(workers: int, seconds: float, connections: int) -> None:
+    setups = {
+        "single": [sys.executable, "-m", "uvicorn", "main:app"] + ([] if ACCESS_LOG else ["--no-access-log"]),
+        f"serve.py x{workers}": [sys.executable, "serve.py", "--workers", str(workers)],
+    }
+    print(f"{seconds:.0f} s per run, {connections} keep-alive connections, {os.cpu_count()} CPUs\n")
+    print(f"{'server':>14} {'endpoint':>24} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8}")
+    for label, command in setups.items():
+        port = free_port()
+        server = start(command + ["--port", str(port)], port)
+        try:
+            for endpoint, request in REQUESTS.items():
+                # Warm up (lazy dependencies, caches), then measure
+                measure(port, request, 1, connections)
+                result = measure(port, request, seconds, connections)
+                print(f"{label:>14} {endpoint:>24} {result['rps']:>8.0f} {result['p50']:>8.2f} {result['p99']:>8.2f}")
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Requests per second: single uvicorn process vs serve.py")
+    parser.add_argument("--workers", type=int, default=default_workers())
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--connections", type=int, default=32)
+    args = parser.parse_args()
+    run(args.workers, args.seconds, args.connections)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Load test: the model-backed mode against the local stub server.
+
+Starts llm_stub on a free port, then sends bursts of concurrent completions
+with many duplicate prompts through LLMClient (pooled keep-alive client,
+coalescing, concurrency limit, timeout) and through a naive client that
+opens a new connection per call and never coalesces.
+
+Run from the Backend directory:
+    python benchmarks/bench_llm_backend.py [requests] [distinct_prompts]
+"""
+import asyncio
+import os
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("STUB_LATENCY_MS", "100")
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+
+import llm_stub  # noqa: E402
+from llm import LLMClient, OpenAICompatibleProvider  # noqa: E402
+
+SYSTEM = "You improve resumes."
+
+
+def start_stub() -> str:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(llm_stub.app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}"
+
+
+async def naive(base_url: str, prompts: list) -> tuple:
+    async def one(prompt: str):
+        async with httpx.AsyncClient(base_url=base_url, timeout=30) as client:
+            r = await client.post("/v1/chat/completions", json={
+                "model": "stub", "messages": [{"role": "system", "content": SYSTEM},
+                                              {"role": "user", "content": prompt}]})
+            return r.json()["choices"][0]["message"]["content"]
+    start = time.perf_counter()
+    results = await asyncio.gather(*(one(p) for p in prompts))
+    return time.perf_counter() - start, sum(r is not None for r in results)
+
+
+async def pooled(base_url: str, prompts: list, max_concurrency: int, timeout: float) -> tuple:
+    client = LLMClient(OpenAICompatibleProvider(base_url + "/v1", "stub", max_connections=max_concurrency),
+                       max_concurrency=max_concurrency, timeout=timeout)
+    start = time.perf_counter()
+    results = await asyncio.gather(*(client.complete(SYSTEM, p) for p in prompts))
+    elapsed = time.perf_counter() - start
+    await client.aclose()
+    return elapsed, sum(r is not None for r in results), client.stats()
+
+
+def main() -> None:
+    n_requests = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    n_distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    prompts = [f"Tone: professional\n\n- Worked on billing service {i % n_distinct}" for i in range(n_requests)]
+    base_url = start_stub()
+    print(f"{n_requests} requests, {n_distinct} distinct prompts, stub latency {os.environ['STUB_LATENCY_MS']} ms")
+
+    elapsed, ok = asyncio.run(naive(base_url, prompts))
+    print(f"  new connection per call : {elapsed:6.2f}s  {n_requests / elapsed:8.1f} req/s  {ok} answered")
+
+    for max_concurrency in (8, 32):
+        elapsed, ok, stats = asyncio.run(pooled(base_url, prompts, max_concurrency, timeout=10.0))
+        print(f"  pooled, limit {max_concurrency:<3}       : {elapsed:6.2f}s  {n_requests / elapsed:8.1f} req/s  "
+              f"{ok} answered, {stats['calls']} upstream calls, {stats['coalesced']} coalesced")
+
+    # A budget shorter than the stub latency: every call falls back
+    elapsed, ok, stats = asyncio.run(pooled(base_url, prompts[:n_distinct], 8, timeout=0.02))
+    print(f"  20 ms budget            : {elapsed:6.2f}s  {stats['fallbacks']} of {n_distinct} fell back to rules")
+    print(f"  stub served: {httpx.get(base_url + '/stats').json()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark: what recording request metrics costs per request, and a /metrics scrape.
+
+Calls a no-op ASGI endpoint directly, bare and wrapped in
+``MetricsMiddleware``, with scopes as the router leaves them (the matched
+route set), so the difference is the recording cost alone: the in-flight
+gauge, the receive/send wrappers, the request counter and three histogram
+updates. Then times rendering /metrics once every route has samples.
+
+Run from the Backend directory:
+    python benchmarks/bench_metrics.py [--requests 100000]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+from metrics import METRICS, MetricsMiddleware  # noqa: E402
+
+BODY = b'{"resume_text": "Experience\\n- Python"}'
+
+
+async def _endpoint(scope, receive, send):
+    await receive()
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-length", b"2")]})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+def _scope(path: str, method: str = "POST") -> dict:
+    # What the router leaves in the scope once it has matched the path
+    route = next((r for r in main.app.routes if getattr(r, "path", None) == path), None)
+    return {"type": "http", "method": method, "path": path, "root_path": "", "query_string": b"",
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(BODY)).encode())],
+            "app": main.app, **({"route": route} if route is not None else {})}
+
+
+async def _drive(app, scopes: list, requests: int) -> float:
+    async def receive():
+        return {"type": "http.request", "body": BODY, "more_body": False}
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    for i in range(requests):
+        await app(scopes[i % len(scopes)], receive, send)
+    return (time.perf_counter() - start) / requests
+
+
+def run(requests: int) -> None:
+    paths = ["/api/score-resume", "/api/improve-resume", "/api/generate-resume", "/api/score-resume/batch", "/nope"]
+    scopes = [_scope(path) for path in paths]
+    bare = asyncio.run(_drive(_endpoint, scopes, requests))
+    measured = asyncio.run(_drive(MetricsMiddleware(_endpoint), scopes, requests))
+    print(f"{requests} requests over {len(paths)} routes")
+    print(f"  without metrics  {bare * 1e6:6.2f} µs/request")
+    print(f"  with metrics     {measured * 1e6:6.2f} µs/request  (+{(measured - bare) * 1e6:.2f} µs)")
+
+    start = time.perf_counter()
+    text = METRICS.render(main._service_metrics())
+    print(f"  /metrics render  {(time.perf_counter() - start) * 1e3:6.2f} ms for {text.count(chr(10))} lines")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-request cost of recording metrics")
+    parser.add_argument("--requests", type=int, default=100_000)
+    run(parser.parse_args().requests)
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark: scoring throughput through workers.run_cpu as CPU_WORKERS grows.
+
+Run from the Backend directory:
+    python benchmarks/bench_process_pool.py [max_workers] [requests]
+"""
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import workers  # noqa: E402
+from main import ResumeScoreBody, _score_resume_result, _warm_up_worker  # noqa: E402
+
+VOCAB = (
+    "the and of to in for with on team project system users customer product service "
+    "worked developed managed improved python react sql client design led delivered "
+    "experience education skills cloud testing api maintained kubernetes 2019 35%"
+).split()
+
+
+def make_body(words: int, seed: int) -> ResumeScoreBody:
+    rng = random.Random(seed)
+    resume = "\n".join(
+        "- " + " ".join(rng.choice(VOCAB) for _ in range(12)) for _ in range(words // 12)
+    )
+    job = " ".join(rng.choice(VOCAB) for _ in range(400))
+    return ResumeScoreBody(resume_text=resume, job_description=job)
+
+
+async def run_batch(bodies) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*(workers.run_cpu(_score_resume_result, body) for body in bodies))
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1)
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 400
+    # Distinct job descriptions so the per-process profile cache does not hide the work
+    bodies = [make_body(3000, seed) for seed in range(requests)]
+
+    print(f"{'backend':>12} {'req/s':>9} {'scaling':>8}")
+    baseline = None
+    for count in [0] + list(range(1, max_workers + 1)):
+        workers.start_pool(count, _warm_up_worker)
+        elapsed = asyncio.run(run_batch(bodies))
+        workers.shutdown_pool()
+        rate = requests / elapsed
+        label = "threadpool" if count == 0 else f"{count} proc"
+        if count == 1:
+            baseline = rate
+        scaling = f"{rate / baseline:.2f}x" if baseline else "-"
+        print(f"{label:>12} {rate:>9.1f} {scaling:>8}")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cost of encoding score responses and decoding batch requests.
+
+Responses (one score result, and batches of 10 to 1000 results):
+  - FastAPI's default path: jsonable_encoder + stdlib json (JSONResponse)
+  - ORJSONResponse, as returned by the batch endpoint (no jsonable_encoder)
+  - MessagePack, for clients sending ``Accept: application/msgpack``
+Requests (batch bodies of 10 to 1000 resumes):
+  - full validation vs the trusted-caller path (model_construct)
+
+Run from the Backend directory:
+    python benchmarks/bench_serialization.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import msgpack  # noqa: E402
+import orjson  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse, ORJSONResponse  # noqa: E402
+
+import main  # noqa: E402
+from serialization import MsgPackResponse, build_model  # noqa: E402
+
+RESUME = """John Doe | john@example.com | +1 555 0100 | linkedin.com/in/jdoe
+Experience
+- Developed and managed Python services on AWS, increased throughput 40%
+- Led a team of 5 engineers; reduced costs by $200k
+Education
+BSc Computer Science, State University
+Skills
+Python, SQL, Docker, Kubernetes, React"""
+
+
+def per_call_us(fn, budget: float = 0.5) -> float:
+    number = max(1, int(budget / max(timeit.timeit(fn, number=1), 1e-7)))
+    return min(timeit.repeat(fn, number=number, repeat=3)) / number * 1e6
+
+
+def run() -> None:
+    result = main._score_resume_result(main.ResumeScoreBody(resume_text=RESUME, job_description="Python AWS engineer"))
+    print("Response encoding (µs per response, encoded size)")
+    print(f"{'results':>8} {'jsonable+json':>14} {'orjson':>10} {'msgpack':>10} {'json bytes':>11} {'msgpack bytes':>14}")
+    for n in (1, 10, 100, 1000):
+        content = result if n == 1 else {"total": n, "results": [dict(result, resume_index=i, job_index=0) for i in range(n)]}
+        default = per_call_us(lambda: JSONResponse(jsonable_encoder(content)))
+        fast = per_call_us(lambda: ORJSONResponse(content))
+        packed = per_call_us(lambda: MsgPackResponse(content))
+        print(f"{n:>8} {default:>14.1f} {fast:>10.1f} {packed:>10.1f} "
+              f"{len(orjson.dumps(content)):>11} {len(msgpack.packb(content)):>14}")
+
+    print("\nBatch request decoding (µs per request)")
+    print(f"{'resumes':>8} {'validate':>10} {'trusted':>10}")
+    for n in (10, 100, 1000):
+        data = orjson.loads(orjson.dumps({"resumes": [RESUME] * n, "job_descriptions": ["Python AWS"], "mode": "keywords"}))
+        validated = per_call_us(lambda: build_model(main.ResumeScoreBatchBody, data))
+        trusted = per_call_us(lambda: build_model(main.ResumeScoreBatchBody, data, trusted=True))
+        print(f"{n:>8} {validated:>10.1f} {trusted:>10.1f}")
+
+
+if __name__ == "__main__":
+    run()
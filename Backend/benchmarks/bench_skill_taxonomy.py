@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark: loading and scanning the skill taxonomy.
+
+Reports the cost of compiling data/skills.txt against opening the compiled
+index (what every worker does at import), the scan time per resume for the
+taxonomy against the old substring test over a keyword list, and how much
+of the mapped index four forked workers hold privately after scanning.
+
+Run from the Backend directory:
+    python benchmarks/bench_skill_taxonomy.py
+"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from skill_taxonomy import DEFAULT_TAXONOMY_PATH, SkillTaxonomy, build_index  # noqa: E402
+
+LEGACY_KEYWORDS = [
+    'react', 'python', 'javascript', 'java', 'sql', 'aws', 'docker',
+    'kubernetes', 'agile', 'scrum', 'git', 'api', 'rest', 'html',
+    'css', 'node', 'typescript', 'angular', 'vue', 'django', 'flask',
+    'mongodb', 'postgresql', 'mysql', 'redis', 'jenkins', 'ci/cd',
+    'machine learning', 'ai', 'data science', 'analytics', 'testing',
+    'devops', 'cloud', 'microservices', 'leadership', 'management'
+]
+
+VOCAB = (
+    "the and of to in for with on team project system users customer good maintained "
+    "worked developed managed improved Python React SQL client design led delivered "
+    "k8s Postgres JS Go node.js C++ C# CI/CD GitHub Actions machine learning REST APIs "
+    "experience education skills cloud testing api stakeholder management Excel Tableau"
+).split()
+
+
+def make_text(words: int, seed: int) -> str:
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(words // 12):
+        lines.append("- " + " ".join(rng.choice(VOCAB) for _ in range(12)))
+    return "\n".join(lines)
+
+
+def per_call_ms(fn, budget: float = 0.5) -> float:
+    number = max(1, int(budget / max(timeit.timeit(fn, number=1), 1e-7)))
+    return min(timeit.repeat(fn, number=number, repeat=3)) / number * 1e3
+
+
+def private_kib(path: str) -> int:
+    """Private (unshared) KiB of this process's mappings of ``path``."""
+    total, inside = 0, False
+    with open("/proc/self/smaps") as f:
+        for line in f:
+            if "-" in line.split(" ", 1)[0]:
+                inside = line.rstrip().endswith(path)
+            elif inside and line.startswith(("Private_Clean:", "Private_Dirty:")):
+                total += int(line.split()[1])
+    return total
+
+
+def run() -> None:
+    with open(DEFAULT_TAXONOMY_PATH, encoding="utf-8") as f:
+        source = f.read()
+    taxonomy = SkillTaxonomy()
+    stats = taxonomy.stats()
+    print(f"{stats['skills']} skills, {stats['trie_edges']} trie edges, "
+          f"{stats['index_bytes'] / 1024:.0f} KiB index ({stats['index_path']})\n")
+    print(f"Compile skills.txt: {per_call_ms(lambda: build_index(source)):.2f} ms, "
+          f"open the index: {per_call_ms(lambda: SkillTaxonomy()) * 1e3:.1f} µs\n")
+
+    print(f"{'words':>7} {'substring ms':>13} {'taxonomy ms':>12} {'cold ms':>8} {'skills':>7}")
+    for words in (500, 2000, 10000):
+        text = make_text(words, words)
+        lower = text.lower()
+        legacy = per_call_ms(lambda: [kw for kw in LEGACY_KEYWORDS if kw in lower])
+        warm = per_call_ms(lambda: taxonomy.scan(text))
+        # A fresh view has no memo of words seen, like a worker's first request
+        cold = per_call_ms(lambda: SkillTaxonomy().scan(text))
+        print(f"{words:>7} {legacy:>13.3f} {warm:>12.3f} {cold:>8.3f} {len(taxonomy.scan(text)):>7}")
+
+    print("\nSubstring matches the taxonomy rejects: "
+          + ", ".join(kw for kw in LEGACY_KEYWORDS
+                      if kw in "good maintained restart javascript" and not taxonomy.scan(kw)))
+
+    pids = []
+    for _ in range(4):
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read)
+            child = SkillTaxonomy()
+            child.scan(make_text(10000, os.getpid()))
+            os.write(write, str(private_kib(child.index_path)).encode())
+            os._exit(0)
+        os.close(write)
+        pids.append((pid, read))
+    private = []
+    for pid, read in pids:
+        private.append(int(os.read(read, 64) or 0))
+        os.close(read)
+        os.waitpid(pid, 0)
+    print(f"Private KiB of the index per forked worker after a scan: {private} "
+          f"(of {stats['index_bytes'] / 1024:.0f} KiB mapped)")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Startup budget check: import time per module and time to the first health check.
+
+Imports the app in a fresh interpreter with ``-X importtime`` (after the
+framework, whose import cost is the same for any app) and reports what
+``main`` and each module it imports cost. Then starts uvicorn and measures
+how long after process start /api/health first answers, and the first and
+second scoring request (the first builds the lazily loaded dependencies).
+
+Exits with status 1 when importing the app takes longer than the budget
+(``--budget-ms``, default ``STARTUP_BUDGET_MS`` or 150) or when it pulls in
+a module that should only load on first use.
+
+Run from the Backend directory:
+    python benchmarks/bench_startup.py [--budget-ms 150]
+"""
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FRAMEWORK = "import fastapi, pydantic, starlette, uvicorn"
+
+# Heavy modules the app must not import before they are needed
+DEFERRED = ("numpy", "httpx")
+
+
+def import_times() -> tuple:
+    """(main's (self, cumulative) µs, [(module, self, cumulative)] of what main imports, deferred modules loaded)."""
+    code = f"{FRAMEWORK}; import sys; import main; print(*[m for m in {DEFERRED!r} if m in sys.modules])"
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=BACKEND,
+                          capture_output=True, text=True, check=True)
+    entries = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative, name = line[len("import time:"):].split("|")
+        entries.append((len(name) - len(name.lstrip()), name.strip(), int(self_us), int(cumulative)))
+    # importtime lists a module after everything it imported, so main's imports precede it
+    end = max(i for i, entry in enumerate(entries) if entry[1] == "main")
+    depth = entries[end][0]
+    start = end
+    while start > 0 and entries[start - 1][0] > depth:
+        start -= 1
+    children = [(name, self_us, cumulative) for level, name, self_us, cumulative in entries[start:end]
+                if level == depth + 2]
+    return entries[end][2:], children, proc.stdout.split()
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def request(url: str, body: dict = None) -> float:
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    start = time.perf_counter()
+    with urllib.request.urlopen(req, timeout=30) as response:
+        response.read()
+    return time.perf_counter() - start
+
+
+def serve_timings() -> dict:
+    port = free_port()
+    base = f"http://127.0.0.1:{port}"
+    start = time.perf_counter()
+    server = subprocess.Popen([sys.executable, "-m", "uvicorn", "main:app", "--port", str(port),
+                               "--log-level", "warning"], cwd=BACKEND)
+    try:
+        while True:
+            try:
+                request(base + "/api/health")
+                break
+            except OSError:
+                if server.poll() is not None or time.perf_counter() - start > 30:
+                    raise RuntimeError("server did not come up")
+                time.sleep(0.005)
+        health = time.perf_counter() - start
+        body = {"resume_text": "Experience\n- Developed Python services on AWS, cut latency 30%",
+                "job_description": "Python engineer with AWS and Kubernetes", "mode": "bm25"}
+        first = request(base + "/api/score-resume", body)
+        second = request(base + "/api/score-resume", dict(body, resume_text=body["resume_text"] + "."))
+    finally:
+        server.terminate()
+        server.wait()
+    return {"health": health, "first": first, "second": second}
+
+
+def run(budget_ms: float) -> int:
+    (main_self, main_total), children, deferred = import_times()
+    print(f"{'module':>24} {'self ms':>8} {'total ms':>9}")
+    for name, self_us, cumulative in sorted(children, key=lambda c: -c[2])[:15]:
+        print(f"{name:>24} {self_us / 1e3:>8.2f} {cumulative / 1e3:>9.2f}")
+    print(f"{'main':>24} {main_self / 1e3:>8.2f} {main_total / 1e3:>9.2f}\n")
+
+    timings = serve_timings()
+    print(f"/api/health answered {timings['health'] * 1e3:.0f} ms after process start (framework import included)")
+    print(f"First /api/score-resume: {timings['first'] * 1e3:.1f} ms (builds lazy dependencies), "
+          f"second: {timings['second'] * 1e3:.1f} ms\n")
+
+    ok = True
+    if main_total / 1e3 > budget_ms:
+        print(f"❌ Importing the app took {main_total / 1e3:.1f} ms, over the {budget_ms:.0f} ms budget")
+        ok = False
+    if deferred:
+        print(f"❌ Imported at startup instead of on first use: {', '.join(deferred)}")
+        ok = False
+    if ok:
+        print(f"✅ App import {main_total / 1e3:.1f} ms, within the {budget_ms:.0f} ms budget")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("STARTUP_BUDGET_MS", "150")))
+    sys.exit(run(parser.parse_args().budget_ms))
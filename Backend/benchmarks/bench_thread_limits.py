@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cheap requests during a flood of heavy ones, shared vs per-endpoint thread limits.
+
+Keeps ``--heavy`` requests creating scoring sessions for long resumes in
+flight (a sync handler, so it runs in worker threads) and meanwhile sends
+/api/generate-resume requests one at a time, reporting their latency and
+the heavy throughput:
+
+    shared        every endpoint borrows from one 40-token limiter (AnyIO's default)
+    per-endpoint  each endpoint has its own adaptive limiter (thread_limits.py)
+
+With the shared limiter a cheap request queues behind every heavy one
+holding or waiting for a token; with its own it only competes for the CPU.
+The final limits show where AIMD settled.
+
+Run from the Backend directory:
+    python benchmarks/bench_thread_limits.py [--heavy 100] [--seconds 5]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import anyio  # noqa: E402
+import httpx  # noqa: E402
+
+import main  # noqa: E402
+from thread_limits import LIMITERS  # noqa: E402
+
+RESUME = 60 * ("Experience\n- Developed Python and React services on AWS, cut latency 30%\n"
+               "- Led a team of 5 engineers building Kubernetes tooling\n")
+
+RESUME_BODY = {"full_name": "Jane Doe", "email": "jane@example.com", "target_title": "Engineer",
+               "summary": "Backend engineer", "skills": "Python, AWS", "experiences": []}
+
+
+def _percentile(values: list, q: float) -> float:
+    return sorted(values)[int(len(values) * q)] * 1e3 if values else 0.0
+
+
+async def flood(client: httpx.AsyncClient, heavy: int, seconds: float) -> tuple:
+    deadline = time.perf_counter() + seconds
+    completed = 0
+    cheap = []
+
+    async def heavy_loop(i: int) -> None:
+        nonlocal completed
+        n = 0
+        while time.perf_counter() < deadline:
+            n += 1
+            await client.post("/api/score-resume/session", json={"resume_text": f"{RESUME}{i} {n}"})
+            completed += 1
+
+    async def cheap_loop() -> None:
+        n = 0
+        while time.perf_counter() < deadline:
+            n += 1
+            start = time.perf_counter()
+            # A new name each time, so the result cache does not answer it
+            await client.post("/api/generate-resume", json=dict(RESUME_BODY, full_name=f"Jane Doe {n}"))
+            cheap.append(time.perf_counter() - start)
+
+    await asyncio.gather(cheap_loop(), *[heavy_loop(i) for i in range(heavy)])
+    return cheap, completed / seconds
+
+
+def _share_one_limiter() -> None:
+    shared = anyio.CapacityLimiter(40)
+    for threads in LIMITERS.values():
+        threads._limiter = shared
+        threads.limit = threads.min_limit = threads.max_limit = 40
+
+
+async def run(heavy: int, seconds: float) -> None:
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        print(f"{heavy} heavy requests in flight, {seconds:.0f} s per run, {os.cpu_count()} CPUs\n")
+        print(f"{'limits':>13} {'cheap p50 ms':>13} {'cheap p99 ms':>13} {'heavy req/s':>12}")
+        for label in ("shared", "per-endpoint"):
+            # Fresh state for each run; handlers keep their limiter objects, so reset in place
+            for name, threads in LIMITERS.items():
+                threads.__init__(name)
+            if label == "shared":
+                _share_one_limiter()
+            cheap, heavy_rps = await flood(client, heavy, seconds)
+            print(f"{label:>13} {_percentile(cheap, 0.5):>13.1f} {_percentile(cheap, 0.99):>13.1f} {heavy_rps:>12.0f}")
+        print("\nAdapted limits:", {name: threads.limit for name, threads in LIMITERS.items() if threads.calls})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cheap request latency under a heavy flood, shared vs per-endpoint limits")
+    parser.add_argument("--heavy", type=int, default=100)
+    parser.add_argument("--seconds", type=float, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.heavy, args.seconds))
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark: request body validation, FastAPI's default path vs the fast path.
+
+Valid bodies (a small generate-resume request, batches of 10 to 1000 resumes):
+  - default: json.loads into dicts, then Model.model_validate
+  - json:    cached TypeAdapter.validate_json on the raw bytes
+  - fast:    orjson.loads, then the cached TypeAdapter (serialization.parse_body)
+Oversized bodies (a resume with 100k achievements, about 2.5 MB):
+  - default: parsed and validated in full before anything is refused
+  - capped:  refused by the list cap during validation
+  - 413:     refused from Content-Length by read_body, nothing parsed
+
+Run from the Backend directory:
+    python benchmarks/bench_validation.py
+"""
+import asyncio
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import orjson  # noqa: E402
+from fastapi import HTTPException  # noqa: E402
+from pydantic import BaseModel, ValidationError  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+
+import main  # noqa: E402
+from serialization import adapter, read_body  # noqa: E402
+
+RESUME = """John Doe | john@example.com | +1 555 0100 | linkedin.com/in/jdoe
+Experience
+- Developed and managed Python services on AWS, increased throughput 40%
+- Led a team of 5 engineers; reduced costs by $200k
+Skills
+Python, SQL, Docker, Kubernetes, React"""
+
+GENERATE = {
+    "full_name": "Jane Doe", "target_title": "Backend Engineer", "email": "jane@example.com",
+    "summary": "Engineer with 8 years of experience building APIs.",
+    "experiences": [{"role": "Engineer", "company": f"Company {i}", "start": "2018", "end": "Present",
+                     "achievements": ["Built a billing pipeline processing 2M events per day"] * 4} for i in range(3)],
+    "education": [{"school": "State University", "start": "2010", "end": "2014", "degree": "BSc"}],
+    "skills": "Python, SQL, Docker",
+}
+
+
+# Same fields as GenerateResumeRequest without the caps, to time the uncapped rejection
+class UncappedExperience(BaseModel):
+    role: str
+    company: str
+    start: str
+    achievements: list = []
+
+
+class UncappedRequest(BaseModel):
+    full_name: str
+    target_title: str
+    experiences: list[UncappedExperience] = []
+
+
+def per_call_us(fn, budget: float = 0.5) -> float:
+    number = max(1, int(budget / max(timeit.timeit(fn, number=1), 1e-7)))
+    return min(timeit.repeat(fn, number=number, repeat=3)) / number * 1e6
+
+
+def default_path(model, raw: bytes):
+    return model.model_validate(json.loads(raw))
+
+
+def json_path(model, raw: bytes):
+    return adapter(model).validate_json(raw)
+
+
+def fast_path(model, raw: bytes):
+    return adapter(model).validate_python(orjson.loads(raw))
+
+
+def rejected(fn):
+    try:
+        fn()
+    except (ValidationError, HTTPException):
+        return
+    raise AssertionError("body was accepted")
+
+
+def request_for(raw: bytes) -> Request:
+    async def receive():
+        return {"type": "http.request", "body": raw, "more_body": False}
+    headers = [(b"content-type", b"application/json"), (b"content-length", str(len(raw)).encode())]
+    return Request({"type": "http", "method": "POST", "headers": headers}, receive)
+
+
+def run() -> None:
+    print("Valid bodies (µs per request)")
+    print(f"{'body':>22} {'bytes':>9} {'default':>10} {'json':>10} {'fast':>10} {'speedup':>8}")
+    cases = [("generate-resume", main.GenerateResumeRequest, orjson.dumps(GENERATE))]
+    for n in (10, 100, 1000):
+        body = {"resumes": [RESUME] * n, "job_descriptions": ["Python AWS"], "mode": "keywords"}
+        cases.append((f"batch x{n}", main.ResumeScoreBatchBody, orjson.dumps(body)))
+    for label, model, raw in cases:
+        default = per_call_us(lambda: default_path(model, raw))
+        validate_json = per_call_us(lambda: json_path(model, raw))
+        fast = per_call_us(lambda: fast_path(model, raw))
+        print(f"{label:>22} {len(raw):>9} {default:>10.1f} {validate_json:>10.1f} {fast:>10.1f} {default / fast:>7.1f}x")
+
+    huge = dict(GENERATE, experiences=[dict(GENERATE["experiences"][0], achievements=["Did things"] * 100_000)])
+    raw = orjson.dumps(huge)
+    print(f"\nOversized body, {len(raw) / 1e6:.1f} MB (µs until refused)")
+    uncapped = per_call_us(lambda: default_path(UncappedRequest, raw) and None)
+    capped = per_call_us(lambda: rejected(lambda: fast_path(main.GenerateResumeRequest, raw)))
+    refused = per_call_us(lambda: rejected(lambda: asyncio.run(read_body(request_for(raw)))))
+    print(f"{'uncapped (parsed in full)':>28} {uncapped:>10.1f}")
+    print(f"{'field caps':>28} {capped:>10.1f}")
+    print(f"{'byte cap (413)':>28} {refused:>10.1f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,93 @@
+"""
+Small in-process caches shared by the API endpoints.
+
+Every cache registers itself in ``CACHES`` under its name so its hit/miss
+counters can be reported from one place.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+CACHES: Dict[str, "LRUCache"] = {}
+
+_MISSING = object()
+
+
+def content_hash(*parts: Optional[str]) -> str:
+    """Stable digest of one or more text fields (None and "" hash differently)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        if part is None:
+            digest.update(b"\x00")
+        else:
+            digest.update(b"\x01" + part.encode("utf-8") + b"\x1f")
+    return digest.hexdigest()
+
+
+class LRUCache:
+    """Thread-safe bounded LRU cache with an optional time-to-live per entry."""
+
+    def __init__(self, name: str, maxsize: int = 256, ttl: Optional[float] = None):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl or None
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        CACHES[name] = self
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING:
+                value, expires = entry
+                if expires is None or expires > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        expires = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the cached value, building it outside the lock on a miss."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def items(self) -> list:
+        """Live ``(key, value)`` pairs, least recently used first."""
+        now = time.monotonic()
+        with self._lock:
+            return [(key, value) for key, (value, expires) in self._data.items()
+                    if expires is None or expires > now]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
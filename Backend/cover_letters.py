@@ -0,0 +1,85 @@
+"""
+Fragment-based cover letters for /api/cover-letter.
+
+``data/cover_letters.json`` (or ``COVER_LETTERS_PATH``) lists the letter
+slots in order and, per tone, the variants of each slot as template
+fragments (the Mustache subset of ``resume_templates``). A tone may
+``extends`` another and only override some variants; unknown tones use
+``default_tone``.
+
+The caller analyzes the job description and resume once and describes the
+result as a set of tags (``job_description``, ``skills``, an angle such as
+``team``). Each slot renders its first variant, in file order, whose name
+is one of the tags, else its ``default``. Fragments are compiled once at
+import and the fragment choice is memoized per (tone, tags), so adding
+tones or variants does not add work per letter.
+"""
+import hashlib
+import json
+import os
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from resume_templates import TemplateError, compile_template
+
+DEFAULT_LETTERS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "cover_letters.json")
+
+
+class LetterSet:
+    """Compiled fragments of every tone, plus the skill categories and angles the analysis looks for."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.getenv("COVER_LETTERS_PATH", DEFAULT_LETTERS_PATH)
+        with open(self.path, "rb") as f:
+            raw = f.read()
+        data = json.loads(raw)
+        # Taxonomy categories whose skills the letter may mention
+        self.skill_categories: FrozenSet[str] = frozenset(data["skill_categories"])
+        self.skills_mentioned: int = data.get("skills_mentioned", 3)
+        self.angles: Dict[str, List[str]] = data.get("angles", {})
+        self.slots: List[str] = data["slots"]
+        tones = data["tones"]
+        self.default_tone: str = data.get("default_tone", next(iter(tones)))
+
+        def variants(name: str, slot: str, seen: tuple = ()) -> Dict[str, str]:
+            tone = tones[name]
+            merged = dict(variants(tone["extends"], slot, seen + (name,))) if tone.get("extends") and name not in seen else {}
+            merged.update(tone.get(slot, {}))
+            return merged
+
+        self._fragments: Dict[str, Dict[str, List[Tuple[str, Callable[[dict], str]]]]] = {}
+        for name in tones:
+            compiled = {}
+            for slot in self.slots:
+                options = variants(name, slot)
+                if "default" not in options:
+                    raise TemplateError(f"Tone {name!r} has no default for slot {slot!r}")
+                compiled[slot] = [(tag, compile_template(source)) for tag, source in options.items()]
+            self._fragments[name] = compiled
+        # Identifies these fragments, e.g. for caches of rendered letters
+        self.fingerprint = hashlib.blake2b(raw, digest_size=8).hexdigest()
+        self._plan = lru_cache(maxsize=1024)(self._select)
+
+    @property
+    def phrases(self) -> List[str]:
+        """Every word an angle is chosen by."""
+        return [word for words in self.angles.values() for word in words]
+
+    def tones(self) -> List[str]:
+        return list(self._fragments)
+
+    def angle(self, phrases: Iterable[str]) -> Optional[str]:
+        """First angle (in file order) with a word among ``phrases``."""
+        found = set(phrases)
+        return next((name for name, words in self.angles.items() if found.intersection(words)), None)
+
+    def _select(self, tone: str, tags: FrozenSet[str]) -> Tuple[Callable[[dict], str], ...]:
+        fragments = self._fragments[tone]
+        return tuple(next((render for tag, render in fragments[slot] if tag in tags),
+                          dict(fragments[slot])["default"])
+                     for slot in self.slots)
+
+    def render(self, tone: Optional[str], tags: FrozenSet[str], context: dict) -> str:
+        if tone not in self._fragments:
+            tone = self.default_tone
+        return "".join(render(context) for render in self._plan(tone, tags))
@@ -0,0 +1,62 @@
+"""
+Shared analysis of a resume (or any pasted text) used by every endpoint.
+
+``Document`` is computed once per distinct text: lines, normalized tokens,
+per-line bullet and digit flags, section headings, word count, the
+keyword hits of the shared automaton and the skills of the taxonomy. Endpoints read these fields instead
+of lowercasing, splitting and rescanning the text themselves.
+"""
+import re
+from typing import Dict, Optional, Tuple
+
+from keyword_engine import KeywordAutomaton, KeywordHits
+from skill_taxonomy import SkillTaxonomy
+
+DIGIT_RE = re.compile(r"\d")
+
+BULLET_PREFIXES = ('-', '•', '*', '→')
+
+SECTION_HEADINGS = frozenset([
+    'summary', 'profile', 'objective', 'experience', 'work experience', 'professional experience',
+    'work history', 'employment', 'education', 'skills', 'technical skills', 'projects',
+    'certifications', 'awards', 'languages', 'publications', 'volunteering', 'interests',
+])
+
+
+class Document:
+    __slots__ = ("text", "lower", "lines", "tokens", "bullets", "digits", "sections", "word_count", "hits",
+                 "skills")
+
+    def __init__(self, automaton: KeywordAutomaton, text: str, taxonomy: Optional[SkillTaxonomy] = None):
+        self.text = text
+        self.lower = text.lower()
+        self.lines: Tuple[str, ...] = tuple(text.splitlines())
+        self.tokens: Tuple[str, ...] = tuple(self.lower.split())
+        self.word_count = len(self.tokens)
+        self.hits: KeywordHits = automaton.scan(self.lower)
+        # Canonical skill -> occurrences, in order of first appearance
+        self.skills: Dict[str, int] = taxonomy.scan(text) if taxonomy is not None else {}
+
+        bullets, digits, sections = [], [], []
+        for index, line in enumerate(self.lines):
+            stripped = line.strip()
+            # Bullet marker character of the line, '' when it is not a bullet
+            bullets.append(stripped[0] if stripped.startswith(BULLET_PREFIXES) else '')
+            digits.append(DIGIT_RE.search(line) is not None)
+            if stripped and len(stripped) <= 40:
+                heading = stripped.lower().rstrip(':').strip()
+                if heading in SECTION_HEADINGS:
+                    sections.append((heading, index))
+        self.bullets: Tuple[str, ...] = tuple(bullets)
+        self.digits: Tuple[bool, ...] = tuple(digits)
+        self.sections: Tuple[Tuple[str, int], ...] = tuple(sections)
+
+    @property
+    def has_digits(self) -> bool:
+        return any(self.digits)
+
+    def bullet_count(self, markers: Optional[Tuple[str, ...]] = None) -> int:
+        """Number of bullet lines, optionally only those using one of ``markers``."""
+        if markers is None:
+            return sum(1 for bullet in self.bullets if bullet)
+        return sum(1 for bullet in self.bullets if bullet and bullet in markers)
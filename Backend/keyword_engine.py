@@ -0,0 +1,129 @@
+"""
+Single-pass multi-pattern keyword matching for the scoring endpoints.
+
+The dictionary is compiled once into a trie-shaped regular expression (an
+automaton over the term characters). A text is scanned by splitting it on
+spaces once and counting the distinct tokens; each distinct token is run
+through the automaton a single time and the result is memoized, so repeated
+words - within a document and across requests - cost one dict lookup.
+
+Matching keeps plain substring semantics: a term without spaces can only occur
+inside one space-free token, and multi-word phrases are only searched for when
+their last word was seen in some token.
+"""
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def trie_pattern(terms: Iterable[str]) -> str:
+    """Regex alternation of ``terms`` nested as a trie; optional groups are greedy, so longer terms win."""
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            body = "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+
+def _count_overlapping(text: str, term: str) -> int:
+    count = 0
+    pos = text.find(term)
+    while pos != -1:
+        count += 1
+        pos = text.find(term, pos + 1)
+    return count
+
+
+class KeywordHits:
+    """Occurrence counts of every dictionary term found in one scanned text."""
+
+    __slots__ = ("text", "counts")
+
+    def __init__(self, text: Optional[str], counts: Dict[str, int]):
+        self.text = text
+        self.counts = counts
+
+    def has(self, term: str) -> bool:
+        return term in self.counts
+
+    def count(self, term: str) -> int:
+        return self.counts.get(term, 0)
+
+    def any(self, terms: Iterable[str]) -> bool:
+        return any(term in self.counts for term in terms)
+
+    def found(self, terms: Iterable[str]) -> List[str]:
+        return [term for term in terms if term in self.counts]
+
+    def positions(self, term: str) -> List[int]:
+        """Start offsets of ``term``; only computed for terms that were found."""
+        if term not in self.counts or self.text is None:
+            return []
+        positions = []
+        pos = self.text.find(term)
+        while pos != -1:
+            positions.append(pos)
+            pos = self.text.find(term, pos + 1)
+        return positions
+
+
+class KeywordAutomaton:
+    """Compiled matcher for a fixed, lowercase term dictionary."""
+
+    def __init__(self, terms: Iterable[str], token_cache_size: int = 100_000):
+        self.terms = tuple(dict.fromkeys(t for t in terms if t))
+        self._phrases = tuple((t, t.rsplit(" ", 1)[1]) for t in self.terms if " " in t)
+        words = [t for t in self.terms if " " not in t]
+        # Last words of phrases are matched as well, to know when a phrase search is worth it
+        helpers = [tail for _, tail in self._phrases if tail and tail not in words]
+        self._helpers = frozenset(helpers)
+        words += list(dict.fromkeys(helpers))
+        # Zero-width lookahead: the trie is tried at every offset, so overlapping hits are kept
+        self._regex = re.compile("(?=(" + trie_pattern(words) + "))") if words else None
+        # Only the longest term is captured per offset; these are the shorter ones it implies
+        self._prefixes = {word: tuple(t for t in words if word.startswith(t)) for word in words}
+        self._token_cache: Dict[str, Tuple[Tuple[str, int], ...]] = {}
+        self._token_cache_size = token_cache_size
+
+    def _match_token(self, token: str) -> Tuple[Tuple[str, int], ...]:
+        counts: Dict[str, int] = {}
+        if self._regex is not None:
+            for longest in self._regex.findall(token):
+                for term in self._prefixes[longest]:
+                    counts[term] = counts.get(term, 0) + 1
+        result = tuple(counts.items())
+        if len(self._token_cache) >= self._token_cache_size:
+            self._token_cache.clear()
+        self._token_cache[token] = result
+        return result
+
+    def scan(self, text: str) -> KeywordHits:
+        """Count all (possibly overlapping) occurrences of every term in ``text``."""
+        counts: Dict[str, int] = {}
+        cache = self._token_cache
+        for token, repeats in Counter(text.split(" ")).items():
+            matches = cache.get(token)
+            if matches is None:
+                matches = self._match_token(token)
+            for term, n in matches:
+                counts[term] = counts.get(term, 0) + n * repeats
+        for phrase, tail in self._phrases:
+            if tail in counts:
+                n = _count_overlapping(text, phrase)
+                if n:
+                    counts[phrase] = n
+        for helper in self._helpers:
+            counts.pop(helper, None)
+        return KeywordHits(text, counts)
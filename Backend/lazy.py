@@ -0,0 +1,67 @@
+"""
+Deferred construction of heavy dependencies, for fast cold starts.
+
+The platform scales to zero, so a new process has to answer health checks
+as soon as it listens. Compiled data (templates, rules, dictionaries, the
+skill taxonomy) and heavy third-party modules (NumPy, httpx) are therefore
+wrapped in ``Lazy`` proxies that build them on first attribute access:
+
+    RESUME_TEMPLATES = Lazy("resume_templates", TemplateSet)
+    RESUME_TEMPLATES.render(...)  # compiled here, once
+
+Every build is timed; ``load_times()`` lists them for /debug/info and
+``preload()`` builds everything up front (before forking workers, or with
+``PRELOAD=1`` where steady latency matters more than startup).
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+_REGISTRY: Dict[str, "Lazy"] = {}
+
+
+class Lazy:
+    """Proxy for the object ``factory()`` returns, built on first use."""
+
+    __slots__ = ("_name", "_factory", "_value", "_lock", "_seconds")
+
+    def __init__(self, name: str, factory: Callable[[], Any]):
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_value", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+        object.__setattr__(self, "_seconds", None)
+        _REGISTRY[name] = self
+
+    def load(self) -> Any:
+        value = self._value
+        if value is None:
+            with self._lock:
+                value = self._value
+                if value is None:
+                    start = time.perf_counter()
+                    value = self._factory()
+                    object.__setattr__(self, "_seconds", time.perf_counter() - start)
+                    object.__setattr__(self, "_value", value)
+        return value
+
+    @property
+    def loaded(self) -> bool:
+        return self._value is not None
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.load(), attr)
+
+    def __repr__(self) -> str:
+        return f"<Lazy {self._name}: {'loaded' if self.loaded else 'not loaded'}>"
+
+
+def preload() -> None:
+    for lazy in list(_REGISTRY.values()):
+        lazy.load()
+
+
+def load_times() -> Dict[str, Optional[float]]:
+    """Milliseconds each dependency took to build, None for those not used yet."""
+    return {name: round(lazy._seconds * 1e3, 2) if lazy._seconds is not None else None
+            for name, lazy in _REGISTRY.items()}
@@ -0,0 +1,153 @@
+"""
+Optional model-backed text generation for improve_resume and cover_letter.
+
+A provider turns a prompt into text; ``LLMClient`` wraps one with the
+serving policy: identical prompts already in flight share one upstream
+call, at most ``LLM_MAX_CONCURRENCY`` calls run at once, and each call
+(queueing included) gets ``LLM_TIMEOUT`` seconds. When the budget is
+exceeded or the provider fails, ``complete`` returns None and the caller
+serves its rule-based output instead.
+
+``LLM_PROVIDER=openai`` talks to any OpenAI-compatible chat completions
+endpoint at ``LLM_BASE_URL`` over one pooled keep-alive HTTP client;
+``llm_stub.py`` is such an endpoint for local load tests.
+"""
+import asyncio
+import os
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+import httpx
+
+from cache import content_hash
+
+
+class LLMError(Exception):
+    """The provider answered, but not with usable text."""
+
+
+class LLMProvider(ABC):
+    name = "none"
+
+    @abstractmethod
+    async def complete(self, system: str, prompt: str) -> str:
+        """The model's reply to ``prompt``; raises LLMError (or an HTTP error) when there is none."""
+
+    async def aclose(self) -> None:
+        pass
+
+
+class OpenAICompatibleProvider(LLMProvider):
+    """Chat completions over a shared ``httpx.AsyncClient`` (connection pool with keep-alive)."""
+
+    name = "openai"
+
+    def __init__(self, base_url: str, model: str, api_key: Optional[str] = None,
+                 max_connections: int = 32, max_tokens: int = 800):
+        self.model = model
+        self.max_tokens = max_tokens
+        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        self._client = httpx.AsyncClient(
+            base_url=base_url.rstrip("/"),
+            headers=headers,
+            # The client-level timeout is a backstop; LLMClient enforces the real budget
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            limits=httpx.Limits(max_connections=max_connections,
+                                max_keepalive_connections=max_connections,
+                                keepalive_expiry=30.0),
+        )
+
+    async def complete(self, system: str, prompt: str) -> str:
+        response = await self._client.post("/chat/completions", json={
+            "model": self.model,
+            "messages": [{"role": "system", "content": system},
+                         {"role": "user", "content": prompt}],
+            "max_tokens": self.max_tokens,
+            "temperature": 0.2,
+        })
+        response.raise_for_status()
+        try:
+            text = response.json()["choices"][0]["message"]["content"]
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            raise LLMError(f"Unexpected completion payload: {e}") from e
+        if not isinstance(text, str) or not text.strip():
+            raise LLMError("Empty completion")
+        return text.strip()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+class LLMClient:
+    """Coalescing, concurrency-limited, time-boxed front for a provider."""
+
+    def __init__(self, provider: LLMProvider, max_concurrency: int = 8, timeout: float = 10.0):
+        self.provider = provider
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.calls = 0
+        self.coalesced = 0
+        self.fallbacks = 0
+
+    async def _call(self, system: str, prompt: str) -> str:
+        async with self._semaphore:
+            self.calls += 1
+            return await self.provider.complete(system, prompt)
+
+    def _forget(self, key: str, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the outcome as seen even when every waiter already gave up
+        if not task.cancelled():
+            task.exception()
+
+    async def complete(self, system: str, prompt: str) -> Optional[str]:
+        """Completion text, or None when the call failed or ran over budget."""
+        key = content_hash(self.provider.name, system, prompt)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(asyncio.wait_for(self._call(system, prompt), self.timeout))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+        try:
+            # shield: one waiter disconnecting must not cancel the call the others share
+            return await asyncio.shield(task)
+        except (asyncio.TimeoutError, httpx.HTTPError, LLMError):
+            self.fallbacks += 1
+            return None
+
+    async def aclose(self) -> None:
+        await self.provider.aclose()
+
+    def stats(self) -> dict:
+        return {
+            "provider": self.provider.name,
+            "max_concurrency": self.max_concurrency,
+            "timeout": self.timeout,
+            "in_flight": len(self._inflight),
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "fallbacks": self.fallbacks,
+        }
+
+
+def configured_client() -> Optional[LLMClient]:
+    """Client built from the ``LLM_*`` environment variables, or None when no provider is set."""
+    provider_name = os.getenv("LLM_PROVIDER", "none").strip().lower()
+    if provider_name in ("", "none"):
+        return None
+    if provider_name != "openai":
+        raise ValueError(f"Unknown LLM_PROVIDER {provider_name!r} (expected 'openai' or 'none')")
+    max_concurrency = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+    provider = OpenAICompatibleProvider(
+        base_url=os.getenv("LLM_BASE_URL", "http://127.0.0.1:8100/v1"),
+        model=os.getenv("LLM_MODEL", "stub"),
+        api_key=os.getenv("LLM_API_KEY"),
+        max_connections=max_concurrency,
+    )
+    return LLMClient(provider, max_concurrency=max_concurrency,
+                     timeout=float(os.getenv("LLM_TIMEOUT", "10")))
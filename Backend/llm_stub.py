@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for an OpenAI-compatible chat completions API, for load tests
+of the model-backed mode without network access.
+
+    uvicorn llm_stub:app --port 8100
+    LLM_PROVIDER=openai LLM_BASE_URL=http://127.0.0.1:8100/v1 uvicorn main:app
+
+``STUB_LATENCY_MS`` (default 300) sets the simulated generation time and
+``STUB_FAILURE_RATE`` (default 0) the share of requests answered with a 503.
+The reply is the prompt's text after its last blank line, so the output is
+deterministic. ``GET /stats`` reports how many completions were served.
+"""
+import asyncio
+import os
+import random
+
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel
+
+LATENCY = float(os.getenv("STUB_LATENCY_MS", "300")) / 1000
+FAILURE_RATE = float(os.getenv("STUB_FAILURE_RATE", "0"))
+
+app = FastAPI(title="LLM stub")
+
+_served = {"completions": 0, "failures": 0, "in_flight": 0, "peak_in_flight": 0}
+
+
+class Message(BaseModel):
+    role: str
+    content: str
+
+
+class ChatCompletionBody(BaseModel):
+    model: str = "stub"
+    messages: list[Message]
+    max_tokens: int = 800
+    temperature: float = 0.0
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(body: ChatCompletionBody):
+    _served["in_flight"] += 1
+    _served["peak_in_flight"] = max(_served["peak_in_flight"], _served["in_flight"])
+    try:
+        await asyncio.sleep(LATENCY)
+        if FAILURE_RATE and random.random() < FAILURE_RATE:
+            _served["failures"] += 1
+            raise HTTPException(status_code=503, detail="Stub overloaded")
+        _served["completions"] += 1
+        prompt = body.messages[-1].content if body.messages else ""
+        text = prompt.rsplit("\n\n", 1)[-1].strip()
+        return {
+            "id": f"stub-{_served['completions']}",
+            "object": "chat.completion",
+            "model": body.model,
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": f"[{body.model}] {text}"}}],
+        }
+    finally:
+        _served["in_flight"] -= 1
+
+
+@app.get("/stats")
+def stats():
+    return dict(_served)
@@ -1,16 +1,88 @@
 #!/usr/bin/env python3
 """
-Main entry point for Railway deployment - Complete FastAPI app
+The Resume AI Builder API - the one FastAPI app behind every entry point.
+
+``app.py`` (repository root), ``start.py`` and ``App/main.py`` only import
+``app`` from here. Compiled data and heavy modules are ``lazy.Lazy``
+proxies built on first use, so a fresh process answers /api/health right
+away; ``python benchmarks/bench_startup.py`` checks the import budget.
 """
-from typing import List, Optional
+from typing import TYPE_CHECKING, Annotated, List, Literal, Optional
+from collections import deque
+from contextlib import asynccontextmanager
+import asyncio
+import heapq
+import json
 import os
+import orjson
 import sys
-from fastapi import FastAPI
+import tempfile
+import uuid
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import PlainTextResponse
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse, PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
+
+from admission import AdmissionQueue, Overloaded
+from cache import CACHES, LRUCache, content_hash
+from cover_letters import LetterSet
+from keyword_engine import KeywordAutomaton
+from lazy import Lazy, load_times, preload
+from metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, METRICS, MetricsMiddleware, metric_family
+from document import DIGIT_RE, Document
+from pdf_export import pdf_bytes, render_pdf
+from resume_templates import TemplateSet
+from rewrite_rules import RuleEngine, RuleSet
+from score_sessions import ScoreSession
+from skill_taxonomy import SkillTaxonomy
+from thread_limits import LIMITERS, in_threads, limiter
+from serialization import (build_model, decode, is_trusted, json_body, negotiated_response, parse_body,
+                           read_body, request_body_schema)
+from workers import (available_cpus, collect_from_workers, configured_workers, pool_workers, run_cpu,
+                     shutdown_pool, start_pool)
+from zip_stream import ZipStream
+
+if TYPE_CHECKING:
+    from llm import LLMClient  # httpx is only imported when a provider is configured
+
+def _warm_up_worker() -> None:
+    # Imports this module in the worker and fills the keyword token cache
+    _score_resume_result(ResumeScoreBody(
+        resume_text="Experience\n- Developed and managed Python services, increased uptime 20%",
+        job_description="Python developer with AWS and team leadership experience",
+    ))
+
+# Build every lazily loaded dependency at startup instead of on first use
+PRELOAD = os.getenv("PRELOAD", "0") == "1"
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Forked pool workers inherit what is built here
+    if PRELOAD or configured_workers() > 0:
+        await run_in_threadpool(preload)
+    # Rewritten-line memo from the previous run (LINE_MEMO_PATH), inherited by forked workers
+    if LINE_MEMO_PATH:
+        load_line_memo(LINE_MEMO_PATH)
+    # Process pool for CPU-bound handlers (CPU_WORKERS, 0 = threadpool only)
+    await run_in_threadpool(start_pool, None, _warm_up_worker)
+    # Model-backed generation (LLM_PROVIDER), one pooled HTTP client per process;
+    # httpx is only imported when a provider is set
+    global LLM
+    if os.getenv("LLM_PROVIDER", "none").strip().lower() not in ("", "none"):
+        from llm import configured_client
+        LLM = configured_client()
+    yield
+    if LLM is not None:
+        await LLM.aclose()
+        LLM = None
+    if LINE_MEMO_PATH:
+        await run_in_threadpool(save_line_memo, LINE_MEMO_PATH)
+    shutdown_pool()
 
-app = FastAPI(title="Resume & Cover Letter AI Builder", version="0.1.0")
+# orjson for every JSON response (handlers returning dicts still pass through jsonable_encoder)
+app = FastAPI(title="Resume & Cover Letter AI Builder", version="0.1.0", lifespan=lifespan,
+              default_response_class=ORJSONResponse)
 
 @app.get("/")
 def root():
@@ -30,250 +102,638 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Content-Location", "X-Generated-By", "Retry-After", "X-Degraded"],
 )
 
+# Outermost, so request metrics include the time spent in the other middleware
+app.add_middleware(MetricsMiddleware)
+
 # ---------- Health ----------
 @app.get("/api/health")
 def health():
     return {"status": "ok", "message": "API health check"}
 
+# ---------- Content-addressed results (ETag / If-None-Match) ----------
+# Deterministic outputs are addressed by a hash of the endpoint, the normalized
+# (validated, defaults filled in) request and the data the output depends on.
+# The hash is the strong ETag, so a matching If-None-Match is answered with 304
+# without recomputing (these POSTs are safe reads, hence 304 rather than 412),
+# and the stored result can be fetched via GET /api/results/{hash}.
+RESULTS = LRUCache("results", maxsize=int(os.getenv("RESULT_CACHE_SIZE", "1024")))
+
+# The content at a result URL never changes, so shared caches may keep it for a year
+RESULT_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+def _code_fingerprint() -> str:
+    # app.version does not change between deploys, so keys also carry the deployed code:
+    # BUILD_ID (or Railway's commit SHA) if set, else a hash of the backend's modules
+    build = os.getenv("BUILD_ID") or os.getenv("RAILWAY_GIT_COMMIT_SHA")
+    if build:
+        return build
+    directory = os.path.dirname(os.path.abspath(__file__))
+    sources = []
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".py"):
+            with open(os.path.join(directory, name), encoding="utf-8") as f:
+                sources.append(f.read())
+    return content_hash(*sources)
+
+CODE_FINGERPRINT = _code_fingerprint()
+
+def _result_key(endpoint: str, body: BaseModel, *versions: str) -> str:
+    return content_hash(endpoint, app.version, CODE_FINGERPRINT, body.model_dump_json(), *versions)
+
+def _result_headers(key: str) -> dict:
+    return {"ETag": f'"{key}"', "Content-Location": f"/api/results/{key}"}
+
+def _etag_matches(request: Request, key: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    etag = f'"{key}"'
+    return any(tag.strip().removeprefix("W/") in (etag, "*") for tag in header.split(","))
+
+def _cached_result(request: Request, key: str, headers: Optional[dict] = None) -> Optional[Response]:
+    """304 if the client already has the result, the stored result if there is one, else None."""
+    if _etag_matches(request, key):
+        return Response(status_code=304, headers={**_result_headers(key), **(headers or {})})
+    stored = RESULTS.get(key)
+    if stored is None:
+        return None
+    content, media_type = stored
+    return Response(content, media_type=media_type, headers={**_result_headers(key), **(headers or {})})
+
+def _store_result(key: str, response: Response, fallback: Optional[str] = None) -> Response:
+    RESULTS.set(key, (response.body, response.media_type))
+    if fallback is not None and len(response.body) <= DEGRADED_MAX_BYTES:
+        LAST_RESULTS.set(fallback, (response.body, response.media_type))
+    response.headers.update(_result_headers(key))
+    return response
+
+@app.get("/api/results/{key}")
+def get_result(key: str, request: Request):
+    """A previously computed result by its hash (the ETag of the response that produced it).
+
+    RESULTS is per process: with several web workers only the worker that
+    computed a result can serve it, and the others answer 404.
+    """
+    headers = {"Cache-Control": RESULT_CACHE_CONTROL}
+    result = _cached_result(request, key, headers)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired result; repeat the original request")
+    return result
+
+# ---------- Admission control (bounded CPU work queue, load shedding) ----------
+# Scoring, improving and rule-based letters hold one of CPU_MAX_IN_FLIGHT slots
+# while they run; up to CPU_QUEUE_SIZE more requests wait at most
+# CPU_QUEUE_TIMEOUT seconds for one. Past that a request is shed at once with
+# 503 and Retry-After rather than queued behind work it will time out on.
+# Streaming endpoints (score and improve streams, bulk generation) are refused
+# with 503 up front when the queue is full, and admit each record's work on its own.
+CPU_ADMISSION = AdmissionQueue(
+    "cpu",
+    max_in_flight=int(os.getenv("CPU_MAX_IN_FLIGHT", "0")) or 2 * (configured_workers() or available_cpus()),
+    max_queue=int(os.getenv("CPU_QUEUE_SIZE", "64")),
+    timeout=float(os.getenv("CPU_QUEUE_TIMEOUT", "5")),
+)
+
+# A shed request is answered with the last result for the same input, if there is
+# one, even if it was computed with since-reloaded data (marked X-Degraded: stale).
+# RESULTS is checked first, so this only pays off where its policy differs: keys
+# leave out the data versions (an answer survives reloads of the rules, skills or
+# corpus statistics), and small results are kept for many more inputs than RESULTS holds.
+DEGRADED_RESPONSES = os.getenv("DEGRADED_RESPONSES", "1") == "1"
+
+# Larger results are not kept for degraded responses, which bounds the cache's memory
+DEGRADED_MAX_BYTES = 8 * 1024
+
+# (endpoint, request) hash, without versions -> last result body and media type
+LAST_RESULTS = LRUCache("last_results", maxsize=int(os.getenv("DEGRADED_CACHE_SIZE", "8192")))
+
+def _fallback_key(endpoint: str, body: BaseModel) -> str:
+    return content_hash(endpoint, body.model_dump_json())
+
+async def _run_admitted(endpoint: str, fn, *args):
+    async with CPU_ADMISSION.slot():
+        return await run_cpu(fn, *args, threads=limiter(endpoint))
+
+def _stale_result(fallback: str, headers: Optional[dict] = None) -> Optional[Response]:
+    """The last result for a shed request's input, or None when degraded responses are off or there is none."""
+    stored = LAST_RESULTS.get(fallback) if DEGRADED_RESPONSES else None
+    if stored is None:
+        return None
+    content, media_type = stored
+    return Response(content, media_type=media_type,
+                    headers={**(headers or {}), "X-Degraded": "stale", "Cache-Control": "no-store"})
+
+@app.exception_handler(Overloaded)
+async def overloaded_handler(request: Request, exc: Overloaded):
+    return ORJSONResponse({"detail": exc.reason}, status_code=503, headers={"Retry-After": str(exc.retry_after)})
+
+# ---------- Request size caps ----------
+# Bodies are refused above REQUEST_MAX_BYTES (BATCH_REQUEST_MAX_BYTES for batches)
+# before parsing; these caps then fail a field as soon as the validator reaches it.
+MAX_FIELD_CHARS = 1_000      # names, titles, contact details, a single achievement
+MAX_TEXT_CHARS = 100_000     # resumes, job descriptions, summaries
+MAX_LIST_ITEMS = 100         # experiences, education entries, achievements per role
+MAX_BATCH_ITEMS = 1_000      # resumes or job descriptions per batch
+MAX_BATCH_PAIRS = int(os.getenv("MAX_BATCH_PAIRS", "50000"))  # resumes x job descriptions per batch
+BATCH_REQUEST_MAX_BYTES = int(os.getenv("BATCH_REQUEST_MAX_BYTES", str(32 * 1024 * 1024)))
+
+ShortText = Annotated[str, Field(max_length=MAX_FIELD_CHARS)]
+LongText = Annotated[str, Field(max_length=MAX_TEXT_CHARS)]
+
 # ---------- Models for /api/generate-resume ----------
 class Experience(BaseModel):
-    role: str
-    company: str
-    start: str = Field(..., description="YYYY-MM or year")
-    end: Optional[str] = Field(None, description="YYYY-MM, year or 'Present'")
-    achievements: List[str] = []
+    role: ShortText
+    company: ShortText
+    start: ShortText = Field(..., description="YYYY-MM or year")
+    end: Optional[ShortText] = Field(None, description="YYYY-MM, year or 'Present'")
+    achievements: List[ShortText] = Field([], max_length=MAX_LIST_ITEMS)
 
 class Education(BaseModel):
-    school: str
-    start: str
-    end: Optional[str] = None
-    degree: Optional[str] = None
+    school: ShortText
+    start: ShortText
+    end: Optional[ShortText] = None
+    degree: Optional[ShortText] = None
 
 class GenerateResumeRequest(BaseModel):
-    full_name: str
-    target_title: str
-    email: Optional[str] = None
-    phone: Optional[str] = None
-    location: Optional[str] = None
-    links: Optional[str] = None  # comma or space separated
-    summary: Optional[str] = None
-    experiences: List[Experience] = []
-    education: List[Education] = []
-    skills: Optional[str] = None  # comma separated
-
-def _bullets(items: List[str]) -> str:
-    return "\n".join(f"- {i}" for i in items if (i or "").strip())
+    full_name: ShortText
+    target_title: ShortText
+    email: Optional[ShortText] = None
+    phone: Optional[ShortText] = None
+    location: Optional[ShortText] = None
+    links: Optional[ShortText] = None  # comma or space separated
+    summary: Optional[LongText] = None
+    experiences: List[Experience] = Field([], max_length=MAX_LIST_ITEMS)
+    education: List[Education] = Field([], max_length=MAX_LIST_ITEMS)
+    skills: Optional[LongText] = None  # comma separated
+    template: ShortText = Field("plain", description="plain, modern, classic or minimal (see GET /api/templates)")
+    format: Literal["text", "markdown", "html", "pdf"] = "text"
+
+# Compiled once, on first use (data/templates, RESUME_TEMPLATES_DIR)
+RESUME_TEMPLATES = Lazy("resume_templates", TemplateSet)
+
+RESUME_MEDIA_TYPES = {"text": "text/plain", "markdown": "text/markdown", "html": "text/html"}
+
+# (payload hash, template, format) -> rendered resume
+RENDERED_RESUMES = LRUCache("rendered_resumes", maxsize=int(os.getenv("RENDER_CACHE_SIZE", "256")))
+
+def _resume_context(body: GenerateResumeRequest) -> dict:
+    """Template variables: the raw fields plus the derived values the layouts need."""
+    contact = [c for c in (body.email, body.phone, body.location, body.links) if c]
+    experiences = []
+    for exp in body.experiences:
+        achievements = [a for a in exp.achievements if (a or "").strip()]
+        experiences.append(dict(exp.model_dump(), end_or_present=exp.end or "Present",
+                                achievements=achievements, has_achievements=bool(achievements)))
+    return dict(
+        body.model_dump(exclude={"template", "format", "experiences", "education"}),
+        contact=[{"value": c, "first": i == 0} for i, c in enumerate(contact)],
+        has_contact=bool(contact),
+        summary_text=(body.summary or "").strip(),
+        experiences=experiences,
+        has_experiences=bool(experiences),
+        education=[ed.model_dump() for ed in body.education],
+        has_education=bool(body.education),
+        skills_text=", ".join(s.strip() for s in (body.skills or "").split(",") if s.strip()),
+    )
+
+def _render_resume(body: GenerateResumeRequest, fmt: str) -> str:
+    return RESUME_TEMPLATES.render(body.template, fmt, _resume_context(body)) or "No data provided."
+
+def _pdf_response(text: str, title: str, filename: str, author: Optional[str] = None,
+                  headers: Optional[dict] = None) -> StreamingResponse:
+    # Pages are written to the client as they are laid out (sync generator, iterated in the threadpool)
+    return StreamingResponse(
+        render_pdf(text, title, author),
+        media_type="application/pdf",
+        headers={**(headers or {}), "Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+def _resume_output(body: GenerateResumeRequest) -> str:
+    """The template rendering for ``body.format`` (the text rendering for PDFs), cached."""
+    fmt = "text" if body.format == "pdf" else body.format
+    # Repeat previews of the same resume are served from the cache
+    key = (content_hash(body.model_dump_json(exclude={"template", "format"})), body.template, fmt)
+    return RENDERED_RESUMES.get_or_create(key, lambda: _render_resume(body, fmt))
+
+def _unknown_template(body: GenerateResumeRequest) -> Optional[str]:
+    if body.template not in RESUME_TEMPLATES.info:
+        return f"Unknown template {body.template!r}; available: {RESUME_TEMPLATES.names()}"
+    return None
 
 # ---------- /api/generate-resume ----------
-@app.post("/api/generate-resume", response_class=PlainTextResponse)
-def generate_resume(body: GenerateResumeRequest):
-    parts: List[str] = []
-
-    # Header
-    header = [body.full_name, body.target_title]
-    contact = []
-    if body.email: contact.append(body.email)
-    if body.phone: contact.append(body.phone)
-    if body.location: contact.append(body.location)
-    if body.links: contact.append(body.links)
-    if contact:
-        header.append(" | ".join(contact))
-    parts.append("\n".join(h for h in header if h))
-
-    # Summary
-    if body.summary and body.summary.strip():
-        parts.append("Summary\n-------\n" + body.summary.strip())
-
-    # Experience
-    if body.experiences:
-        sec = ["Experience\n----------"]
-        for exp in body.experiences:
-            title = f"{exp.role} — {exp.company} ({exp.start} – {exp.end or 'Present'})"
-            sec.append(title)
-            if exp.achievements:
-                sec.append(_bullets(exp.achievements))
-        parts.append("\n".join(sec))
-
-    # Education
-    if body.education:
-        sec = ["Education\n---------"]
-        for ed in body.education:
-            degree = f", {ed.degree}" if ed.degree else ""
-            line = f"{ed.school}{degree} ({ed.start} – {ed.end or ''})".strip()
-            sec.append(line)
-        parts.append("\n".join(sec))
-
-    # Skills
-    if body.skills and body.skills.strip():
-        skills_clean = ", ".join(s.strip() for s in body.skills.split(",") if s.strip())
-        parts.append("Skills\n------\n" + skills_clean)
-
-    result = "\n\n".join(p for p in parts if p.strip())
-    return result or "No data provided."
+@app.post("/api/generate-resume", openapi_extra=request_body_schema(GenerateResumeRequest))
+@in_threads("generate-resume")
+def generate_resume(request: Request, body: GenerateResumeRequest = Depends(json_body(GenerateResumeRequest))):
+    error = _unknown_template(body)
+    if error:
+        raise HTTPException(status_code=422, detail=error)
+    if body.format == "pdf":
+        return _pdf_response(_resume_output(body), "Resume", "resume.pdf", author=body.full_name)
+    key = _result_key("generate-resume", body, RESUME_TEMPLATES.fingerprint)
+    cached = _cached_result(request, key)
+    if cached is not None:
+        return cached
+    return _store_result(key, Response(_resume_output(body), media_type=RESUME_MEDIA_TYPES[body.format]))
+
+@app.get("/api/templates")
+def list_templates():
+    return {"templates": [dict(info, id=name) for name, info in RESUME_TEMPLATES.info.items()],
+            "formats": list(RESUME_MEDIA_TYPES) + ["pdf"]}
+
+# ---------- Model-backed generation (optional, rules are the fallback) ----------
+GenerationMode = Literal["rules", "llm"]
+
+LLM: Optional["LLMClient"] = None  # set by lifespan
+
+IMPROVE_SYSTEM_PROMPT = (
+    "You improve resumes. Rewrite the resume below with strong action verbs and "
+    "quantified achievements, keep every fact, and return only the resume text."
+)
+COVER_LETTER_SYSTEM_PROMPT = (
+    "You write concise, specific cover letters. Use only facts from the resume and "
+    "job description provided, and return only the letter text."
+)
+
+async def _llm_text(system: str, prompt: str, response: Response) -> Optional[str]:
+    """Model output, or None (serve the rule-based text) when no model is set up or it ran over budget."""
+    text = await LLM.complete(system, prompt) if LLM is not None else None
+    response.headers["X-Generated-By"] = "llm" if text is not None else "rules"
+    return text
 
 # ---------- Optional stubs you already used earlier ----------
+# Rewrite rules per tone (data/rewrite_rules.json, reloaded when the file changes)
+REWRITE_RULES = Lazy("rewrite_rules", RuleEngine)
+
+METRIC_WORDS = ["increased", "decreased", "improved", "reduced", "grew", "achieved"]
+CREATION_WORDS = ["developed", "created", "built", "implemented", "designed"]
+LEADERSHIP_WORDS = ["led", "managed", "coordinated", "supervised"]
+
+# (rules fingerprint, tone, stripped line) -> improved line
+LINE_MEMO = LRUCache("improved_lines", maxsize=int(os.getenv("LINE_MEMO_SIZE", "10000")))
+LINE_MEMO_PATH = os.getenv("LINE_MEMO_PATH")
+
+# Longer lines (stream records may be up to NDJSON_MAX_RECORD_BYTES) are rewritten but not memoized,
+# so the memo's memory stays bounded by LINE_MEMO_SIZE x this
+LINE_MEMO_MAX_CHARS = 1_000
+
+def _line_memo_entries() -> list:
+    fingerprint = REWRITE_RULES.fingerprint
+    return [[tone, line, improved] for (key_fingerprint, tone, line), improved in LINE_MEMO.items()
+            if key_fingerprint == fingerprint]
+
+def _read_line_memo(path: str) -> list:
+    # (tone, line, improved) entries saved for the current rules, oldest first
+    if not os.path.exists(path):
+        return []
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("rules") != REWRITE_RULES.fingerprint:
+            return []
+        return [(tone, line, improved) for tone, line, improved in data["entries"]
+                if len(line) <= LINE_MEMO_MAX_CHARS]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as exc:
+        print(f"⚠️  Ignoring line memo {path}: {exc!r}", flush=True)
+        return []
+
+def load_line_memo(path: str) -> int:
+    """Warm LINE_MEMO from a file written by save_line_memo; entries for other rules are skipped.
+
+    An unreadable or corrupt file is reported and ignored, starting with an empty memo.
+    """
+    fingerprint = REWRITE_RULES.fingerprint
+    entries = _read_line_memo(path)
+    for tone, line, improved in entries:
+        LINE_MEMO.set((fingerprint, tone, line), improved)
+    return len(entries)
+
+def save_line_memo(path: str) -> int:
+    """Merge this process's memo (and its pool workers') into the file; nothing is written if empty.
+
+    Every serve.py worker saves on shutdown, so the file is read, merged and
+    replaced under an exclusive lock on ``path + ".lock"``: each worker adds
+    its entries to what the others saved instead of overwriting them.
+    """
+    import fcntl  # POSIX only, like serve.py; only needed when LINE_MEMO_PATH is set
+
+    # Pool workers keep their own memo; merge theirs after ours, most recent last
+    ours = [_line_memo_entries()] + collect_from_workers(_line_memo_entries)
+    if not any(ours):
+        return 0
+    with open(path + ".lock", "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        merged = {}
+        for entries in [_read_line_memo(path)] + ours:
+            for tone, line, improved in entries:
+                merged.pop((tone, line), None)
+                merged[(tone, line)] = improved
+        entries = [[tone, line, improved] for (tone, line), improved in merged.items()][-LINE_MEMO.maxsize:]
+        # Written to a temporary file and renamed, so a reader never sees a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".line-memo-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"rules": REWRITE_RULES.fingerprint, "entries": entries}, f, ensure_ascii=False)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    return len(entries)
+
 class ImproveBody(BaseModel):
-    text: str
-    tone: Optional[str] = "professional"
+    text: LongText
+    tone: Optional[ShortText] = "professional"
+    mode: GenerationMode = Field("rules", description="'llm' uses the configured model, falling back to the rules")
 
-@app.post("/api/improve-resume", response_class=PlainTextResponse)
-def improve_resume(body: ImproveBody):
-    # Trim lines and remove blanks
-    lines = [ln.strip() for ln in body.text.splitlines() if ln.strip()]
-    
-    # Apply improvements based on tone
-    improved_lines = []
-    
-    for line in lines:
-        improved_line = line
-        
-        # Make action verbs more impactful
-        action_verb_improvements = {
-            "did": "accomplished",
-            "made": "created",
-            "worked on": "developed",
-            "helped": "assisted",
-            "used": "implemented",
-            "did work": "executed",
-            "was responsible for": "managed",
-            "looked after": "oversaw",
-            "did stuff": "performed",
-            "fixed": "resolved",
-            "changed": "transformed",
-            "got": "achieved",
-            "put in": "implemented",
-            "set up": "established",
-            "ran": "managed"
-        }
-        
-        for weak_verb, strong_verb in action_verb_improvements.items():
-            if weak_verb in improved_line.lower():
-                improved_line = improved_line.replace(weak_verb, strong_verb)
-                improved_line = improved_line.replace(weak_verb.title(), strong_verb.title())
-        
-        # Add quantifiable results if missing
-        if any(word in improved_line.lower() for word in ["increased", "decreased", "improved", "reduced", "grew", "achieved"]):
-            # Line already has metrics, keep as is
-            pass
-        elif any(word in improved_line.lower() for word in ["developed", "created", "built", "implemented", "designed"]):
-            # Suggest adding metrics
-            if not any(char.isdigit() for char in improved_line):
-                improved_line += " (consider adding specific metrics)"
-        
-        # Make it more professional if needed
-        if body.tone == "professional":
-            # Remove casual language
-            casual_words = ["cool", "awesome", "great", "nice", "good", "stuff", "things"]
-            for word in casual_words:
-                if word in improved_line.lower():
-                    improved_line = improved_line.replace(word, "excellent")
-                    improved_line = improved_line.replace(word.title(), "Excellent")
-        
-        improved_lines.append(improved_line)
-    
-    result = "\n".join(improved_lines)
+@app.post("/api/improve-resume", response_class=PlainTextResponse, openapi_extra=request_body_schema(ImproveBody))
+async def improve_resume(request: Request, response: Response, body: ImproveBody = Depends(json_body(ImproveBody))):
+    if body.mode == "llm":
+        text = await _llm_text(IMPROVE_SYSTEM_PROMPT, f"Tone: {body.tone or 'professional'}\n\n{body.text.strip()}", response)
+        if text is not None:
+            return text
+    # Model output is not reproducible; only rule-based text is content-addressed
+    rules_body = body.model_copy(update={"mode": "rules"})
+    key = _result_key("improve-resume", rules_body, REWRITE_RULES.fingerprint)
+    cached = _cached_result(request, key, dict(response.headers))
+    if cached is not None:
+        return cached
+    fallback = _fallback_key("improve-resume", rules_body)
+    try:
+        text = await _run_admitted("improve-resume", _improve_resume_text, body)
+    except Overloaded:
+        stale = _stale_result(fallback, dict(response.headers))
+        if stale is None:
+            raise
+        return stale
+    return _store_result(key, PlainTextResponse(text, headers=dict(response.headers)), fallback)
+
+def _improve_line(rules: RuleSet, line: str, has_digit: bool) -> str:
+    # Stronger action verbs and (per tone) less casual wording, in one pass
+    improved_line = rules.apply(line)
+    improved_lower = improved_line.lower()
     
-    # Add improvement suggestions at the end
+    # Add quantifiable results if missing
+    if any(word in improved_lower for word in METRIC_WORDS):
+        # Line already has metrics, keep as is
+        pass
+    elif any(word in improved_lower for word in CREATION_WORDS):
+        # Suggest adding metrics
+        if not has_digit:
+            improved_line += " (consider adding specific metrics)"
+    return improved_line
+
+def _memoized_improve_line(rules: RuleSet, fingerprint: str, tone: Optional[str], line: str, has_digit: bool) -> str:
+    # Common bullets repeat across users, so rewritten lines are memoized
+    if len(line) > LINE_MEMO_MAX_CHARS:
+        return _improve_line(rules, line, has_digit)
+    key = (fingerprint, tone, line)
+    improved_line = LINE_MEMO.get(key)
+    if improved_line is None:
+        improved_line = _improve_line(rules, line, has_digit)
+        LINE_MEMO.set(key, improved_line)
+    return improved_line
+
+def _improvement_suggestions(has_digits: bool, bullet_count: int, has_leadership: bool) -> List[str]:
     suggestions = []
     
     # Check for common resume issues
-    if not any(char.isdigit() for char in body.text):
+    if not has_digits:
         suggestions.append("💡 Consider adding quantifiable achievements (e.g., 'increased sales by 25%')")
     
-    if len([line for line in lines if line.startswith("-") or line.startswith("•")]) < 3:
+    if bullet_count < 3:
         suggestions.append("💡 Add more bullet points to highlight specific achievements")
     
-    if not any(word in body.text.lower() for word in ["led", "managed", "coordinated", "supervised"]):
+    if not has_leadership:
         suggestions.append("💡 Include leadership experiences if applicable")
     
-    if suggestions:
-        result += "\n\n" + "\n".join(suggestions)
-    
-    return result
+    return suggestions
 
-class CoverLetterBody(BaseModel):
-    job_title: str
-    company: Optional[str] = None
-    job_description: Optional[str] = None
-    resume_text: Optional[str] = None
-
-@app.post("/api/cover-letter", response_class=PlainTextResponse)
-def cover_letter(body: CoverLetterBody):
-    company = body.company or "the company"
+def _improve_resume_text(body: ImproveBody) -> str:
+    doc = analyze_document(body.text)
+    # Trim lines and remove blanks
+    lines = [(ln.strip(), has_digit) for ln, has_digit in zip(doc.lines, doc.digits) if ln.strip()]
     
-    # Extract key skills from resume if provided
-    resume_skills = []
-    if body.resume_text:
-        # Simple skill extraction - look for common tech terms
-        common_skills = ["react", "python", "javascript", "typescript", "node", "sql", "aws", "docker", "git", "html", "css", "java", "c++", "php", "ruby", "go", "rust", "swift", "kotlin", "angular", "vue", "django", "flask", "express", "mongodb", "postgresql", "mysql", "redis", "kubernetes", "jenkins", "agile", "scrum"]
-        resume_lower = body.resume_text.lower()
-        resume_skills = [skill for skill in common_skills if skill in resume_lower]
+    # Apply improvements based on tone
+    improved_lines = []
+    rules = REWRITE_RULES.rules_for(body.tone)
+    fingerprint = REWRITE_RULES.fingerprint
     
-    # Generate a more personalized cover letter
-    intro = f"Dear Hiring Manager,\n\n"
-    intro += f"I am writing to express my strong interest in the {body.job_title} position at {company}. "
+    for line, has_digit in lines:
+        improved_lines.append(_memoized_improve_line(rules, fingerprint, body.tone, line, has_digit))
     
-    if body.job_description:
-        intro += f"After reviewing the job description, I am excited about the opportunity to contribute to your team and believe my background aligns well with your requirements.\n\n"
-    else:
-        intro += f"I am excited about the opportunity to contribute to your team and believe my background would be a great fit for this role.\n\n"
+    result = "\n".join(improved_lines)
     
-    # Body paragraph
-    body_text = "Throughout my career, I have demonstrated a strong ability to "
-    if resume_skills:
-        body_text += f"work with technologies such as {', '.join(resume_skills[:3])} and "
-    body_text += "deliver high-quality solutions that meet business objectives. "
+    # Add improvement suggestions at the end
+    suggestions = _improvement_suggestions(
+        doc.has_digits, doc.bullet_count(("-", "•")), doc.hits.any(LEADERSHIP_WORDS)
+    )
+    if suggestions:
+        result += "\n\n" + "\n".join(suggestions)
     
+    return result
+
+class CoverLetterBody(BaseModel):
+    job_title: ShortText
+    company: Optional[ShortText] = None
+    job_description: Optional[LongText] = None
+    resume_text: Optional[LongText] = None
+    tone: Optional[ShortText] = Field("professional", description="professional, enthusiastic or concise (see GET /api/cover-letter/tones)")
+    mode: GenerationMode = Field("rules", description="'llm' uses the configured model, falling back to the rules")
+    format: Literal["text", "pdf"] = "text"
+
+def _cover_letter_prompt(body: CoverLetterBody) -> str:
+    parts = [f"Position: {body.job_title}", f"Company: {body.company or 'not given'}", f"Tone: {body.tone or 'professional'}"]
     if body.job_description:
-        body_text += "I am particularly drawn to this role because it offers the opportunity to "
-        # Extract some key phrases from job description
-        job_desc_lower = body.job_description.lower()
-        if any(word in job_desc_lower for word in ["team", "collaborate", "lead"]):
-            body_text += "work collaboratively with a talented team and potentially take on leadership responsibilities. "
-        elif any(word in job_desc_lower for word in ["innovate", "create", "build"]):
-            body_text += "innovate and build impactful solutions that drive business growth. "
-        else:
-            body_text += "apply my technical skills while contributing to meaningful projects. "
-    else:
-        body_text += "I am confident that my technical skills and professional experience would enable me to make immediate contributions to your organization. "
-    
-    # Closing
-    closing = f"\nI am excited about the possibility of joining {company} and would welcome the opportunity to discuss how my background, skills, and enthusiasm would make me a valuable addition to your team. I am available for an interview at your convenience and look forward to hearing from you.\n\n"
-    closing += "Thank you for considering my application.\n\n"
-    closing += "Sincerely,\n[Your Name]"
-    
-    return intro + body_text + closing
+        parts.append("Job description:\n" + body.job_description.strip())
+    parts.append("Resume:\n" + (body.resume_text or "not given").strip())
+    return "\n\n".join(parts)
+
+@app.post("/api/cover-letter", response_class=PlainTextResponse, openapi_extra=request_body_schema(CoverLetterBody))
+async def cover_letter(request: Request, response: Response, body: CoverLetterBody = Depends(json_body(CoverLetterBody))):
+    text = None
+    if body.mode == "llm":
+        text = await _llm_text(COVER_LETTER_SYSTEM_PROMPT, _cover_letter_prompt(body), response)
+    if body.format == "pdf":
+        if text is None:
+            text = await _rules_cover_letter(body)
+        # A returned response does not pick up headers set on ``response``
+        return _pdf_response(text, "Cover Letter", "cover-letter.pdf", headers=dict(response.headers))
+    if text is not None:
+        return text
+    # Model output is not reproducible; only rule-based text is content-addressed
+    key = _result_key("cover-letter", body.model_copy(update={"mode": "rules"}), COVER_LETTERS.fingerprint,
+                      SKILLS.fingerprint)
+    cached = _cached_result(request, key, dict(response.headers))
+    if cached is not None:
+        return cached
+    return _store_result(key, PlainTextResponse(await _rules_cover_letter(body), headers=dict(response.headers)))
+
+@app.get("/api/cover-letter/tones")
+def list_cover_letter_tones():
+    return {"tones": COVER_LETTERS.tones(), "default": COVER_LETTERS.default_tone}
+
+# (payload hash) -> rule-based letter, checked before the letter is handed to a worker
+RENDERED_LETTERS = LRUCache("rendered_letters", maxsize=int(os.getenv("RENDER_CACHE_SIZE", "256")))
+
+def _cover_letter_text(body: CoverLetterBody) -> str:
+    """One analysis of the resume and job description picks every fragment of the letter."""
+    tags = set()
+    skills = []
+    if body.resume_text:
+        tags.add("resume")
+        skills = [skill for skill in analyze_document(body.resume_text).skills
+                  if SKILLS.category(skill) in COVER_LETTERS.skill_categories][:COVER_LETTERS.skills_mentioned]
+        if skills:
+            tags.add("skills")
+    # Key phrases come from the cached job description profile
+    profile = get_job_profile(body.job_description)
+    if profile is not None:
+        tags.add("job_description")
+        angle = COVER_LETTERS.angle(profile.phrases)
+        if angle:
+            tags.add(angle)
+    context = {"job_title": body.job_title, "company": body.company or "the company", "skills": ", ".join(skills)}
+    return COVER_LETTERS.render(body.tone, frozenset(tags), context)
+
+async def _rules_cover_letter(body: CoverLetterBody) -> str:
+    key = (content_hash(body.model_dump_json(exclude={"mode", "format"})), COVER_LETTERS.fingerprint,
+           SKILLS.fingerprint)
+    text = RENDERED_LETTERS.get(key)
+    if text is None:
+        text = await _run_admitted("cover-letter", _cover_letter_text, body)
+        RENDERED_LETTERS.set(key, text)
+    return text
+
+ScoringMode = Literal["keywords", "bm25"]
 
 class ResumeScoreBody(BaseModel):
-    resume_text: str
-    job_title: Optional[str] = None
-    job_description: Optional[str] = None
+    resume_text: LongText
+    job_title: Optional[ShortText] = None
+    job_description: Optional[LongText] = None
+    mode: ScoringMode = Field("keywords", description="'bm25' rates keyword matching by BM25 relevance")
 
-@app.post("/api/score-resume")
-def score_resume(body: ResumeScoreBody):
-    """Score resume for ATS compatibility and provide improvement suggestions"""
-    
+# ---------- Scoring dictionaries (compiled once, on first use) ----------
+SECTION_KEYWORDS = {
+    'contact': ['email', 'phone', '@', '+1', 'linkedin'],
+    'experience': ['experience', 'work history', 'employment'],
+    'education': ['education', 'degree', 'university', 'college'],
+    'skills': ['skills', 'technologies', 'programming', 'languages']
+}
+
+ACTION_VERBS = [
+    'developed', 'implemented', 'created', 'designed', 'managed', 'led',
+    'increased', 'improved', 'reduced', 'achieved', 'delivered', 'built',
+    'maintained', 'coordinated', 'supervised', 'trained', 'analyzed'
+]
+
+NUMBER_WORDS = ['%', 'percent', 'million', 'thousand', 'hundred', 'dozen']
+
+# Cover letter fragments (data/cover_letters.json, COVER_LETTERS_PATH), with the phrases it picks its angle from
+COVER_LETTERS = Lazy("cover_letters", LetterSet)
+
+# Skills with their aliases and categories, matched on whole words (data/skills.txt, SKILL_TAXONOMY_PATH);
+# the compiled index is memory-mapped, so every worker shares one read-only copy
+SKILLS = Lazy("skill_taxonomy", SkillTaxonomy)
+
+SCORING_AUTOMATON = Lazy("scoring_automaton", lambda: KeywordAutomaton(
+    [kw for keywords in SECTION_KEYWORDS.values() for kw in keywords]
+    + ACTION_VERBS + NUMBER_WORDS + COVER_LETTERS.phrases
+))
+
+def _load_relevance():
+    import relevance
+    # BM25 corpus statistics (RELEVANCE_STATS_PATH)
+    relevance.load_stats()
+    return relevance
+
+# BM25 scoring; NumPy is imported with it
+RELEVANCE = Lazy("relevance", _load_relevance)
+
+# Each distinct text is analyzed once and shared by every endpoint that sees it
+DOCUMENT_CACHE = LRUCache("documents", maxsize=int(os.getenv("DOCUMENT_CACHE_SIZE", "64")))
+
+def analyze_document(text: str) -> Document:
+    return DOCUMENT_CACHE.get_or_create(content_hash(text), lambda: Document(SCORING_AUTOMATON, text, SKILLS))
+
+class ResumeAnalysis:
+    """Everything the scorer needs from one resume, computed in one go."""
+
+    __slots__ = ("hits", "skills", "has_numbers", "word_count", "bullet_points")
+
+    def __init__(self, resume_text: str):
+        doc = analyze_document(resume_text)
+        self.hits = doc.hits
+        self.skills = doc.skills
+        self.has_numbers = self.hits.any(NUMBER_WORDS) or doc.has_digits
+        self.word_count = doc.word_count
+        self.bullet_points = doc.bullet_count()
+
+    @classmethod
+    def from_session(cls, session: ScoreSession) -> "ResumeAnalysis":
+        analysis = cls.__new__(cls)
+        analysis.hits = session.hits()
+        analysis.skills = session.skills()
+        analysis.has_numbers = analysis.hits.any(NUMBER_WORDS) or session.digit_lines > 0
+        analysis.word_count = session.word_count
+        analysis.bullet_points = session.bullet_lines
+        return analysis
+
+# ---------- Job description profiles (cached by content hash) ----------
+class JobProfile:
+    """Parsed job description shared by score_resume and cover_letter."""
+
+    __slots__ = ("text_lower", "keywords", "phrases")
+
+    def __init__(self, job_description: str):
+        doc = analyze_document(job_description)
+        self.text_lower = doc.lower
+        job_hits = doc.hits
+        # Canonical skills the job asks for, in order of first mention
+        self.keywords = tuple(doc.skills)
+        self.phrases = frozenset(job_hits.found(COVER_LETTERS.phrases))
+
+JOB_PROFILE_CACHE = LRUCache(
+    "job_profiles",
+    maxsize=int(os.getenv("JOB_PROFILE_CACHE_SIZE", "256")),
+    ttl=float(os.getenv("JOB_PROFILE_CACHE_TTL", "3600")),
+)
+
+def get_job_profile(job_description: Optional[str]) -> Optional[JobProfile]:
+    """Profile of a job description, or None when there is none."""
+    if not job_description:
+        return None
+    return JOB_PROFILE_CACHE.get_or_create(
+        content_hash(job_description), lambda: JobProfile(job_description)
+    )
+
+def _job_keywords(job_description: Optional[str]) -> Optional[tuple]:
+    profile = get_job_profile(job_description)
+    return profile.keywords if profile is not None else None
+
+def _keyword_score(resume: ResumeAnalysis, job_keywords: Optional[tuple], relevance: Optional[float] = None) -> tuple:
+    """Keyword points out of 25 and how many of the job's skills matched (0 under BM25 or without a job)."""
+    if job_keywords is None:
+        return 0, 0
+    if relevance is not None:
+        return min(25, round(25 * relevance)), 0
+    # Count the job's skills the resume mentions, under any of their aliases
+    matching_keywords = sum(1 for keyword in job_keywords if keyword in resume.skills)
+    return min(25, matching_keywords * 2), matching_keywords
+
+def _score_analyzed(resume: ResumeAnalysis, job_keywords: Optional[tuple], relevance: Optional[float] = None) -> dict:
     score = 0
     max_score = 100
     feedback = []
     suggestions = []
-    
-    text = body.resume_text.lower()
-    lines = body.resume_text.split('\n')
+    hits = resume.hits
     
     # Check for essential sections (20 points)
-    sections = {
-        'contact': ['email', 'phone', '@', '+1', 'linkedin'],
-        'experience': ['experience', 'work history', 'employment'],
-        'education': ['education', 'degree', 'university', 'college'],
-        'skills': ['skills', 'technologies', 'programming', 'languages']
-    }
-    
     section_score = 0
-    for section, keywords in sections.items():
-        if any(keyword in text for keyword in keywords):
+    for section, keywords in SECTION_KEYWORDS.items():
+        if hits.any(keywords):
             section_score += 5
         else:
             suggestions.append(f"Add a {section} section")
@@ -282,13 +742,7 @@ def score_resume(body: ResumeScoreBody):
     feedback.append(f"Section completeness: {section_score}/20 points")
     
     # Check for action verbs (15 points)
-    action_verbs = [
-        'developed', 'implemented', 'created', 'designed', 'managed', 'led',
-        'increased', 'improved', 'reduced', 'achieved', 'delivered', 'built',
-        'maintained', 'coordinated', 'supervised', 'trained', 'analyzed'
-    ]
-    
-    action_verb_count = sum(1 for verb in action_verbs if verb in text)
+    action_verb_count = len(hits.found(ACTION_VERBS))
     action_verb_score = min(15, action_verb_count * 2)
     score += action_verb_score
     feedback.append(f"Action verbs: {action_verb_score}/15 points ({action_verb_count} found)")
@@ -297,10 +751,7 @@ def score_resume(body: ResumeScoreBody):
         suggestions.append("Use more action verbs to describe your achievements")
     
     # Check for quantifiable achievements (20 points)
-    numbers = ['%', 'percent', 'million', 'thousand', 'hundred', 'dozen']
-    has_numbers = any(num in text for num in numbers) or any(char.isdigit() for char in text)
-    
-    if has_numbers:
+    if resume.has_numbers:
         score += 20
         feedback.append("Quantifiable achievements: 20/20 points")
     else:
@@ -308,36 +759,24 @@ def score_resume(body: ResumeScoreBody):
         suggestions.append("Add specific numbers and percentages to your achievements")
     
     # Check for keywords if job description provided (25 points)
-    if body.job_description:
-        job_desc_lower = body.job_description.lower()
-        job_keywords = set()
-        
-        # Extract common keywords from job description
-        common_keywords = [
-            'react', 'python', 'javascript', 'java', 'sql', 'aws', 'docker',
-            'kubernetes', 'agile', 'scrum', 'git', 'api', 'rest', 'html',
-            'css', 'node', 'typescript', 'angular', 'vue', 'django', 'flask',
-            'mongodb', 'postgresql', 'mysql', 'redis', 'jenkins', 'ci/cd',
-            'machine learning', 'ai', 'data science', 'analytics', 'testing',
-            'devops', 'cloud', 'microservices', 'leadership', 'management'
-        ]
-        
-        for keyword in common_keywords:
-            if keyword in job_desc_lower:
-                job_keywords.add(keyword)
+    keyword_score, matching_keywords = _keyword_score(resume, job_keywords, relevance)
+    score += keyword_score
+    if job_keywords is not None and relevance is not None:
+        feedback.append(f"Keyword relevance (BM25): {keyword_score}/25 points ({relevance:.2f} relevance)")
         
-        # Count matching keywords in resume
-        matching_keywords = sum(1 for keyword in job_keywords if keyword in text)
-        keyword_score = min(25, matching_keywords * 2)
-        score += keyword_score
+        if keyword_score < 10:
+            missing = [keyword for keyword in job_keywords if keyword not in resume.skills]
+            suggestions.append(f"Include more keywords from the job description: {', '.join(missing[:10])}")
+    elif job_keywords is not None:
         feedback.append(f"Keyword matching: {keyword_score}/25 points ({matching_keywords} matches)")
         
         if matching_keywords < 5:
-            suggestions.append(f"Include more keywords from the job description: {', '.join(list(job_keywords)[:10])}")
+            missing = [keyword for keyword in job_keywords if keyword not in resume.skills]
+            suggestions.append(f"Include more keywords from the job description: {', '.join(missing[:10])}")
     
     # Check formatting and length (20 points)
     # Good length: 1-2 pages (roughly 400-800 words)
-    word_count = len(text.split())
+    word_count = resume.word_count
     if 300 <= word_count <= 800:
         score += 10
         feedback.append("Resume length: 10/10 points")
@@ -349,7 +788,7 @@ def score_resume(body: ResumeScoreBody):
         suggestions.append("Condense your resume to 1-2 pages")
     
     # Check for bullet points
-    bullet_points = sum(1 for line in lines if line.strip().startswith(('-', '•', '*', '→')))
+    bullet_points = resume.bullet_points
     if bullet_points >= 5:
         score += 10
         feedback.append("Bullet points: 10/10 points")
@@ -382,6 +821,441 @@ def score_resume(body: ResumeScoreBody):
         "bullet_points": bullet_points
     }
 
+def _score_resume_result(body: ResumeScoreBody) -> dict:
+    relevance = None
+    if body.mode == "bm25" and body.job_description:
+        relevance = float(RELEVANCE.relevance_matrix([body.resume_text], [body.job_description])[0, 0])
+    return _score_analyzed(ResumeAnalysis(body.resume_text), _job_keywords(body.job_description), relevance)
+
+@app.post("/api/score-resume", openapi_extra=request_body_schema(ResumeScoreBody))
+async def score_resume(request: Request, body: ResumeScoreBody = Depends(json_body(ResumeScoreBody))):
+    """Score resume for ATS compatibility and provide improvement suggestions"""
+    key = _result_key("score-resume", body, SKILLS.fingerprint,
+                      RELEVANCE.stats_fingerprint() if body.mode == "bm25" else "")
+    cached = _cached_result(request, key)
+    if cached is not None:
+        return cached
+    fallback = _fallback_key("score-resume", body)
+    try:
+        result = await _run_admitted("score-resume", _score_resume_result, body)
+    except Overloaded:
+        stale = _stale_result(fallback)
+        if stale is None:
+            raise
+        return stale
+    return _store_result(key, ORJSONResponse(result), fallback)
+
+# ---------- /api/score-resume/batch ----------
+class ResumeScoreBatchBody(BaseModel):
+    resumes: List[LongText] = Field(..., min_length=1, max_length=MAX_BATCH_ITEMS)
+    job_descriptions: List[Optional[LongText]] = Field(default_factory=lambda: [None], min_length=1, max_length=MAX_BATCH_ITEMS)
+    job_title: Optional[ShortText] = None
+    top_k: Optional[int] = Field(None, ge=1, description="Only return the k best-scoring pairs")
+    mode: ScoringMode = "keywords"
+
+@app.post("/api/score-resume/batch", openapi_extra=request_body_schema(ResumeScoreBatchBody))
+async def score_resume_batch(request: Request):
+    """Score every resume against every job description (resumes x job_descriptions)
+
+    Takes and returns JSON or MessagePack (``Content-Type`` / ``Accept``).
+    """
+    body = await parse_body(request, ResumeScoreBatchBody, BATCH_REQUEST_MAX_BYTES, trust_internal=True)
+    try:
+        pairs = len(body.resumes) * len(body.job_descriptions)
+        if pairs > MAX_BATCH_PAIRS:
+            raise HTTPException(status_code=422, detail=f"Batch has {pairs} resume x job description pairs; "
+                                                        f"at most {MAX_BATCH_PAIRS} are scored per request")
+        result = await _run_admitted("score-resume-batch", _score_batch, body)
+    except (AttributeError, TypeError):
+        # A trusted body with a missing or wrongly typed field: validating it raises the
+        # 422 the untrusted path would have; if it passes, the failure was not the input's
+        build_model(ResumeScoreBatchBody, dict(body))
+        raise
+    return negotiated_response(request, result)
+
+def _score_batch(body: ResumeScoreBatchBody) -> dict:
+    # Each distinct text is analyzed once, however often it appears in the batch
+    resume_analyses = {}
+    for text in body.resumes:
+        if text not in resume_analyses:
+            resume_analyses[text] = ResumeAnalysis(text)
+    job_profiles = {}
+    for text in body.job_descriptions:
+        if text not in job_profiles:
+            job_profiles[text] = _job_keywords(text)
+
+    relevance = None
+    if body.mode == "bm25":
+        # One vectorized call covers every distinct resume x job description pair
+        resume_rows = {text: i for i, text in enumerate(resume_analyses)}
+        job_cols = {text: i for i, text in enumerate(t for t in job_profiles if t)}
+        relevance = RELEVANCE.relevance_matrix(list(resume_rows), list(job_cols)).tolist()
+
+    def pair_relevance(resume_text: str, job_description: Optional[str]) -> Optional[float]:
+        if relevance is None or not job_description:
+            return None
+        return relevance[resume_rows[resume_text]][job_cols[job_description]]
+
+    def result(resume_index: int, job_index: int) -> dict:
+        resume_text, job_description = body.resumes[resume_index], body.job_descriptions[job_index]
+        scored = _score_analyzed(resume_analyses[resume_text], job_profiles[job_description],
+                                 pair_relevance(resume_text, job_description))
+        scored["resume_index"] = resume_index
+        scored["job_index"] = job_index
+        return scored
+
+    jobs = len(body.job_descriptions)
+    total = len(body.resumes) * jobs
+    if body.top_k is None or body.top_k >= total:
+        return {"total": total, "results": [result(i, j) for i in range(len(body.resumes)) for j in range(jobs)]}
+
+    # Rank by score alone: a pair scores its resume's score without a job plus the
+    # keyword points, so full results (feedback, suggestions) are built for the top k only
+    base = {text: _score_analyzed(resume, None)["score"] for text, resume in resume_analyses.items()}
+    scores = (
+        (base[resume_text] + _keyword_score(resume_analyses[resume_text], job_profiles[job_description],
+                                            pair_relevance(resume_text, job_description))[0],
+         -(resume_index * jobs + job_index))
+        for resume_index, resume_text in enumerate(body.resumes)
+        for job_index, job_description in enumerate(body.job_descriptions)
+    )
+    # Highest scores first, input order among equal ones
+    top = heapq.nlargest(body.top_k, scores)
+    return {"total": total, "results": [result(*divmod(-index, jobs)) for _, index in top]}
+
+# ---------- /api/score-resume/session (incremental re-scoring) ----------
+class LineEdit(BaseModel):
+    op: Literal["insert", "replace", "delete"]
+    start: int = Field(..., ge=0, description="First affected line (0-based)")
+    end: Optional[int] = Field(None, ge=0, description="End of the replaced/deleted range (exclusive)")
+    lines: List[ShortText] = Field([], max_length=MAX_LIST_ITEMS)
+
+class ScoreSessionBody(BaseModel):
+    session_id: Optional[ShortText] = Field(None, description="From a previous response; resume_text always starts a new session")
+    version: Optional[int] = Field(None, description="Session version the edits were made against")
+    resume_text: Optional[LongText] = Field(None, description="Full text; starts or resets the session")
+    edits: List[LineEdit] = Field([], max_length=MAX_BATCH_ITEMS)
+    job_title: Optional[ShortText] = None
+    job_description: Optional[LongText] = None
+
+SCORE_SESSIONS = LRUCache(
+    "score_sessions",
+    maxsize=int(os.getenv("SCORE_SESSION_LIMIT", "1000")),
+    ttl=float(os.getenv("SCORE_SESSION_TTL", "1800")),
+)
+
+@app.post("/api/score-resume/session", openapi_extra=request_body_schema(ScoreSessionBody))
+@in_threads("score-resume-session")
+def score_resume_session(body: ScoreSessionBody = Depends(json_body(ScoreSessionBody))):
+    """Re-score a live editing session from line-level edits.
+
+    Sessions live in this process's memory, so this handler always runs in
+    the threadpool, and with several web workers an edit only finds its
+    session on the worker that created it. Clients resend resume_text after
+    a 404 (session expired or on another worker) or 409 (version mismatch).
+    Session ids are always minted here, so a client cannot take over another's.
+    """
+    if body.resume_text is not None:
+        session_id = uuid.uuid4().hex
+        session = ScoreSession(SCORING_AUTOMATON, body.resume_text, SKILLS)
+        SCORE_SESSIONS.set(session_id, session)
+    else:
+        session_id = body.session_id
+        session = SCORE_SESSIONS.get(session_id) if session_id else None
+        if session is None:
+            raise HTTPException(status_code=404, detail="Unknown or expired session; send resume_text")
+
+    with session.lock:
+        if body.version is not None and body.version != session.version:
+            raise HTTPException(status_code=409, detail=f"Session is at version {session.version}")
+        edits = []
+        line_count = len(session.lines)
+        # Line lengths as the edits will leave them, to cap the document at MAX_TEXT_CHARS
+        lengths = [len(line) for line in session.lines]
+        for edit in body.edits:
+            end = edit.start if edit.op == "insert" else (edit.end if edit.end is not None else edit.start + 1)
+            lines = [] if edit.op == "delete" else edit.lines
+            # Validate the whole batch first so a bad edit leaves the session untouched
+            if not edit.start <= end <= line_count:
+                raise HTTPException(status_code=422, detail=f"Line range {edit.start}:{end} is outside 0:{line_count}")
+            line_count += len(lines) - (end - edit.start)
+            lengths[edit.start:end] = [len(line) for line in lines]
+            edits.append((edit.start, end, lines))
+        if sum(lengths) + max(0, len(lengths) - 1) > MAX_TEXT_CHARS:
+            raise HTTPException(status_code=422, detail=f"Edits would make the resume longer than {MAX_TEXT_CHARS} characters")
+        for start, end, lines in edits:
+            session.replace(start, end, lines)
+        result = _score_analyzed(ResumeAnalysis.from_session(session), _job_keywords(body.job_description))
+        result.update(session_id=session_id, version=session.version, line_count=len(session.lines))
+    return result
+
+# ---------- Streaming request bodies (NDJSON records, text lines) ----------
+NDJSON_MAX_RECORD_BYTES = int(os.getenv("NDJSON_MAX_RECORD_BYTES", str(1024 * 1024)))
+
+async def _request_lines(request: Request):
+    """Yield (line_number, raw_line) as soon as each newline arrives (None for oversized lines).
+
+    Only the current partial line is buffered, so memory stays bounded by
+    NDJSON_MAX_RECORD_BYTES regardless of the upload size.
+    """
+    buffer = bytearray()
+    line_number = 0
+    skipping = False  # inside a record that already exceeded the limit
+    async for chunk in request.stream():
+        buffer += chunk
+        start = 0
+        while True:
+            end = buffer.find(b"\n", start)
+            if end == -1:
+                break
+            line_number += 1
+            if skipping:
+                skipping = False
+            elif end - start > NDJSON_MAX_RECORD_BYTES:
+                yield line_number, None
+            else:
+                yield line_number, bytes(buffer[start:end])
+            start = end + 1
+        del buffer[:start]
+        if len(buffer) > NDJSON_MAX_RECORD_BYTES or (skipping and buffer):
+            if not skipping:
+                yield line_number + 1, None
+                skipping = True
+            buffer.clear()
+    if buffer.strip() and not skipping:
+        yield line_number + 1, bytes(buffer)
+
+class _BodyStreamingResponse(StreamingResponse):
+    """StreamingResponse for generators that are still reading the request body.
+
+    Starlette's StreamingResponse watches ``receive()`` for client disconnects
+    while streaming, which would swallow the body chunks the generator is
+    waiting for. Here the body reader sees the disconnect instead.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+def _score_ndjson_line(raw: bytes, trusted: bool = False) -> dict:
+    if not trusted:
+        return _score_resume_result(ResumeScoreBody.model_validate_json(raw))
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        data = None
+    if not isinstance(data, dict):
+        # Only flat objects can skip validation; anything else gets the usual error record
+        return _score_resume_result(ResumeScoreBody.model_validate_json(raw))
+    try:
+        return _score_resume_result(build_model(ResumeScoreBody, data, trusted=True))
+    except (AttributeError, TypeError):
+        # A wrongly typed field: validating the record raises the ValidationError the
+        # untrusted path would have; if it somehow passes, the failure was not the input's
+        ResumeScoreBody.model_validate_json(raw)
+        raise
+
+def _stale_score_record(raw: bytes) -> Optional[dict]:
+    try:
+        body = ResumeScoreBody.model_validate_json(raw)
+    except ValidationError:
+        return None
+    stale = _stale_result(_fallback_key("score-resume", body))
+    if stale is None:
+        return None
+    result = orjson.loads(stale.body)
+    result["degraded"] = "stale"
+    return result
+
+@app.post("/api/score-resume/stream")
+async def score_resume_stream(request: Request):
+    """Score newline-delimited ResumeScoreBody records, one JSON result per line"""
+    CPU_ADMISSION.check()
+    trusted = is_trusted(request)
+
+    async def results():
+        async for line_number, raw in _request_lines(request):
+            if raw is None:
+                result = {"error": f"Record exceeds {NDJSON_MAX_RECORD_BYTES} bytes"}
+            elif not raw.strip():
+                continue
+            else:
+                try:
+                    result = await _run_admitted("score-resume-stream", _score_ndjson_line, raw, trusted)
+                except Overloaded as e:
+                    # Too late for a 503 once streaming: the record gets the last result for
+                    # its input, as /api/score-resume would serve, or a shed error of its own
+                    result = _stale_score_record(raw) or {"error": e.reason, "retry_after": e.retry_after}
+                except ValidationError as e:
+                    result = {"error": e.errors(include_url=False, include_context=False, include_input=False)}
+                except ValueError as e:
+                    # Trusted lines skip validation, so malformed JSON surfaces here
+                    result = {"error": str(e)}
+            result["line"] = line_number
+            yield orjson.dumps(result) + b"\n"
+
+    return _BodyStreamingResponse(results(), media_type="application/x-ndjson")
+
+# ---------- /api/improve-resume/stream (text in, text out, line by line) ----------
+# Longer lines are skipped with a marker instead of being rewritten
+IMPROVE_STREAM_MAX_LINE_CHARS = 10_000
+
+def _improve_stream_line(tone: Optional[str], line: str, has_digit: bool) -> str:
+    # Runs in a worker thread or pool process, which keeps its own line memo
+    return _memoized_improve_line(REWRITE_RULES.rules_for(tone), REWRITE_RULES.fingerprint, tone, line, has_digit)
+
+@app.post("/api/improve-resume/stream")
+async def improve_resume_stream(request: Request, tone: Optional[str] = "professional"):
+    """Improve a plain-text resume body line by line, streaming each line as soon as it is ready.
+
+    Produces the same text as /api/improve-resume; the trailing suggestions
+    come from totals kept while streaming, so no line is held after it is sent.
+    """
+    CPU_ADMISSION.check()
+    fingerprint = REWRITE_RULES.fingerprint
+
+    async def improved():
+        has_digits = False
+        bullet_count = 0
+        has_leadership = False
+        unchanged = 0
+        first = True
+        async for line_number, raw in _request_lines(request):
+            if raw is None:
+                line = f"[line {line_number} skipped: longer than {NDJSON_MAX_RECORD_BYTES} bytes]"
+            else:
+                line = raw.decode("utf-8", errors="replace").strip()
+                if not line:
+                    continue
+                if len(line) > IMPROVE_STREAM_MAX_LINE_CHARS:
+                    line = f"[line {line_number} skipped: longer than {IMPROVE_STREAM_MAX_LINE_CHARS} characters]"
+                    yield line if first else "\n" + line
+                    first = False
+                    continue
+                has_digit = DIGIT_RE.search(line) is not None
+                has_digits = has_digits or has_digit
+                bullet_count += line.startswith(("-", "•"))
+                if not has_leadership:
+                    lower = line.lower()
+                    has_leadership = any(word in lower for word in LEADERSHIP_WORDS)
+                # Memo hits are served inline; a rewrite goes off the event loop like any CPU work
+                improved_line = LINE_MEMO.get((fingerprint, tone, line))
+                if improved_line is None:
+                    try:
+                        improved_line = await _run_admitted("improve-resume-stream", _improve_stream_line,
+                                                            tone, line, has_digit)
+                    except Overloaded:
+                        # Too late for a 503 once streaming; pass the line through and say so at the end
+                        improved_line = line
+                        unchanged += 1
+                    else:
+                        if len(line) <= LINE_MEMO_MAX_CHARS:
+                            LINE_MEMO.set((fingerprint, tone, line), improved_line)
+                line = improved_line
+            yield line if first else "\n" + line
+            first = False
+        suggestions = _improvement_suggestions(has_digits, bullet_count, has_leadership)
+        if unchanged:
+            suggestions.append(f"⚠️ {unchanged} line(s) were returned unchanged because the server was busy; "
+                               "retry later")
+        if suggestions:
+            yield "\n\n" + "\n".join(suggestions)
+
+    return _BodyStreamingResponse(improved(), media_type="text/plain; charset=utf-8")
+
+# ---------- /api/generate-resume/bulk (JSON list or NDJSON in, ZIP out) ----------
+# Records rendered concurrently ahead of the one being written to the archive
+BULK_CONCURRENCY = int(os.getenv("BULK_CONCURRENCY", "8"))
+
+RESUME_EXTENSIONS = {"text": "txt", "markdown": "md", "html": "html", "pdf": "pdf"}
+
+def _bulk_entry_name(index: int, body: GenerateResumeRequest) -> str:
+    slug = "-".join("".join(ch if ch.isalnum() else " " for ch in body.full_name.lower()).split())[:60]
+    return f"{index:04d}-{slug or 'resume'}.{RESUME_EXTENSIONS[body.format]}"
+
+def _bulk_entry(body: GenerateResumeRequest) -> bytes:
+    rendered = _resume_output(body)
+    if body.format == "pdf":
+        return pdf_bytes(rendered, "Resume", body.full_name)
+    return rendered.encode("utf-8")
+
+async def _bulk_records(request: Request, records: Optional[list]):
+    """Yield (index, body, error) per record, from the parsed JSON list or NDJSON lines as they arrive."""
+    if records is not None:
+        for index, record in enumerate(records, 1):
+            try:
+                yield index, GenerateResumeRequest.model_validate(record), None
+            except ValidationError as e:
+                yield index, None, e.errors(include_url=False, include_context=False, include_input=False)
+        return
+    async for index, raw in _request_lines(request):
+        if raw is None:
+            yield index, None, f"Record exceeds {NDJSON_MAX_RECORD_BYTES} bytes"
+        elif raw.strip():
+            try:
+                yield index, GenerateResumeRequest.model_validate_json(raw), None
+            except ValidationError as e:
+                yield index, None, e.errors(include_url=False, include_context=False, include_input=False)
+
+@app.post("/api/generate-resume/bulk")
+async def generate_resume_bulk(request: Request):
+    """Render many GenerateResumeRequest records into a ZIP archive streamed entry by entry.
+
+    The body is a JSON (or MessagePack) list or, with an ``application/x-ndjson`` content type,
+    one record per line read as it arrives. Each record's ``format`` picks the
+    entry type; records that fail are listed in a final ``errors.ndjson``.
+    """
+    CPU_ADMISSION.check()
+    records = None
+    content_type = request.headers.get("content-type", "")
+    if "ndjson" not in content_type:
+        # A JSON (or MessagePack) list
+        records = decode(await read_body(request, BATCH_REQUEST_MAX_BYTES), content_type)
+        if not isinstance(records, list):
+            raise HTTPException(status_code=422, detail="Body must be a JSON list of resume payloads")
+
+    async def entries():
+        archive = ZipStream()
+        errors = []
+        pending = deque()
+
+        async def write_next():
+            index, body, task = pending.popleft()
+            try:
+                data = await task
+            except Overloaded as e:
+                errors.append({"record": index, "error": e.reason, "retry_after": e.retry_after})
+                return b""
+            except Exception as e:
+                errors.append({"record": index, "error": f"{type(e).__name__}: {e}"})
+                return b""
+            return await run_in_threadpool(archive.add, _bulk_entry_name(index, body), data, body.format != "pdf")
+
+        try:
+            async for index, body, error in _bulk_records(request, records):
+                error = error or _unknown_template(body)
+                if error:
+                    errors.append({"record": index, "error": error})
+                    continue
+                pending.append((index, body, asyncio.ensure_future(_run_admitted("generate-resume-bulk", _bulk_entry, body))))
+                if len(pending) >= BULK_CONCURRENCY:
+                    yield await write_next()
+            while pending:
+                yield await write_next()
+            if errors:
+                yield archive.add("errors.ndjson", "".join(json.dumps(e) + "\n" for e in errors).encode("utf-8"))
+            yield archive.close()
+        finally:
+            for _, _, task in pending:
+                task.cancel()
+
+    return _BodyStreamingResponse(
+        entries(),
+        media_type="application/zip",
+        headers={"Content-Disposition": 'attachment; filename="resumes.zip"'},
+    )
+
 # --- Health check & simple debug ---
 @app.get("/health")
 def health():
@@ -392,19 +1266,67 @@ def debug_origin():
     # Useful to see what origin and headers the server receives
     return {"frontend_url_env": os.getenv("FRONTEND_URL")}
 
+@app.get("/debug/cache")
+def debug_cache():
+    return {name: cache.stats() for name, cache in CACHES.items()}
+
+@app.get("/debug/admission")
+def debug_admission():
+    return {**CPU_ADMISSION.stats(), "degraded_responses": DEGRADED_RESPONSES,
+            "stale_served": LAST_RESULTS.stats()["hits"]}
+
+@app.get("/debug/limits")
+def debug_limits():
+    """Worker-thread limit per endpoint, as adapted to observed latency."""
+    return {name: threads.stats() for name, threads in LIMITERS.items()}
+
+def _service_metrics() -> List[str]:
+    caches = sorted(CACHES.items())
+    threads = sorted(LIMITERS.items())
+    admission = CPU_ADMISSION.stats()
+    return [
+        metric_family("cache_hits_total", "counter", "In-process cache hits",
+                      (({"cache": name}, cache.hits) for name, cache in caches)),
+        metric_family("cache_misses_total", "counter", "In-process cache misses",
+                      (({"cache": name}, cache.misses) for name, cache in caches)),
+        metric_family("cache_entries", "gauge", "Entries held by each in-process cache",
+                      (({"cache": name}, cache.stats()["size"]) for name, cache in caches)),
+        metric_family("cpu_tasks_in_flight", "gauge", "CPU-bound tasks running (admission slots in use)",
+                      [({}, admission["in_flight"])]),
+        metric_family("cpu_queue_depth", "gauge", "Requests waiting for a CPU slot", [({}, admission["queued"])]),
+        metric_family("cpu_tasks_admitted_total", "counter", "Requests given a CPU slot",
+                      [({}, admission["admitted"])]),
+        metric_family("cpu_requests_shed_total", "counter", "Requests refused by the CPU work queue",
+                      [({"reason": "queue_full"}, admission["rejected"]),
+                       ({"reason": "timeout"}, admission["timed_out"])]),
+        metric_family("degraded_responses_total", "counter", "Shed requests answered with a stale result",
+                      [({}, LAST_RESULTS.hits)]),
+        metric_family("thread_limit", "gauge", "Adaptive worker-thread limit per endpoint",
+                      (({"endpoint": name}, limiter.limit) for name, limiter in threads)),
+        metric_family("threads_in_flight", "gauge", "Worker threads in use per endpoint",
+                      (({"endpoint": name}, limiter.stats()["in_flight"]) for name, limiter in threads)),
+    ]
+
+# Async so rendering runs on the event loop thread, where the request metrics are recorded
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus text exposition of this process's request, cache and queue metrics."""
+    return PlainTextResponse(METRICS.render(_service_metrics()), media_type=METRICS_CONTENT_TYPE)
+
 @app.get("/debug/info")
 def debug_info():
     return {
         "frontend_url_env": os.getenv("FRONTEND_URL"),
         "allowed_origins": _ALLOWED_ORIGINS,
+        "cpu_workers": pool_workers(),
+        "llm": LLM.stats() if LLM is not None else None,
+        "skills": SKILLS.stats() if SKILLS.loaded else None,
+        "lazy_loads_ms": load_times(),
         "python_version": sys.version,
         "fastapi_version": "0.110+"
     }
 
-# --- Server startup ---
+# --- Server startup (production launcher: workers, preload, graceful restarts; see serve.py) ---
 if __name__ == "__main__":
-    import uvicorn
-    import os
-    port = int(os.environ.get("PORT", 8000))
-    print(f"🚀 Starting Resume AI Builder backend on port {port}")
-    uvicorn.run(app, host="0.0.0.0", port=port) 
\ No newline at end of file
+    import serve
+    serve.run(app) 
\ No newline at end of file
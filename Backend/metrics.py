@@ -0,0 +1,187 @@
+"""
+Prometheus metrics for the HTTP API, without a client library.
+
+``MetricsMiddleware`` is a pure ASGI middleware (no per-request task or
+body buffering, no route matching of its own) that records, per method
+and route template:
+
+    http_requests_total               counter, also by status
+    http_requests_in_flight           gauge, per method only
+    http_request_duration_seconds     histogram, also by status (until the last body byte is sent)
+    http_request_size_bytes           histogram (Content-Length, else bytes received)
+    http_response_size_bytes          histogram (body bytes sent)
+
+Recording takes no locks: every update happens on the event loop thread,
+so plain dict and list increments cannot interleave. ``render`` writes
+these plus any extra families (caches, queues) in the text exposition
+format. Values are per process, and every sample carries a ``worker``
+label (the process id). With several serve.py workers, a scrape reaches
+one of them, and each worker's series stays monotonic on its own. Aggregate
+with ``sum without (worker)``. A worker that is replaced starts new series.
+"""
+import os
+import time
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (128, 512, 2048, 8192, 32768, 131072, 524288, 2097152, 8388608, 33554432)
+
+# Label for requests no route matched (404s, scanners), so paths never become labels
+UNMATCHED = "<unmatched>"
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        # One slot per bucket plus +Inf; made cumulative only when rendered
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Labels, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(str(value))}"' for name, value in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _worker() -> Labels:
+    # Read at render time: serve.py forks its workers after this module is imported
+    return (("worker", str(os.getpid())),)
+
+
+def metric_family(name: str, kind: str, help_text: str, samples: Iterable[Tuple[Dict[str, Any], float]]) -> str:
+    """A counter or gauge family in exposition format; ``samples`` are (labels, value) pairs."""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    worker = _worker()
+    for labels, value in samples:
+        lines.append(f"{name}{_labels(worker + tuple(labels.items()))} {_number(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def _histogram_family(name: str, help_text: str, histograms: Dict[Labels, Histogram]) -> str:
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    worker = _worker()
+    for labels, histogram in sorted(histograms.items()):
+        labels = worker + labels
+        cumulative = 0
+        for bound, count in zip(histogram.buckets + ("+Inf",), histogram.counts):
+            cumulative += count
+            le = 'le="%s"' % (bound if bound == "+Inf" else _number(bound))
+            lines.append(f"{name}_bucket{_labels(labels, le)} {cumulative}")
+        lines.append(f"{name}_sum{_labels(labels)} {_number(histogram.sum)}")
+        lines.append(f"{name}_count{_labels(labels)} {cumulative}")
+    return "\n".join(lines) + "\n"
+
+
+class HTTPMetrics:
+    def __init__(self):
+        self.requests: Dict[Labels, int] = {}
+        self.in_flight: Dict[Labels, int] = {}
+        self.duration: Dict[Labels, Histogram] = {}
+        self.request_size: Dict[Labels, Histogram] = {}
+        self.response_size: Dict[Labels, Histogram] = {}
+
+    def record(self, route: Labels, status: int, seconds: float, received: int, sent: int) -> None:
+        key = route + (("status", str(status)),)
+        self.requests[key] = self.requests.get(key, 0) + 1
+        histogram = self.duration.get(key)
+        if histogram is None:
+            histogram = self.duration[key] = Histogram(LATENCY_BUCKETS)
+        histogram.observe(seconds)
+        histogram = self.request_size.get(route)
+        if histogram is None:
+            histogram = self.request_size[route] = Histogram(SIZE_BUCKETS)
+        histogram.observe(received)
+        histogram = self.response_size.get(route)
+        if histogram is None:
+            histogram = self.response_size[route] = Histogram(SIZE_BUCKETS)
+        histogram.observe(sent)
+
+    def render(self, extra: Iterable[str] = ()) -> str:
+        families = [
+            metric_family("http_requests_total", "counter", "HTTP requests completed",
+                          ((dict(labels), count) for labels, count in sorted(self.requests.items()))),
+            metric_family("http_requests_in_flight", "gauge", "HTTP requests being handled",
+                          ((dict(labels), count) for labels, count in sorted(self.in_flight.items()))),
+            _histogram_family("http_request_duration_seconds", "Time to the last response byte",
+                              self.duration),
+            _histogram_family("http_request_size_bytes", "Request body size", self.request_size),
+            _histogram_family("http_response_size_bytes", "Response body size", self.response_size),
+        ]
+        return "".join(families) + "".join(extra)
+
+
+METRICS = HTTPMetrics()
+
+
+class MetricsMiddleware:
+    """Records every HTTP request into ``METRICS``; add it last so it wraps the other middleware.
+
+    The route label is the template of the route the router picked (it sets
+    ``scope["route"]``), so no matching is repeated here. The route is only
+    known once routing is done, so the in-flight gauge, counted from the
+    moment a request arrives, is per method.
+    """
+
+    def __init__(self, app, metrics: HTTPMetrics = METRICS):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        start = time.perf_counter()
+        method = (("method", scope["method"]),)
+        in_flight = self.metrics.in_flight
+        in_flight[method] = in_flight.get(method, 0) + 1
+        state = [500, 0, 0]  # status, bytes received, bytes sent
+
+        length: Optional[bytes] = None
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                length = value
+                break
+        if length is not None:
+            state[1] = int(length) if length.isdigit() else 0
+            wrapped_receive = receive
+        else:
+            async def wrapped_receive():
+                message = await receive()
+                state[1] += len(message.get("body", b""))
+                return message
+
+        async def wrapped_send(message):
+            if message["type"] == "http.response.body":
+                state[2] += len(message.get("body", b""))
+            elif message["type"] == "http.response.start":
+                state[0] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, wrapped_receive, wrapped_send)
+        finally:
+            in_flight[method] -= 1
+            route = scope.get("route")
+            labels = method + (("route", route.path if route is not None else UNMATCHED),)
+            self.metrics.record(labels, state[0], time.perf_counter() - start, state[1], state[2])
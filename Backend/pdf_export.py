@@ -0,0 +1,159 @@
+"""
+Streaming PDF export of plain-text documents (generated resumes, cover letters).
+
+Produces the same layout as ``Frontend/src/utils/pdf.js``: A4, 48pt margins,
+a Helvetica-Bold title and the body in 11pt Courier wrapped to the page
+width. Only the PDF standard fonts are used, so no font files are embedded;
+their widths come from ``FONT_WIDTHS``, wrapped lines are memoized, and the
+font and resource objects are serialized once at import.
+
+``render_pdf`` is a generator: each page is written out as soon as it is
+laid out, with the page tree, cross-reference table and trailer last, so
+a response never holds more than one page of the document.
+"""
+import zlib
+from functools import lru_cache
+from typing import Iterator, List, Optional
+
+PAGE_WIDTH = 595.28
+PAGE_HEIGHT = 841.89
+MARGIN = 48
+TITLE_SIZE = 16
+TITLE_GAP = 22
+BODY_SIZE = 11
+LINE_HEIGHT = 14
+
+# Glyph widths in 1/1000 em; Courier is monospaced and the (Helvetica-Bold) title is not wrapped
+FONT_WIDTHS = {"Courier": 600}
+
+FONTS = {"F1": "Helvetica-Bold", "F2": "Courier"}
+
+# Object numbers: 1 catalog, 2 page tree (written last), 3.. fonts, then 2 per page
+_FIRST_FONT_OBJ = 3
+_FIRST_PAGE_OBJ = _FIRST_FONT_OBJ + len(FONTS)
+
+
+def _font_objects() -> List[bytes]:
+    return [f"<< /Type /Font /Subtype /Type1 /BaseFont /{base} /Encoding /WinAnsiEncoding >>".encode("ascii")
+            for base in FONTS.values()]
+
+
+_FONT_OBJECTS = _font_objects()
+_RESOURCES = ("<< /Font << " + " ".join(
+    f"/{name} {_FIRST_FONT_OBJ + i} 0 R" for i, name in enumerate(FONTS)) + " >> >>").encode("ascii")
+_CATALOG = b"<< /Type /Catalog /Pages 2 0 R >>"
+_HEADER = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"
+
+
+def chars_per_line(font: str = "Courier", size: float = BODY_SIZE, width: float = PAGE_WIDTH - 2 * MARGIN) -> int:
+    return int(width * 1000 // (FONT_WIDTHS[font] * size))
+
+
+@lru_cache(maxsize=65536)
+def wrap_line(line: str, limit: int) -> tuple:
+    """Split one line into chunks of at most ``limit`` characters, breaking at spaces where possible."""
+    line = line.rstrip()
+    if len(line) <= limit:
+        return (line,)
+    chunks = []
+    while len(line) > limit:
+        cut = line.rfind(" ", 0, limit + 1)
+        if cut <= 0:
+            chunks.append(line[:limit])
+            line = line[limit:]
+        else:
+            chunks.append(line[:cut])
+            line = line[cut + 1:]
+    chunks.append(line)
+    return tuple(chunks)
+
+
+def _pdf_string(text: str) -> bytes:
+    raw = text.encode("cp1252", errors="replace")
+    return b"(" + raw.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+
+def _page_content(lines: List[str], title: Optional[str], top: float) -> bytes:
+    ops = []
+    if title is not None:
+        ops.append(b"BT /F1 %d Tf %.2f %.2f Td %s Tj ET" % (TITLE_SIZE, MARGIN, PAGE_HEIGHT - MARGIN, _pdf_string(title)))
+    ops.append(b"BT /F2 %d Tf %d TL %.2f %.2f Td" % (BODY_SIZE, LINE_HEIGHT, MARGIN, PAGE_HEIGHT - top))
+    for i, line in enumerate(lines):
+        ops.append((_pdf_string(line) + b" Tj") if i == 0 else (b"T* " + _pdf_string(line) + b" Tj"))
+    ops.append(b"ET")
+    return zlib.compress(b"\n".join(ops), 6)
+
+
+def paginate(text: str, title: Optional[str] = None) -> Iterator[List[str]]:
+    """Yield the wrapped body lines of each page, same breaks as jsPDF in pdf.js."""
+    limit = chars_per_line()
+    bottom = PAGE_HEIGHT - MARGIN
+    y = MARGIN + (TITLE_GAP if title is not None else 0)
+    page: List[str] = []
+    for source_line in (text or "").split("\n"):
+        for line in wrap_line(source_line, limit):
+            if y > bottom:
+                yield page
+                page, y = [], MARGIN
+            page.append(line)
+            y += LINE_HEIGHT
+    yield page
+
+
+def render_pdf(text: str, title: Optional[str] = None, author: Optional[str] = None) -> Iterator[bytes]:
+    """Yield a complete PDF in chunks: header and fonts, then one chunk per page, then the trailer."""
+    offsets: List[int] = []
+    written = 0
+
+    def obj(number: int, body: bytes, stream: Optional[bytes] = None) -> bytes:
+        nonlocal written
+        while len(offsets) < number:
+            offsets.append(0)
+        offsets[number - 1] = written
+        if stream is None:
+            chunk = b"%d 0 obj\n%s\nendobj\n" % (number, body)
+        else:
+            chunk = b"%d 0 obj\n%s\nstream\n%s\nendstream\nendobj\n" % (number, body, stream)
+        written += len(chunk)
+        return chunk
+
+    head = [_HEADER]
+    written = len(_HEADER)
+    head.append(obj(1, _CATALOG))
+    for i, font in enumerate(_FONT_OBJECTS):
+        head.append(obj(_FIRST_FONT_OBJ + i, font))
+    yield b"".join(head)
+
+    kids = []
+    number = _FIRST_PAGE_OBJ
+    for index, lines in enumerate(paginate(text, title)):
+        first = index == 0
+        top = MARGIN + (TITLE_GAP if first and title is not None else 0)
+        content = _page_content(lines, title if first else None, top)
+        page = (b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %.2f %.2f] /Resources %s /Contents %d 0 R >>"
+                % (PAGE_WIDTH, PAGE_HEIGHT, _RESOURCES, number + 1))
+        chunk = obj(number, page)
+        chunk += obj(number + 1, b"<< /Length %d /Filter /FlateDecode >>" % len(content), content)
+        kids.append(number)
+        number += 2
+        yield chunk
+
+    tail = [obj(2, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % k for k in kids), len(kids)))]
+    info_number = number
+    info = b"<< /Producer (Resume AI Builder)"
+    if title:
+        info += b" /Title " + _pdf_string(title)
+    if author:
+        info += b" /Author " + _pdf_string(author)
+    tail.append(obj(info_number, info + b" >>"))
+    xref_at = written
+    tail.append(b"xref\n0 %d\n0000000000 65535 f \n" % (len(offsets) + 1))
+    tail.append(b"".join(b"%010d 00000 n \n" % offset for offset in offsets))
+    tail.append(b"trailer\n<< /Size %d /Root 1 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+                % (len(offsets) + 1, info_number, xref_at))
+    yield b"".join(tail)
+
+
+def pdf_bytes(text: str, title: Optional[str] = None, author: Optional[str] = None) -> bytes:
+    return b"".join(render_pdf(text, title, author))
@@ -3,7 +3,6 @@
 Railway-specific startup script
 """
 import os
-import sys
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -36,23 +35,7 @@ def ping():
     return {"pong": "ok"}
 
 if __name__ == "__main__":
-    import uvicorn
-    
-    # Railway sets PORT environment variable
-    port = int(os.environ.get("PORT", 8000))
-    
-    print(f"🚀 Starting Railway backend on port {port}")
-    print(f"🔧 Environment: PORT={os.environ.get('PORT', '8000')}")
+    # Railway sets PORT; workers, graceful shutdown and restarts come from serve.py
+    import serve
     print(f"🔧 Environment: FRONTEND_URL={os.environ.get('FRONTEND_URL', 'NOT SET')}")
-    
-    try:
-        uvicorn.run(
-            app,
-            host="0.0.0.0",
-            port=port,
-            log_level="info",
-            access_log=True
-        )
-    except Exception as e:
-        print(f"❌ Failed to start server: {e}")
-        sys.exit(1) 
\ No newline at end of file
+    serve.run(app)
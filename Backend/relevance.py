@@ -0,0 +1,171 @@
+"""
+BM25 relevance between resumes and job descriptions, vectorized with NumPy.
+
+The job description is the query and the resume the document. Document
+frequencies come from a corpus statistics file built offline and loaded at
+startup:
+
+    python relevance.py build data/relevance_stats.json postings.ndjson resumes/*.txt
+
+(``.ndjson`` inputs contribute their ``job_description`` and ``resume_text``
+fields, any other file is one document.) Without a statistics file every
+term gets the same IDF, BM25 degrades to saturated term overlap, and
+lengths are normalized against ``DEFAULT_AVGDL``, so a pair scores the
+same alone and in any batch.
+"""
+import json
+import os
+import re
+import sys
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+DEFAULT_STATS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "relevance_stats.json")
+
+# Average resume length in tokens (stopwords removed) assumed when no statistics are loaded;
+# roughly a one-page resume
+DEFAULT_AVGDL = 350.0
+
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+(?:[./-][a-z0-9+#]+)*")
+
+STOPWORDS = frozenset("""
+a about above after all also an and any are as at be been being both but by can could did do does
+for from had has have he her his how i if in into is it its just may me more most my no nor not of
+on or our out over own she should so some such than that the their them then there these they this
+those through to too under up us very was we were what when where which while who will with would
+you your
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    return [tok for tok in _TOKEN_RE.findall(text.lower()) if tok not in STOPWORDS]
+
+
+class CorpusStats:
+    """Document count, average length and per-term document frequencies."""
+
+    def __init__(self, n_docs: int = 0, total_length: int = 0, df: Optional[Dict[str, int]] = None):
+        self.n_docs = n_docs
+        self.total_length = total_length
+        self.df = df or {}
+
+    @property
+    def avgdl(self) -> Optional[float]:
+        return self.total_length / self.n_docs if self.n_docs else None
+
+    def add_document(self, text: str) -> None:
+        tokens = tokenize(text)
+        self.n_docs += 1
+        self.total_length += len(tokens)
+        for term in set(tokens):
+            self.df[term] = self.df.get(term, 0) + 1
+
+    def idf(self, terms: Sequence[str]) -> np.ndarray:
+        if not self.n_docs:
+            return np.ones(len(terms), dtype=np.float32)
+        df = np.fromiter((self.df.get(t, 0) for t in terms), dtype=np.float32, count=len(terms))
+        return np.log1p((self.n_docs - df + 0.5) / (df + 0.5)).astype(np.float32)
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"n_docs": self.n_docs, "total_length": self.total_length, "df": self.df}, f)
+
+    @classmethod
+    def load(cls, path: str) -> "CorpusStats":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["n_docs"], data["total_length"], data["df"])
+
+
+class BM25:
+    def __init__(self, stats: CorpusStats, k1: float = 1.5, b: float = 0.75):
+        self.stats = stats
+        self.k1 = k1
+        self.b = b
+
+    def relevance_matrix(self, resumes: Sequence[str], job_descriptions: Sequence[str]) -> np.ndarray:
+        """BM25 of every resume against every job description, as a (resumes x jobs) array.
+
+        Each column is divided by the score of a resume of average length that
+        mentions every query term once, then clipped, so values fall in [0, 1].
+        """
+        job_tokens = [set(tokenize(text)) for text in job_descriptions]
+        vocab = {term: i for i, term in enumerate(sorted(set().union(*job_tokens)))}
+        n_r, n_j, n_v = len(resumes), len(job_descriptions), len(vocab)
+        if not n_r or not n_j or not n_v:
+            return np.zeros((n_r, n_j), dtype=np.float32)
+
+        # Term frequencies of query terms only; other resume words just count towards length
+        flat, lengths = [], np.empty(n_r, dtype=np.float32)
+        for row, text in enumerate(resumes):
+            tokens = tokenize(text)
+            lengths[row] = len(tokens)
+            base = row * n_v
+            flat.extend(base + vocab[t] for t in tokens if t in vocab)
+        tf = np.bincount(np.asarray(flat, dtype=np.int64), minlength=n_r * n_v)
+        tf = tf.reshape(n_r, n_v).astype(np.float32)
+
+        avgdl = self.stats.avgdl or DEFAULT_AVGDL
+        norm = self.k1 * (1.0 - self.b + self.b * lengths / avgdl)
+        weights = tf * (self.k1 + 1.0) / (tf + norm[:, None])
+
+        query = np.zeros((n_j, n_v), dtype=np.float32)
+        for row, terms in enumerate(job_tokens):
+            query[row, [vocab[t] for t in terms]] = 1.0
+        query *= self.stats.idf(list(vocab))[None, :]
+
+        best = query.sum(axis=1)
+        scores = weights @ query.T
+        scores = np.divide(scores, best[None, :], out=np.zeros_like(scores), where=best[None, :] > 0)
+        return np.minimum(scores, 1.0, out=scores)
+
+
+_scorer = BM25(CorpusStats())
+
+
+def load_stats(path: Optional[str] = None) -> CorpusStats:
+    """Load corpus statistics for the shared scorer; missing files keep uniform IDF."""
+    path = path or os.getenv("RELEVANCE_STATS_PATH", DEFAULT_STATS_PATH)
+    if os.path.exists(path):
+        _scorer.stats = CorpusStats.load(path)
+    return _scorer.stats
+
+
+def stats_fingerprint() -> str:
+    """Identifies the loaded corpus statistics, e.g. for caches of BM25 results."""
+    stats = _scorer.stats
+    return f"{stats.n_docs}:{stats.total_length}:{len(stats.df)}"
+
+
+def relevance_matrix(resumes: Sequence[str], job_descriptions: Sequence[str]) -> np.ndarray:
+    return _scorer.relevance_matrix(resumes, job_descriptions)
+
+
+def _iter_documents(paths: Iterable[str]) -> Iterable[str]:
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            if not path.endswith(".ndjson"):
+                yield f.read()
+                continue
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    for field in ("job_description", "resume_text"):
+                        if record.get(field):
+                            yield record[field]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 4 or sys.argv[1] != "build":
+        print("usage: python relevance.py build OUTPUT.json INPUT [INPUT ...]")
+        sys.exit(1)
+    stats = CorpusStats()
+    for document in _iter_documents(sys.argv[3:]):
+        stats.add_document(document)
+    stats.save(sys.argv[2])
+    terms = Counter(stats.df).most_common(5)
+    print(f"✅ {stats.n_docs} documents, {len(stats.df)} terms, avg length {stats.avgdl or 0:.0f}")
+    print("Most common terms: " + ", ".join(f"{t} ({n})" for t, n in terms))
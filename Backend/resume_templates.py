@@ -0,0 +1,172 @@
+"""
+Server-side resume templates for /api/generate-resume.
+
+Templates are logic-less text files in ``data/templates`` (or
+``RESUME_TEMPLATES_DIR``) using a small Mustache subset:
+
+    {{name}}              value from the innermost context that has it
+    {{name|upper}}        value passed through a filter (upper, lower)
+    {{#name}}...{{/name}} repeated for each item of a list, or once if truthy
+    {{^name}}...{{/name}} rendered only if the value is missing or empty
+    {{! comment }}
+
+A line holding nothing but section tags or comments is dropped along with
+its newline, so templates can be laid out one tag per line.
+
+Each source is compiled once, at import, into a Python render function; a
+template name is looked up as ``<name>.<ext>`` and falls back to the shared
+``resume.<ext>`` layout. HTML output escapes every value, and the newline
+ending the last template line is not part of the output.
+"""
+import hashlib
+import html
+import json
+import os
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+DEFAULT_TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "templates")
+
+FORMAT_EXTENSIONS = {"text": "txt", "markdown": "md", "html": "html"}
+
+_TAG_RE = re.compile(r"\{\{([#^/!]?)\s*(.*?)\s*\}\}")
+_STANDALONE_RE = re.compile(r"^[ \t]*(?:\{\{[#^/!][^}]*\}\}[ \t]*)+$")
+
+FILTERS: Dict[str, Callable[[str], str]] = {
+    "upper": str.upper,
+    "lower": str.lower,
+}
+
+
+class TemplateError(ValueError):
+    pass
+
+
+def _lookup(stack: List[Any], name: str) -> Any:
+    if name == ".":
+        return stack[-1]
+    for scope in reversed(stack):
+        if isinstance(scope, dict) and name in scope:
+            return scope[name]
+    return None
+
+
+def _text(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def _strip_standalone(source: str) -> str:
+    # Keep the tags of a standalone line, drop its indentation and newline
+    return "".join(line.strip() if _STANDALONE_RE.match(line.rstrip("\r\n")) else line
+                   for line in source.splitlines(keepends=True))
+
+
+def _parse(source: str) -> list:
+    """Nested token list: literal strings, ("var", name, filters) and ("section"/"inverted", name, children)."""
+    root: list = []
+    stack: List[Tuple[Optional[str], list]] = [(None, root)]
+    pos = 0
+    for match in _TAG_RE.finditer(source):
+        if match.start() > pos:
+            stack[-1][1].append(source[pos:match.start()])
+        pos = match.end()
+        sigil, body = match.groups()
+        if sigil == "!":
+            continue
+        if sigil in ("#", "^"):
+            children: list = []
+            stack[-1][1].append(("section" if sigil == "#" else "inverted", body, children))
+            stack.append((body, children))
+        elif sigil == "/":
+            if stack[-1][0] != body:
+                raise TemplateError(f"Unexpected {{{{/{body}}}}}, open section is {stack[-1][0]!r}")
+            stack.pop()
+        else:
+            name, *filters = [part.strip() for part in body.split("|")]
+            unknown = [f for f in filters if f not in FILTERS]
+            if unknown:
+                raise TemplateError(f"Unknown filter(s) {unknown} in {{{{{body}}}}}")
+            stack[-1][1].append(("var", name, filters))
+    if len(stack) > 1:
+        raise TemplateError(f"Section {stack[-1][0]!r} is never closed")
+    if pos < len(source):
+        root.append(source[pos:])
+    return root
+
+
+def compile_template(source: str, escape: bool = False) -> Callable[[dict], str]:
+    """Compile template source into ``render(context) -> str``."""
+    lines = ["def render(context):", "    stack = [context]", "    out = []", "    emit = out.append"]
+    constants: Dict[str, Any] = {"_lookup": _lookup, "_text": _text, "_escape": html.escape, "_filters": FILTERS}
+    depth = [0]
+
+    def gen(tokens: list, indent: str) -> None:
+        for token in tokens:
+            if isinstance(token, str):
+                lines.append(f"{indent}emit({token!r})")
+                continue
+            kind, name, rest = token
+            if kind == "var":
+                expr = f"_text(_lookup(stack, {name!r}))"
+                for f in rest:
+                    expr = f"_filters[{f!r}]({expr})"
+                if escape:
+                    expr = f"_escape({expr})"
+                lines.append(f"{indent}emit({expr})")
+                continue
+            depth[0] += 1
+            value, item = f"value{depth[0]}", f"item{depth[0]}"
+            lines.append(f"{indent}{value} = _lookup(stack, {name!r})")
+            if kind == "inverted":
+                lines.append(f"{indent}if not {value}:")
+                gen(rest, indent + "    ")
+                lines.append(f"{indent}    pass")
+                continue
+            lines.append(f"{indent}if isinstance({value}, (list, tuple)):")
+            lines.append(f"{indent}    for {item} in {value}:")
+            lines.append(f"{indent}        stack.append({item})")
+            gen(rest, indent + "        ")
+            lines.append(f"{indent}        stack.pop()")
+            lines.append(f"{indent}elif {value}:")
+            lines.append(f"{indent}    stack.append({value})")
+            gen(rest, indent + "    ")
+            lines.append(f"{indent}    stack.pop()")
+
+    gen(_parse(_strip_standalone(source)), "    ")
+    lines.append("    return ''.join(out)")
+    namespace = dict(constants)
+    exec(compile("\n".join(lines), "<resume template>", "exec"), namespace)
+    return namespace["render"]
+
+
+class TemplateSet:
+    """Every (template, format) render function, compiled once from a templates directory."""
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory or os.getenv("RESUME_TEMPLATES_DIR", DEFAULT_TEMPLATES_DIR)
+        with open(os.path.join(self.directory, "index.json"), encoding="utf-8") as f:
+            self.info: Dict[str, dict] = json.load(f)
+        self._renderers: Dict[Tuple[str, str], Callable[[dict], str]] = {}
+        digest = hashlib.blake2b(json.dumps(self.info, sort_keys=True).encode("utf-8"), digest_size=8)
+        for name in self.info:
+            for fmt, ext in FORMAT_EXTENSIONS.items():
+                path = os.path.join(self.directory, f"{name}.{ext}")
+                if not os.path.exists(path):
+                    path = os.path.join(self.directory, f"resume.{ext}")
+                with open(path, encoding="utf-8") as f:
+                    source = f.read()
+                digest.update(source.encode("utf-8"))
+                self._renderers[(name, fmt)] = compile_template(source, escape=fmt == "html")
+        # Identifies these template sources, e.g. for caches of rendered output
+        self.fingerprint = digest.hexdigest()
+
+    def names(self) -> List[str]:
+        return list(self.info)
+
+    def render(self, name: str, fmt: str, context: dict) -> str:
+        try:
+            renderer = self._renderers[(name, fmt)]
+        except KeyError:
+            raise KeyError(f"Unknown template {name!r} or format {fmt!r}") from None
+        out = renderer(dict(context, template=name))
+        return out[:-1] if out.endswith("\n") else out
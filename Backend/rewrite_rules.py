@@ -0,0 +1,126 @@
+"""
+Compiled word-rewrite rules for improve_resume.
+
+Rules live in ``data/rewrite_rules.json`` (or ``REWRITE_RULES_PATH``), one
+entry per tone; a tone may ``extend`` another and unknown tones use
+``default``. Every tone is compiled into a single case-insensitive,
+word-boundary-aware regex plus a dispatch table, so a line is rewritten in
+one pass. Edits to the file are picked up without a restart.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, Optional
+
+from keyword_engine import trie_pattern
+
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "rewrite_rules.json")
+
+
+def _match_case(source: str, replacement: str) -> str:
+    if len(source) > 1 and source.isupper():
+        return replacement.upper()
+    if source[:1].isupper():
+        return replacement[:1].upper() + replacement[1:]
+    return replacement
+
+
+class RuleSet:
+    """All rewrites of one tone, compiled into one regex over the lowercased line."""
+
+    def __init__(self, rewrites: Dict[str, str]):
+        self.dispatch = {weak.lower(): strong for weak, strong in rewrites.items()}
+        # Trie-shaped alternation: greedy, so "did work" wins over "did"
+        body = r"\b(?:" + trie_pattern(self.dispatch) + r")\b"
+        self._regex = re.compile(body) if self.dispatch else None
+        self._regex_ci = re.compile(body, re.IGNORECASE) if self.dispatch else None
+        self._cased: Dict[str, str] = {}
+
+    def _cased_replacement(self, found: str) -> str:
+        replacement = self._cased.get(found)
+        if replacement is None:
+            replacement = _match_case(found, self.dispatch[found.lower()])
+            if len(self._cased) < 4096:
+                self._cased[found] = replacement
+        return replacement
+
+    def apply(self, line: str) -> str:
+        if self._regex is None:
+            return line
+        lower = line.lower()
+        if len(lower) != len(line):
+            # Rare characters whose lowercase form is longer; offsets would not line up
+            return self._regex_ci.sub(lambda m: self._cased_replacement(m.group(0)), line)
+        parts = []
+        last = 0
+        for match in self._regex.finditer(lower):
+            start, end = match.span()
+            parts.append(line[last:start])
+            parts.append(self._cased_replacement(line[start:end]))
+            last = end
+        if not parts:
+            return line
+        parts.append(line[last:])
+        return "".join(parts)
+
+
+class RuleEngine:
+    """Loads tone rule sets from a JSON file and recompiles them when it changes."""
+
+    def __init__(self, path: Optional[str] = None, check_interval: float = 1.0):
+        self.path = path or os.getenv("REWRITE_RULES_PATH", DEFAULT_RULES_PATH)
+        self.check_interval = check_interval
+        self._rules: Dict[str, RuleSet] = {}
+        self._mtime: Optional[float] = None
+        self._fingerprint = ""
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+        self.reload()
+
+    def reload(self) -> None:
+        with open(self.path, "rb") as f:
+            raw = f.read()
+        tones = json.loads(raw)["tones"]
+
+        def rewrites(name: str, seen: tuple = ()) -> Dict[str, str]:
+            tone = tones[name]
+            merged = dict(rewrites(tone["extends"], seen + (name,))) if tone.get("extends") and name not in seen else {}
+            merged.update(tone.get("rewrites", {}))
+            return merged
+
+        compiled = {name: RuleSet(rewrites(name)) for name in tones}
+        compiled.setdefault("default", RuleSet({}))
+        self._rules = compiled
+        self._fingerprint = hashlib.blake2b(raw, digest_size=8).hexdigest()
+        self._mtime = os.stat(self.path).st_mtime
+
+    def _reload_if_changed(self) -> None:
+        now = time.monotonic()
+        if now < self._next_check or not self._lock.acquire(blocking=False):
+            return
+        try:
+            self._next_check = now + self.check_interval
+            if os.stat(self.path).st_mtime != self._mtime:
+                self.reload()
+        except (OSError, ValueError, KeyError):
+            # Keep serving the last good rules while the file is being edited
+            pass
+        finally:
+            self._lock.release()
+
+    @property
+    def fingerprint(self) -> str:
+        """Identifies the current rule set, e.g. for caches of rewritten lines.
+
+        Checks the file first, so a process that only builds cache keys (the
+        web process when CPU_WORKERS > 0) still notices edits.
+        """
+        self._reload_if_changed()
+        return self._fingerprint
+
+    def rules_for(self, tone: Optional[str]) -> RuleSet:
+        self._reload_if_changed()
+        return self._rules.get(tone or "default") or self._rules["default"]
@@ -0,0 +1,86 @@
+"""
+Per-line feature bookkeeping for incremental resume scoring.
+
+A session keeps the resume as a list of lines plus the scoring features of
+every line (keyword and skill counts, word count, digit and bullet flags)
+and their running totals. Applying an edit subtracts the features of the removed
+lines and adds those of the inserted ones, so re-scoring costs time
+proportional to the edit rather than to the whole document. No dictionary
+term or skill alias spans a newline, so per-line counts add up to exactly
+what a scan of the full text finds.
+"""
+import threading
+from typing import Dict, List, Optional
+
+from document import BULLET_PREFIXES, DIGIT_RE
+from keyword_engine import KeywordAutomaton, KeywordHits
+from skill_taxonomy import SkillTaxonomy
+
+
+class LineFeatures:
+    __slots__ = ("counts", "skills", "words", "digit", "bullet")
+
+    def __init__(self, automaton: KeywordAutomaton, line: str, taxonomy: Optional[SkillTaxonomy] = None):
+        self.counts = automaton.scan(line.lower()).counts
+        self.skills = taxonomy.scan(line) if taxonomy is not None else {}
+        self.words = len(line.split())
+        self.digit = DIGIT_RE.search(line) is not None
+        self.bullet = line.strip().startswith(BULLET_PREFIXES)
+
+
+class ScoreSession:
+    """Line-addressed resume with incrementally maintained feature totals."""
+
+    __slots__ = ("automaton", "taxonomy", "lines", "features", "term_counts", "skill_counts",
+                 "word_count", "digit_lines", "bullet_lines", "version", "lock")
+
+    def __init__(self, automaton: KeywordAutomaton, text: str, taxonomy: Optional[SkillTaxonomy] = None):
+        self.automaton = automaton
+        self.taxonomy = taxonomy
+        self.lines: List[str] = []
+        self.features: List[LineFeatures] = []
+        self.term_counts: Dict[str, int] = {}
+        self.skill_counts: Dict[str, int] = {}
+        self.word_count = 0
+        self.digit_lines = 0
+        self.bullet_lines = 0
+        self.version = 0
+        self.lock = threading.Lock()
+        self.replace(0, 0, text.split('\n'))
+        self.version = 0
+
+    @staticmethod
+    def _merge(counts: Dict[str, int], delta: Dict[str, int], sign: int) -> None:
+        for term, n in delta.items():
+            total = counts.get(term, 0) + sign * n
+            if total:
+                counts[term] = total
+            else:
+                del counts[term]
+
+    def _add(self, features: LineFeatures, sign: int) -> None:
+        self._merge(self.term_counts, features.counts, sign)
+        self._merge(self.skill_counts, features.skills, sign)
+        self.word_count += sign * features.words
+        self.digit_lines += sign * features.digit
+        self.bullet_lines += sign * features.bullet
+
+    def replace(self, start: int, end: int, new_lines: List[str]) -> None:
+        """Replace ``lines[start:end]`` with ``new_lines`` (insert: start == end, delete: no lines)."""
+        if not 0 <= start <= end <= len(self.lines):
+            raise IndexError(f"Line range {start}:{end} is outside 0:{len(self.lines)}")
+        for features in self.features[start:end]:
+            self._add(features, -1)
+        added = [LineFeatures(self.automaton, line, self.taxonomy) for line in new_lines]
+        for features in added:
+            self._add(features, 1)
+        self.lines[start:end] = new_lines
+        self.features[start:end] = added
+        self.version += 1
+
+    def hits(self) -> KeywordHits:
+        # No full text is kept, so positions are not available from session hits
+        return KeywordHits(None, dict(self.term_counts))
+
+    def skills(self) -> Dict[str, int]:
+        return dict(self.skill_counts)
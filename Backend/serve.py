@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Production launcher: a pre-forking supervisor of uvicorn workers.
+
+    python serve.py [--workers N] [--host HOST] [--port PORT]
+
+The supervisor binds the socket, imports the app and builds every lazily
+loaded dependency (``lazy.preload``) once, then forks the workers. They
+share that memory copy-on-write and accept on the same socket. Worker
+count comes from ``WEB_CONCURRENCY``, else one per available CPU (affinity
+and cgroup quota) capped by the cgroup memory limit over
+``WORKER_MEMORY_MB``. uvicorn's ``auto`` loop and HTTP settings pick
+uvloop and httptools when they are installed.
+
+Signals to the supervisor:
+    SIGTERM, SIGINT  graceful shutdown (in-flight requests get GRACEFUL_TIMEOUT seconds)
+    SIGHUP           rolling restart: each worker is replaced only once its successor is serving
+    SIGTTIN, SIGTTOU one worker more / less
+
+Workers that die unexpectedly are replaced. A rolling restart re-forks
+from the preloaded supervisor, so it recycles workers (memory, state,
+data files read on first use) but not the code; deploys restart the
+supervisor.
+"""
+import argparse
+import os
+import select
+import signal
+import socket
+import sys
+import time
+import traceback
+from typing import Dict, Optional
+
+import uvicorn
+
+from lazy import preload
+from workers import available_cpus
+
+GRACEFUL_TIMEOUT = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+
+# Resident memory budgeted per worker when sizing from the cgroup memory limit
+WORKER_MEMORY_MB = int(os.getenv("WORKER_MEMORY_MB", "256"))
+
+# uvicorn's per-request log line; 0 saves its cost on every request
+ACCESS_LOG = os.getenv("ACCESS_LOG", "1") == "1"
+
+# Longest a new worker may take to start serving before it is given up on
+WORKER_START_TIMEOUT = 60
+
+
+def _cgroup_memory_limit() -> Optional[int]:
+    """Bytes the container may use (cgroup v2 ``memory.max``, else v1), None when unlimited."""
+    for path in ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory/memory.limit_in_bytes"):
+        try:
+            with open(path) as f:
+                value = f.read().strip()
+        except OSError:
+            continue
+        # v1 reports "unlimited" as a huge number
+        return None if value == "max" or int(value) >= 1 << 60 else int(value)
+    return None
+
+
+def default_workers() -> int:
+    value = os.getenv("WEB_CONCURRENCY", "").strip()
+    if value:
+        return max(1, int(value))
+    workers = available_cpus()
+    memory = _cgroup_memory_limit()
+    if memory is not None:
+        workers = min(workers, memory // (WORKER_MEMORY_MB * 1024 * 1024))
+    return max(1, workers)
+
+
+class _Server(uvicorn.Server):
+    """uvicorn server that tells the supervisor once it is accepting connections."""
+
+    def __init__(self, config: uvicorn.Config, ready_fd: int):
+        super().__init__(config)
+        self.ready_fd = ready_fd
+
+    async def startup(self, sockets=None) -> None:
+        await super().startup(sockets=sockets)
+        if self.started:
+            os.write(self.ready_fd, b"1")
+        os.close(self.ready_fd)
+
+
+class Supervisor:
+    def __init__(self, config: uvicorn.Config, sock: socket.socket, workers: int):
+        self.config = config
+        self.sock = sock
+        self.target = workers
+        self.workers: Dict[int, float] = {}  # pid -> start time
+        self.signals: list = []
+
+    def spawn(self) -> Optional[int]:
+        """Fork a worker and wait until it serves; None (worker reaped) if it does not."""
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            # uvicorn handles SIGINT/SIGTERM while serving and re-raises them once
+            # it has shut down; these handlers absorb that so the worker exits 0
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                signal.signal(sig, lambda *_: None)
+            for sig in (signal.SIGHUP, signal.SIGTTIN, signal.SIGTTOU, signal.SIGCHLD):
+                signal.signal(sig, signal.SIG_DFL)
+            code = 0
+            try:
+                _Server(self.config, write_fd).run(sockets=[self.sock])
+            except BaseException:
+                traceback.print_exc()
+                code = 1
+            os._exit(code)
+        os.close(write_fd)
+        ready = select.select([read_fd], [], [], WORKER_START_TIMEOUT)[0] and os.read(read_fd, 1) == b"1"
+        os.close(read_fd)
+        if not ready:
+            self.stop(pid)
+            return None
+        self.workers[pid] = time.monotonic()
+        return pid
+
+    def stop(self, pid: int) -> None:
+        """Gracefully stop one worker, killing it if it outlives the graceful timeout."""
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+        deadline = time.monotonic() + GRACEFUL_TIMEOUT + 5
+        while time.monotonic() < deadline:
+            try:
+                done, _ = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if done:
+                break
+            time.sleep(0.05)
+        else:
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+        self.workers.pop(pid, None)
+
+    def reap(self) -> None:
+        while self.workers:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if not pid:
+                return
+            if self.workers.pop(pid, None) is not None:
+                print(f"⚠️  Worker {pid} exited ({os.waitstatus_to_exitcode(status)}), replacing it", flush=True)
+
+    def rolling_restart(self) -> None:
+        for pid in list(self.workers):
+            if self.spawn() is None:
+                print("❌ Replacement worker failed to start; keeping the running workers", flush=True)
+                return
+            self.stop(pid)
+        print(f"🔄 Rolling restart done ({len(self.workers)} workers)", flush=True)
+
+    def run(self) -> None:
+        for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP, signal.SIGTTIN, signal.SIGTTOU):
+            signal.signal(sig, lambda sig, _: self.signals.append(sig))
+        failures = 0
+        while True:
+            while self.signals:
+                sig = self.signals.pop(0)
+                if sig in (signal.SIGTERM, signal.SIGINT):
+                    return self.shutdown()
+                if sig == signal.SIGHUP:
+                    self.rolling_restart()
+                elif sig == signal.SIGTTIN:
+                    self.target += 1
+                elif sig == signal.SIGTTOU and self.target > 1:
+                    self.target -= 1
+                    self.stop(max(self.workers, key=self.workers.get))
+            self.reap()
+            while len(self.workers) < self.target and not self.signals:
+                if self.spawn() is None:
+                    # Back off instead of fork-looping on a worker that cannot start
+                    failures += 1
+                    time.sleep(min(30, 2 ** failures))
+                else:
+                    failures = 0
+            time.sleep(0.2)
+
+    def shutdown(self) -> None:
+        for pid in self.workers:
+            os.kill(pid, signal.SIGTERM)
+        for pid in list(self.workers):
+            self.stop(pid)
+
+
+def run(app="main:app", host: Optional[str] = None, port: Optional[int] = None,
+        workers: Optional[int] = None) -> None:
+    """Serve ``app`` (an app or ``"module:attribute"``) with preloaded, supervised workers."""
+    host = host or os.getenv("HOST", "0.0.0.0")
+    port = port if port is not None else int(os.getenv("PORT", "8000"))
+    workers = workers or default_workers()
+    config = uvicorn.Config(app, host=host, port=port, loop="auto", http="auto", proxy_headers=True,
+                            timeout_graceful_shutdown=GRACEFUL_TIMEOUT, access_log=ACCESS_LOG)
+    sock = config.bind_socket()
+    # asyncio only sets TCP_NODELAY on sockets created with proto=IPPROTO_TCP, which
+    # bind_socket's are not; without it keep-alive responses wait on delayed ACKs (~40 ms).
+    # Accepted connections inherit the option from the listening socket.
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    config.load()
+    config.setup_event_loop()
+    # Built once here and shared copy-on-write by every worker
+    preload()
+    loop = "uvloop" if "uvloop" in sys.modules else "asyncio"
+    http = "httptools" if config.http_protocol_class.__module__.endswith("httptools_impl") else "h11"
+    print(f"🚀 Starting Resume AI Builder backend on port {port} with {workers} workers ({loop}, {http})",
+          flush=True)
+    Supervisor(config, sock, workers).run()
+    sock.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve the API with preloaded, supervised uvicorn workers")
+    parser.add_argument("--workers", type=int, help="default: WEB_CONCURRENCY, else one per available CPU")
+    parser.add_argument("--host", help="default: HOST or 0.0.0.0")
+    parser.add_argument("--port", type=int, help="default: PORT or 8000")
+    args = parser.parse_args()
+    run(host=args.host, port=args.port, workers=args.workers)
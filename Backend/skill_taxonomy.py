@@ -0,0 +1,379 @@
+"""
+Skill taxonomy: canonical skills with aliases and categories, matched on whole words.
+
+The source is ``data/skills.txt`` (or ``SKILL_TAXONOMY_PATH``). It is
+compiled into a compact binary index (``data/skills.idx`` next to it, or
+``SKILL_INDEX_PATH``; the temp directory if that is not writable) the
+first time it is loaded, and rebuilt only when the source changes: the
+source hash is in the index header. The index is memory-mapped read-only,
+so every uvicorn or pool worker on the host shares the same pages, and
+opening it reads nothing but the header - no parsing, no per-process copy.
+
+Texts and aliases go through the same tokenizer (punctuation inside a word
+is kept, as in ``c++``, ``c#`` and ``node.js``; everything else separates
+words) and lookup walks a word-level trie: at each word the longest alias
+starting there wins and matching resumes after it. Matches never cross a
+line break, so per-line counts add up to the count over the whole text.
+
+    python skill_taxonomy.py build [SOURCE [INDEX]]
+    python skill_taxonomy.py scan "Led a k8s migration; Postgres, JS and Go"
+"""
+import hashlib
+import mmap
+import os
+import re
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "skills.txt")
+
+_TOKEN_RE = re.compile(r"[^\W_](?:[^\W_]|\.(?=[^\W_]))*[+#]*|(?<![^\W_])\.[^\W_]+")
+
+# Header: magic, format version, byte-order marker, source hash, then the section sizes;
+# sections follow as native uint32 arrays (strings, nodes, edges, skills, categories), then the UTF-8 blob
+_MAGIC = b"SKILLIDX"
+_VERSION = 1
+_BYTE_ORDER = 0x01020304
+_HEADER = struct.Struct("=8sII16s7I")
+
+
+def tokenize(text: str) -> List[str]:
+    """Words of ``text`` with their original case."""
+    return _TOKEN_RE.findall(text)
+
+
+def _parse(source: str) -> Tuple[List[str], List[Tuple[str, int, List[str]]]]:
+    """Categories and (name, category index, aliases) of every skill in the source."""
+    categories: List[str] = []
+    skills = []
+    for number, line in enumerate(source.splitlines(), 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("[") and line.endswith("]"):
+            categories.append(line[1:-1].strip())
+            continue
+        if not categories:
+            raise ValueError(f"line {number}: skill outside of a [Category] section")
+        aliases = [alias.strip() for alias in line.split("|") if alias.strip()]
+        skills.append((aliases[0].lstrip("^"), len(categories) - 1, aliases))
+    return categories, skills
+
+
+def build_index(source: str) -> bytes:
+    """Compile taxonomy source text into the binary index format."""
+    categories, skills = _parse(source)
+    skills.sort(key=lambda skill: skill[0].encode("utf-8"))
+
+    # (lowercase words) -> (skill index, exact-case form or None)
+    entries: Dict[Tuple[str, ...], Tuple[int, Optional[str]]] = {}
+    for index, (name, _, aliases) in enumerate(skills):
+        for alias in aliases:
+            exact = alias.startswith("^")
+            words = tokenize(alias.lstrip("^"))
+            if not words:
+                raise ValueError(f"{name}: alias {alias!r} has no words")
+            key = tuple(word.lower() for word in words)
+            previous = entries.get(key)
+            if previous is not None and previous[0] != index:
+                raise ValueError(f"alias {alias!r} of {name!r} is already an alias of {skills[previous[0]][0]!r}")
+            if previous is None or previous[1] is not None:
+                # A case-insensitive alias of the same skill subsumes an exact one
+                entries[key] = (index, " ".join(words) if exact else None)
+
+    strings: List[str] = sorted({word for key in entries for word in key}, key=lambda w: w.encode("utf-8"))
+    token_ids = {word: i for i, word in enumerate(strings)}
+
+    def intern(text: str) -> int:
+        strings.append(text)
+        return len(strings) - 1
+
+    # Trie with node 0 as the root; children are kept sorted by token id
+    children: List[Dict[int, int]] = [{}]
+    terminal: Dict[int, Tuple[int, Optional[str]]] = {}
+    for key, value in entries.items():
+        node = 0
+        for word in key:
+            token = token_ids[word]
+            child = children[node].get(token)
+            if child is None:
+                child = len(children)
+                children.append({})
+                children[node][token] = child
+            node = child
+        terminal[node] = value
+
+    first_edge, node_skill, node_exact = array("I"), array("I"), array("I")
+    edge_tokens, edge_children = array("I"), array("I")
+    for node, edges in enumerate(children):
+        first_edge.append(len(edge_tokens))
+        skill, exact = terminal.get(node, (-1, None))
+        node_skill.append(skill + 1)
+        node_exact.append(intern(exact) + 1 if exact is not None else 0)
+        for token in sorted(edges):
+            edge_tokens.append(token)
+            edge_children.append(edges[token])
+    first_edge.append(len(edge_tokens))
+
+    skill_names, skill_categories = array("I"), array("I")
+    for name, category, _ in skills:
+        skill_names.append(intern(name))
+        skill_categories.append(category)
+    category_names = array("I", [intern(category) for category in categories])
+
+    blob = bytearray()
+    string_offsets = array("I")
+    for text in strings:
+        string_offsets.append(len(blob))
+        blob += text.encode("utf-8")
+    string_offsets.append(len(blob))
+
+    sections = [
+        string_offsets,
+        first_edge + node_skill + node_exact,
+        edge_tokens + edge_children,
+        skill_names + skill_categories,
+        category_names,
+        bytes(blob),
+    ]
+    header = _HEADER.pack(_MAGIC, _VERSION, _BYTE_ORDER, hashlib.blake2b(source.encode("utf-8"), digest_size=16).digest(),
+                          len(strings), len(token_ids), len(children), len(edge_tokens), len(skills), len(categories),
+                          len(blob))
+    return header + b"".join(bytes(section) for section in sections)
+
+
+def _source_hash(path: str) -> bytes:
+    with open(path, encoding="utf-8") as f:
+        return hashlib.blake2b(f.read().encode("utf-8"), digest_size=16).digest()
+
+
+def _index_hash(path: str) -> Optional[bytes]:
+    try:
+        with open(path, "rb") as f:
+            magic, version, order, digest, *_ = _HEADER.unpack(f.read(_HEADER.size))
+    except (OSError, struct.error):
+        return None
+    return digest if (magic, version, order) == (_MAGIC, _VERSION, _BYTE_ORDER) else None
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    # Workers starting together may all build; each rename swaps in a complete file
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".skills-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def ensure_index(source_path: str, index_path: Optional[str] = None) -> str:
+    """Path of an index that is up to date with ``source_path``, building it if needed."""
+    candidates = [index_path or os.path.splitext(source_path)[0] + ".idx"]
+    digest = _source_hash(source_path)
+    candidates.append(os.path.join(tempfile.gettempdir(), f"skills-{digest.hex()[:16]}.idx"))
+    for path in candidates:
+        if _index_hash(path) == digest:
+            return path
+    with open(source_path, encoding="utf-8") as f:
+        data = build_index(f.read())
+    for path in candidates:
+        try:
+            _write_atomic(path, data)
+            return path
+        except OSError:
+            continue
+    raise OSError(f"No writable location for the skill index of {source_path}")
+
+
+class SkillTaxonomy:
+    """Read-only view of a memory-mapped skill index."""
+
+    def __init__(self, path: Optional[str] = None, index_path: Optional[str] = None, token_cache_size: int = 100_000):
+        self.path = path or os.getenv("SKILL_TAXONOMY_PATH", DEFAULT_TAXONOMY_PATH)
+        index_path = index_path or os.getenv("SKILL_INDEX_PATH")
+        if os.path.exists(self.path):
+            self.index_path = ensure_index(self.path, index_path)
+        else:
+            # Deployments may ship the compiled index alone
+            self.index_path = index_path or os.path.splitext(self.path)[0] + ".idx"
+        with open(self.index_path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        (magic, version, order, digest, n_strings, n_tokens, n_nodes, n_edges,
+         n_skills, n_categories, n_blob) = _HEADER.unpack_from(view)
+        if (magic, version, order) != (_MAGIC, _VERSION, _BYTE_ORDER):
+            raise ValueError(f"{self.index_path} is not a skill index for this platform")
+        self.fingerprint = digest.hex()
+
+        position = _HEADER.size
+
+        def words(count: int) -> memoryview:
+            nonlocal position
+            section = view[position:position + 4 * count].cast("I")
+            position += 4 * count
+            return section
+
+        self._string_offsets = words(n_strings + 1)
+        self._first_edge = words(n_nodes + 1)
+        self._node_skill = words(n_nodes)
+        self._node_exact = words(n_nodes)
+        self._edge_tokens = words(n_edges)
+        self._edge_children = words(n_edges)
+        self._skill_names = words(n_skills)
+        self._skill_categories = words(n_skills)
+        self._category_names = words(n_categories)
+        self._blob_start = position
+        self._n_tokens = n_tokens
+        self._n_skills = n_skills
+        self._n_edges = n_edges
+        # Per-process memos of words seen so far; the index itself is never copied
+        self._tokens: Dict[str, int] = {}
+        self._starts: Dict[str, int] = {}
+        self._token_cache_size = token_cache_size
+        self._names: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return self._n_skills
+
+    def _string(self, index: int) -> str:
+        start = self._blob_start + self._string_offsets[index]
+        end = self._blob_start + self._string_offsets[index + 1]
+        return self._mmap[start:end].decode("utf-8")
+
+    def _token_id(self, word: str) -> int:
+        key = word.encode("utf-8")
+        lo, hi = 0, self._n_tokens
+        offsets, blob, base = self._string_offsets, self._mmap, self._blob_start
+        while lo < hi:
+            mid = (lo + hi) // 2
+            found = blob[base + offsets[mid]:base + offsets[mid + 1]]
+            if found < key:
+                lo = mid + 1
+            elif found > key:
+                hi = mid
+            else:
+                return mid
+        return -1
+
+    def _token(self, word: str) -> int:
+        token = self._tokens.get(word)
+        if token is None:
+            token = self._token_id(word.lower())
+            if len(self._tokens) >= self._token_cache_size:
+                self._tokens.clear()
+            self._tokens[word] = token
+        return token
+
+    def _child(self, node: int, word: str) -> int:
+        token = self._token(word)
+        if token < 0:
+            return 0
+        hi = self._first_edge[node + 1]
+        k = bisect_left(self._edge_tokens, token, self._first_edge[node], hi)
+        return self._edge_children[k] if k < hi and self._edge_tokens[k] == token else 0
+
+    def _start(self, word: str) -> int:
+        node = self._starts.get(word)
+        if node is None:
+            node = self._child(0, word)
+            if len(self._starts) >= self._token_cache_size:
+                self._starts.clear()
+            self._starts[word] = node
+        return node
+
+    def name(self, skill: int) -> str:
+        name = self._names.get(skill)
+        if name is None:
+            name = self._names[skill] = self._string(self._skill_names[skill])
+        return name
+
+    def _skill_index(self, name: str) -> int:
+        # Skills are stored sorted by name
+        key = name.encode("utf-8")
+        lo, hi = 0, self._n_skills
+        while lo < hi:
+            mid = (lo + hi) // 2
+            found = self.name(mid).encode("utf-8")
+            if found < key:
+                lo = mid + 1
+            elif found > key:
+                hi = mid
+            else:
+                return mid
+        return -1
+
+    def category(self, name: str) -> Optional[str]:
+        skill = self._skill_index(name)
+        return self._string(self._category_names[self._skill_categories[skill]]) if skill >= 0 else None
+
+    def categories(self) -> List[str]:
+        return [self._string(index) for index in self._category_names]
+
+    def skills(self, category: Optional[str] = None) -> List[str]:
+        names = [self.name(skill) for skill in range(self._n_skills)]
+        return names if category is None else [name for name in names if self.category(name) == category]
+
+    def scan_line(self, words: List[str], counts: Dict[str, int]) -> None:
+        node_skill, node_exact = self._node_skill, self._node_exact
+        i, n = 0, len(words)
+        while i < n:
+            node = self._start(words[i])
+            if not node:
+                i += 1
+                continue
+            best_end, best_skill = 0, 0
+            j = i + 1
+            while True:
+                skill = node_skill[node]
+                if skill and (not node_exact[node] or " ".join(words[i:j]) == self._string(node_exact[node] - 1)):
+                    best_end, best_skill = j, skill
+                if j >= n:
+                    break
+                node = self._child(node, words[j])
+                if not node:
+                    break
+                j += 1
+            if best_skill:
+                name = self.name(best_skill - 1)
+                counts[name] = counts.get(name, 0) + 1
+                i = best_end
+            else:
+                i += 1
+
+    def scan(self, text: str) -> Dict[str, int]:
+        """Occurrences of every skill in ``text`` by canonical name, in order of first appearance."""
+        counts: Dict[str, int] = {}
+        for line in text.split("\n"):
+            words = _TOKEN_RE.findall(line)
+            if words:
+                self.scan_line(words, counts)
+        return counts
+
+    def stats(self) -> dict:
+        return {"skills": self._n_skills, "categories": len(self._category_names),
+                "trie_edges": self._n_edges, "index_bytes": len(self._mmap), "index_path": self.index_path}
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 2 and sys.argv[1] == "build":
+        source = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_TAXONOMY_PATH
+        index = sys.argv[3] if len(sys.argv) > 3 else os.path.splitext(source)[0] + ".idx"
+        with open(source, encoding="utf-8") as f:
+            data = build_index(f.read())
+        _write_atomic(index, data)
+        taxonomy = SkillTaxonomy(source, index)
+        print(f"✅ {len(taxonomy)} skills in {len(taxonomy.categories())} categories, {len(data) / 1024:.0f} KiB -> {index}")
+    elif len(sys.argv) == 3 and sys.argv[1] == "scan":
+        taxonomy = SkillTaxonomy()
+        for name, count in taxonomy.scan(sys.argv[2]).items():
+            print(f"{name} ({taxonomy.category(name)}): {count}")
+    else:
+        print("usage: python skill_taxonomy.py build [SOURCE [INDEX]] | scan TEXT")
+        sys.exit(1)
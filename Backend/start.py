@@ -1,4 +1,3 @@
-import uvicorn
 import os
 import sys
 
@@ -6,27 +5,13 @@ import sys
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 try:
-    from App.main import app
+    from main import app
     print("✅ Successfully imported FastAPI app")
 except ImportError as e:
     print(f"❌ Failed to import app: {e}")
     sys.exit(1)
 
 if __name__ == "__main__":
-    # Railway sets PORT environment variable
-    port = int(os.environ.get("PORT", 8000))
-    print(f"🚀 Starting server on port {port}")
-    print(f"🔧 Environment: PORT={os.environ.get('PORT', '8000')}")
-    print(f"🔧 Environment: FRONTEND_URL={os.environ.get('FRONTEND_URL', 'NOT SET')}")
-    
-    try:
-        uvicorn.run(
-            app, 
-            host="0.0.0.0", 
-            port=port, 
-            log_level="info",
-            access_log=True
-        )
-    except Exception as e:
-        print(f"❌ Failed to start server: {e}")
-        sys.exit(1) 
\ No newline at end of file
+    # Production launcher: PORT, WEB_CONCURRENCY, graceful restarts (see serve.py)
+    import serve
+    serve.run(app)
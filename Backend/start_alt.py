@@ -10,7 +10,7 @@ import time
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 try:
-    from App.main import app
+    from main import app
     print("✅ Successfully imported main app")
 except ImportError as e:
     print(f"❌ Failed to import main app: {e}")
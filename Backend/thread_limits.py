@@ -0,0 +1,165 @@
+"""
+Adaptive per-endpoint limits on worker threads.
+
+Every sync handler and threadpool task used to share AnyIO's single
+40-token limiter, so a burst of heavy batch scoring could hold every token
+while cheap requests queued behind it. Here each endpoint borrows threads
+from its own ``AdaptiveLimiter``, whose limit follows AIMD on observed
+latency:
+
+- after each window of completed calls, the mean time a token was held
+  (queueing for one excluded; the thread's run and the event loop picking
+  up its result included) is compared with a baseline, the lowest window
+  mean seen, which drifts up slowly so a changed workload becomes the new
+  normal;
+- above ``tolerance`` times the baseline, the extra threads only contend
+  for the GIL, the cores and the event loop, so the limit shrinks
+  multiplicatively;
+- otherwise, if calls had to wait for a token during the window, it grows
+  by one.
+
+Limits start at ``THREAD_LIMIT_INITIAL`` and stay between
+``THREAD_LIMIT_MIN`` and ``THREAD_LIMIT_MAX``, or a per-endpoint cap from
+``THREAD_LIMITS`` (``"score-resume-batch=4,..."``).
+``LIMITERS`` lists them all for /debug/limits.
+"""
+import functools
+import math
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import anyio
+import anyio.to_thread
+
+from workers import available_cpus
+
+# Where each endpoint's limit starts before latency moves it
+THREAD_LIMIT_INITIAL = int(os.getenv("THREAD_LIMIT_INITIAL", "0")) or 2 * available_cpus()
+THREAD_LIMIT_MIN = int(os.getenv("THREAD_LIMIT_MIN", "1"))
+THREAD_LIMIT_MAX = int(os.getenv("THREAD_LIMIT_MAX", "40"))
+
+# Recent latency over baseline above which the limit is cut
+THREAD_LATENCY_TOLERANCE = float(os.getenv("THREAD_LATENCY_TOLERANCE", "2.0"))
+
+# Multiplicative decrease, and how fast the baseline follows higher latency
+BACKOFF = 0.9
+BASELINE_DRIFT = 0.01
+
+# Completed calls per adjustment, at least (a window is also never shorter than the limit)
+MIN_WINDOW = 8
+
+
+def _endpoint_caps() -> Dict[str, int]:
+    caps = {}
+    for item in filter(None, (part.strip() for part in os.getenv("THREAD_LIMITS", "").split(","))):
+        name, _, value = item.partition("=")
+        caps[name.strip()] = int(value)
+    return caps
+
+
+LIMITERS: Dict[str, "AdaptiveLimiter"] = {}
+
+_CAPS = _endpoint_caps()
+
+
+class AdaptiveLimiter:
+    def __init__(self, name: str, initial: int = THREAD_LIMIT_INITIAL, min_limit: int = THREAD_LIMIT_MIN,
+                 max_limit: Optional[int] = None, tolerance: float = THREAD_LATENCY_TOLERANCE):
+        self.name = name
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit or _CAPS.get(name, THREAD_LIMIT_MAX))
+        self.limit = min(self.max_limit, max(self.min_limit, initial))
+        self.tolerance = tolerance
+        self.baseline: Optional[float] = None
+        self.recent: Optional[float] = None
+        self.calls = 0
+        self.increases = 0
+        self.decreases = 0
+        self._window: List[float] = []
+        self._saturated = False
+        # Built on first use, on the event loop that uses it
+        self._limiter: Optional[anyio.CapacityLimiter] = None
+        self._threads: Optional[anyio.CapacityLimiter] = None
+        LIMITERS[name] = self
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """``func(*args)`` in a worker thread, holding one of this endpoint's tokens."""
+        if self._limiter is None:
+            self._limiter = anyio.CapacityLimiter(self.limit)
+            # The thread itself is not limited again; the token above is what counts
+            self._threads = anyio.CapacityLimiter(math.inf)
+        if self._limiter.available_tokens <= 0:
+            self._saturated = True
+        async with self._limiter:
+            start = time.perf_counter()
+            try:
+                return await anyio.to_thread.run_sync(func, *args, limiter=self._threads)
+            finally:
+                self._observe(time.perf_counter() - start)
+
+    def _observe(self, seconds: float) -> None:
+        self.calls += 1
+        self._window.append(seconds)
+        if len(self._window) < max(MIN_WINDOW, self.limit):
+            return
+        recent = sum(self._window) / len(self._window)
+        self._window.clear()
+        self.recent = recent
+        if self.baseline is None or recent < self.baseline:
+            self.baseline = recent
+        else:
+            self.baseline += BASELINE_DRIFT * (recent - self.baseline)
+        if recent > self.baseline * self.tolerance:
+            self._set_limit(min(self.limit - 1, int(self.limit * BACKOFF)))
+        elif self._saturated:
+            self._set_limit(self.limit + 1)
+        self._saturated = False
+
+    def _set_limit(self, limit: int) -> None:
+        limit = min(self.max_limit, max(self.min_limit, limit))
+        if limit == self.limit:
+            return
+        if limit > self.limit:
+            self.increases += 1
+        else:
+            self.decreases += 1
+        self.limit = limit
+        # Tokens already borrowed stay out until returned; waiters are woken on increase
+        self._limiter.total_tokens = limit
+
+    def stats(self) -> dict:
+        return {
+            "limit": self.limit,
+            "min": self.min_limit,
+            "max": self.max_limit,
+            "in_flight": self._limiter.borrowed_tokens if self._limiter is not None else 0,
+            "waiting": self._limiter.statistics().tasks_waiting if self._limiter is not None else 0,
+            "calls": self.calls,
+            "baseline_ms": round(self.baseline * 1e3, 3) if self.baseline is not None else None,
+            "recent_ms": round(self.recent * 1e3, 3) if self.recent is not None else None,
+            "increases": self.increases,
+            "decreases": self.decreases,
+        }
+
+
+def limiter(name: str, **options: Any) -> AdaptiveLimiter:
+    """The limiter for ``name``, created with ``options`` on first use."""
+    existing = LIMITERS.get(name)
+    return existing if existing is not None else AdaptiveLimiter(name, **options)
+
+
+def in_threads(name: str, **options: Any) -> Callable:
+    """Run a sync handler under its endpoint's limiter instead of AnyIO's shared one.
+
+    The wrapper is a coroutine function with the handler's signature, so
+    FastAPI resolves parameters and dependencies exactly as before.
+    """
+    def decorate(func: Callable) -> Callable:
+        threads = limiter(name, **options)
+
+        @functools.wraps(func)
+        async def handler(*args: Any, **kwargs: Any) -> Any:
+            return await threads.run(functools.partial(func, *args, **kwargs))
+        return handler
+    return decorate
@@ -0,0 +1,114 @@
+"""
+Execution backend for the CPU-bound text processing behind the endpoints.
+
+With ``CPU_WORKERS`` unset or ``0`` work runs in AnyIO's threadpool, exactly
+like a plain ``def`` handler. With ``CPU_WORKERS=N`` (or ``auto`` for one per
+available CPU, container quota included) it runs in a process pool so the
+string work is not serialized on the GIL. Functions sent to the pool must
+be module-level and take picklable arguments.
+"""
+import asyncio
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from fastapi.concurrency import run_in_threadpool
+
+if TYPE_CHECKING:
+    from thread_limits import AdaptiveLimiter
+
+
+def _cgroup_cpu_quota() -> Optional[float]:
+    """CPUs the container's cgroup allows (v2 ``cpu.max``, else v1 CFS quota), None when unlimited."""
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()[:2]
+        return None if quota == "max" else int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    try:
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as f:
+            quota = int(f.read())
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as f:
+            period = int(f.read())
+        return quota / period if quota > 0 else None
+    except (OSError, ValueError):
+        return None
+
+
+def available_cpus() -> int:
+    """CPUs this process may actually use: its affinity mask, capped by the cgroup CPU quota."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # not on Linux
+        cpus = os.cpu_count() or 1
+    quota = _cgroup_cpu_quota()
+    if quota is not None:
+        cpus = min(cpus, math.ceil(quota))
+    return max(1, cpus)
+
+
+def configured_workers() -> int:
+    value = os.getenv("CPU_WORKERS", "0").strip().lower()
+    if value == "auto":
+        return available_cpus()
+    return max(0, int(value or 0))
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def start_pool(workers: Optional[int] = None, warm_up: Optional[Callable[[], Any]] = None) -> int:
+    """Create the process pool and run ``warm_up`` once per worker. Returns the worker count."""
+    global _pool
+    workers = configured_workers() if workers is None else workers
+    if workers <= 0 or _pool is not None:
+        return workers
+    _pool = ProcessPoolExecutor(max_workers=workers)
+    if warm_up is not None:
+        # Forces every worker process to start and import the app before traffic arrives
+        for future in [_pool.submit(warm_up) for _ in range(workers)]:
+            future.result()
+    return workers
+
+
+def shutdown_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
+
+
+def pool_workers() -> int:
+    return _pool._max_workers if _pool is not None else 0
+
+
+def _with_pid(func: Callable[[], Any]) -> tuple:
+    return os.getpid(), func()
+
+
+def collect_from_workers(func: Callable[[], Any]) -> list:
+    """Best-effort ``func()`` result from each pool worker (the pool has no broadcast)."""
+    if _pool is None:
+        return []
+    futures = [_pool.submit(_with_pid, func) for _ in range(pool_workers() * 4)]
+    results = {}
+    for future in futures:
+        pid, value = future.result()
+        results.setdefault(pid, value)
+    return list(results.values())
+
+
+async def run_cpu(func: Callable[..., Any], *args: Any, threads: Optional["AdaptiveLimiter"] = None) -> Any:
+    """Run ``func(*args)`` off the event loop, in the process pool when one is running.
+
+    Without a pool it runs in a thread, under ``threads`` (the endpoint's
+    adaptive limiter) when given, else AnyIO's shared limiter.
+    """
+    if _pool is None:
+        if threads is not None:
+            return await threads.run(func, *args)
+        return await run_in_threadpool(func, *args)
+    return await asyncio.get_running_loop().run_in_executor(_pool, partial(func, *args))
@@ -0,0 +1,58 @@
+"""
+Write a ZIP archive as a sequence of byte chunks.
+
+``zipfile`` writes to any object with ``write``; when that object cannot
+seek, it falls back to data descriptors, so every entry can be emitted as
+soon as it is complete and nothing before it has to be kept. ``ZipStream``
+collects what ``zipfile`` writes for each entry and hands it back as one
+chunk for the response body.
+"""
+import time
+import zipfile
+from typing import Iterable, List, Union
+
+
+class _Sink:
+    """Unseekable file object that buffers writes until they are drained."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ZipStream:
+    def __init__(self, compresslevel: int = 6):
+        self._sink = _Sink()
+        self._zip = zipfile.ZipFile(self._sink, mode="w", compression=zipfile.ZIP_DEFLATED,
+                                    compresslevel=compresslevel)
+
+    def add(self, name: str, data: Union[bytes, Iterable[bytes]], compress: bool = True) -> bytes:
+        """Write one entry (bytes or an iterable of chunks) and return the archive bytes it produced."""
+        info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+        info.compress_type = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+        info.external_attr = 0o644 << 16
+        with self._zip.open(info, mode="w") as entry:
+            for chunk in ([data] if isinstance(data, bytes) else data):
+                entry.write(chunk)
+        return self._sink.drain()
+
+    def close(self) -> bytes:
+        """Write the central directory and return the final bytes of the archive."""
+        self._zip.close()
+        return self._sink.drain()
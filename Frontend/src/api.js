@@ -67,3 +67,17 @@ export async function scoreResume(payload) {
   if (!r.ok) throw new Error("score failed");
   return await r.json();
 }
+
+export async function scoreResumeSession(payload) {
+  const r = await fetch(`${API_BASE}/api/score-resume/session`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify(payload),
+  });
+  if (!r.ok) {
+    const err = new Error("score failed");
+    err.status = r.status; // 404/409 mean the session must be restarted, 422 a refused edit
+    throw err;
+  }
+  return await r.json();
+}
@@ -136,6 +136,8 @@ export default function ResumeBuilder() {
           end: e.end,
         })),
         skills: form.skills,
+        // Rendered server-side with the same layout as the preview
+        template: selectedTemplate,
       };
 
       const resumeText = await generateResume(payload);
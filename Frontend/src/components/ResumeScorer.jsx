@@ -1,5 +1,27 @@
-import { useState } from "react";
-import { scoreResume } from "../api";
+import { useRef, useState } from "react";
+import { scoreResumeSession } from "../api";
+
+// Backend caps on one line edit (MAX_LIST_ITEMS lines of MAX_FIELD_CHARS each);
+// bigger changes, such as pasting a whole resume, are sent as a full reset
+const MAX_EDIT_LINES = 100;
+const MAX_LINE_CHARS = 1000;
+
+function fitsEditCaps(edit) {
+  return edit.lines.length <= MAX_EDIT_LINES && edit.lines.every((line) => line.length <= MAX_LINE_CHARS);
+}
+
+// Smallest single line-range replacement turning `before` into `after`
+function lineEdit(before, after) {
+  let start = 0;
+  while (start < before.length && start < after.length && before[start] === after[start]) start++;
+  let end = 0;
+  while (
+    end < before.length - start &&
+    end < after.length - start &&
+    before[before.length - 1 - end] === after[after.length - 1 - end]
+  ) end++;
+  return { op: "replace", start, end: before.length - end, lines: after.slice(start, after.length - end) };
+}
 
 export default function ResumeScorer() {
   const [resumeText, setResumeText] = useState("");
@@ -7,6 +29,8 @@ export default function ResumeScorer() {
   const [jobDescription, setJobDescription] = useState("");
   const [loading, setLoading] = useState(false);
   const [score, setScore] = useState(null);
+  // Incremental scoring session: only changed lines are sent after the first check
+  const session = useRef(null);
 
   async function onScore() {
     if (!resumeText.trim()) {
@@ -18,11 +42,28 @@ export default function ResumeScorer() {
       setLoading(true);
       setScore(null);
       
-      const result = await scoreResume({
-        resume_text: resumeText,
+      const lines = resumeText.split("\n");
+      const job = {
         job_title: jobTitle || undefined,
         job_description: jobDescription || undefined
-      });
+      };
+      let result;
+      try {
+        if (!session.current) throw Object.assign(new Error("no session"), { status: 404 });
+        const edit = lineEdit(session.current.lines, lines);
+        if (!fitsEditCaps(edit)) throw Object.assign(new Error("edit too large"), { status: 422 });
+        result = await scoreResumeSession({
+          ...job,
+          session_id: session.current.id,
+          version: session.current.version,
+          edits: [edit]
+        });
+      } catch (err) {
+        // Unknown or outdated session, or an edit the server refuses: send the whole text
+        if (err.status !== 404 && err.status !== 409 && err.status !== 422) throw err;
+        result = await scoreResumeSession({ ...job, resume_text: resumeText });
+      }
+      session.current = { id: result.session_id, version: result.version, lines };
       
       setScore(result);
     } catch (err) {